@@ -5,7 +5,7 @@ from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _get_version
 from tkinter import *  # noqa: F403, F401
 
-from .app import App
+from .app import App, BackgroundTask, MainQueuePriority
 from .base import Base
 from .bindable import Bindable
 from .button import Button
@@ -32,18 +32,35 @@ from .entries import (
 )
 from .figures import Figure, Histogram, XYPlot
 from .fileviewer import FileTreeData, FileViewer
+from .frameclock import FrameCallback, FrameClock
 from .images import DynamicImage, Image, ImageWithGrid, SVGImage
 from .indicators import BooleanIndicator, Level, NumericIndicator
 from .labels import Label, URLLabel
+from .mainthreadprofiler import MainThreadProfiler
 from .modulesmanager import ModulesManager
 from .popupmenu import PopupMenu
 from .progressbar import ProgressBar, ProgressBarNotification, ProgressWindow
 from .radiobutton import RadioButton
-from .remote import RemoteAppMismatch, browse, connect, discover, remote_app
+from .remote import (
+    RemoteAppMismatch,
+    browse,
+    browse_async,
+    call_many,
+    connect,
+    connect_async,
+    discover,
+    discover_async,
+    iter_servers,
+    remote_app,
+    subscribe,
+)
 from .remotecontrollable import RemoteControllable, remote_command
 from .tableview import TableView
 from .tabulardata import PostponeChangeCalls, TabularData
 from .view3d import View3D, View3DModernGL, View3DPyrender
+from .videocapture import FrameRingBuffer, VideoCaptureThread
+from .videoprocessing import FramePipeline
+from .videorecorder import VideoRecorder
 from .videoview import VideoView
 from .views import Box, View
 from .window import Window
@@ -51,6 +68,7 @@ from .window import Window
 __all__ = [  # noqa: F405
     # mytk classes
     "App",
+    "BackgroundTask",
     "Base",
     "Bindable",
     "BooleanIndicator",
@@ -71,6 +89,10 @@ __all__ = [  # noqa: F405
     "Figure",
     "FileTreeData",
     "FileViewer",
+    "FrameCallback",
+    "FrameClock",
+    "FramePipeline",
+    "FrameRingBuffer",
     "FormattedEntry",
     "Histogram",
     "Image",
@@ -80,6 +102,8 @@ __all__ = [  # noqa: F405
     "Label",
     "LabelledEntry",
     "Level",
+    "MainQueuePriority",
+    "MainThreadProfiler",
     "ModulesManager",
     "NumericEntry",
     "NumericIndicator",
@@ -97,6 +121,8 @@ __all__ = [  # noqa: F405
     "TabularData",
     "TableView",
     "URLLabel",
+    "VideoCaptureThread",
+    "VideoRecorder",
     "VideoView",
     "View",
     "View3D",
@@ -105,10 +131,16 @@ __all__ = [  # noqa: F405
     "Window",
     "XYPlot",
     "browse",
+    "browse_async",
+    "call_many",
     "connect",
+    "connect_async",
     "discover",
+    "discover_async",
+    "iter_servers",
     "remote_app",
     "remote_command",
+    "subscribe",
     "tkFont",
     "ttk",
     # Re-exported tkinter variables and classes
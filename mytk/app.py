@@ -7,6 +7,8 @@ It handles window creation, menu setup, platform-specific quirks, and help/docum
 
 Classes:
     - App: The main application object, integrating window, menu, and lifecycle management.
+    - MainQueuePriority: Priorities of the calls scheduled on the main thread.
+    - BackgroundTask: Handle on work started with `App.run_in_background`.
 
 Typical usage:
     from mytk.app import App
@@ -22,23 +24,81 @@ Typical usage:
     app.mainloop()
 """
 
+import asyncio
 import io
+import itertools
 import os
 import platform
 import subprocess
+import threading
+import time
+import tkinter
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import redirect_stdout, suppress
-from queue import Empty
-from queue import Queue as TQueue
+from enum import IntEnum
+from queue import Empty, PriorityQueue
 from tkinter import Menu, TclError
 
 from .bindable import Bindable
 from .dialog import Dialog
 from .eventcapable import EventCapable
+from .frameclock import FrameClock
+from .mainthreadprofiler import MainThreadOverlay, MainThreadProfiler
 from .modulesmanager import ModulesManager
+from .progressbar import ProgressBar, ProgressWindow
 from .utils import is_main_thread
 from .window import Window
 
 
+class MainQueuePriority(IntEnum):
+    """Priority of a call scheduled with `App.schedule_on_main_thread`.
+
+    Pending calls run in priority order (lower value first), and in the order
+    they were scheduled within a priority.
+    """
+
+    ui = 0
+    normal = 1
+    background = 2
+
+
+class BackgroundTask:
+    """Handle on work started with `App.run_in_background`.
+
+    Attributes:
+        future (concurrent.futures.Future): The future of the work's result.
+    """
+
+    def __init__(self, future=None):
+        self.future = future
+        self._cancelled = threading.Event()
+
+    @property
+    def is_cancelled(self):
+        """Whether `cancel` was called."""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Cancel the work.
+
+        Work that has not started yet will not run. Work already running is
+        not interrupted, but its callbacks are not called anymore and its
+        next progress report raises `CancelledError` in the worker, so a
+        function that reports progress stops there.
+        """
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self):
+        """Whether the work has completed (or was cancelled before it started)."""
+        return self.future is not None and self.future.done()
+
+    def result(self, timeout=None):
+        """Wait for and return the result of the work (see `Future.result`)."""
+        return self.future.result(timeout=timeout)
+
+
 class App(Bindable, EventCapable):
     """Main application class for a myTk-based GUI.
 
@@ -51,6 +111,13 @@ class App(Bindable, EventCapable):
         name (str): Application name.
         help_url (str): Optional URL to the help/documentation site.
         window (Window): The main application window.
+        main_queue (PriorityQueue): Calls scheduled with `schedule_on_main_thread`.
+        run_loop_delay (int): Polling period (ms) of the main queue, used only
+            on platforms where the queue cannot wake Tk up (see
+            `is_main_queue_event_driven`).
+        main_queue_time_budget (int): Maximum time (ms) spent running queued
+            calls before yielding back to Tk so it can process user input.
+            The remaining calls run at the next turn of the event loop.
     """
 
     app = None
@@ -77,8 +144,24 @@ class App(Bindable, EventCapable):
         self.name = name
         self.help_url = help_url
         self.window = Window(geometry=geometry, title=name, withdraw=no_window, auto_position=auto_position)
-        self.main_queue: TQueue = TQueue()
+        self.main_queue: PriorityQueue = PriorityQueue()
         self.run_loop_delay: int = 20
+        self.main_queue_time_budget: int = 20
+        self._main_queue_sequence = itertools.count()
+        self._coalesced_calls = {}
+        self._coalesced_calls_lock = threading.Lock()
+        self._async_loop = None
+        self._async_thread = None
+        self._thread_executor = None
+        self._process_executor = None
+        self._profiler = None
+        self._profiler_overlay = None
+        self._frame_clock = None
+        self._main_queue_poll = None
+        self._wakeup_reader = None
+        self._wakeup_writer = None
+        self._wakeup_lock = threading.Lock()  # Writes never use a closed fd
+        self._wakeup_pending = False
 
         self.check_requirements()
         self.create_menu()
@@ -100,8 +183,11 @@ class App(Bindable, EventCapable):
 
         self.root.bind('<Destroy>', _cancel_all_afters)
 
-        if self.is_running:
-            self.after(self.run_loop_delay, self.run_main_queue)
+        self._install_main_queue_wakeup()
+        if self.is_running and not self.is_main_queue_event_driven:
+            self._main_queue_poll = self.add_frame_callback(
+                self.run_main_queue, rate=1000 / self.run_loop_delay
+            )
 
     @property
     def widget(self):
@@ -149,34 +235,560 @@ class App(Bindable, EventCapable):
         self.run_main_queue()
         self.window.widget.mainloop()
 
-    def schedule_on_main_thread(self, fct, args=None, kwargs=None):
+    @property
+    def is_main_queue_event_driven(self):
+        """Whether scheduling on the main queue wakes Tk up immediately.
+
+        When True, the main queue is processed as soon as something is put in
+        it and costs nothing when idle. When False (platforms without Tk file
+        handlers, such as Windows), it is polled every `run_loop_delay` ms.
+        """
+        return self._wakeup_writer is not None
+
+    def _install_main_queue_wakeup(self):
+        """Set up the self-pipe that wakes the Tk event loop up when work is queued.
+
+        schedule_on_main_thread() writes a byte to the pipe, and Tk, which
+        watches the other end with a file handler, calls run_main_queue() on
+        the main thread. Writing to a pipe is safe from any thread and never
+        blocks. Leaves the App in polling mode if file handlers are not
+        available.
+        """
+        if not self.is_running:
+            return
+
+        try:
+            reader, writer = os.pipe()
+        except OSError:
+            return
+
+        try:
+            os.set_blocking(reader, False)
+            os.set_blocking(writer, False)
+            self.root.tk.createfilehandler(
+                reader, tkinter.READABLE, self._main_queue_wakeup_received
+            )
+        except (AttributeError, OSError, RuntimeError, TclError):
+            os.close(reader)
+            os.close(writer)
+            return
+
+        self._wakeup_reader, self._wakeup_writer = reader, writer
+        self.root.bind("<Destroy>", self._remove_main_queue_wakeup, add="+")
+
+    def _remove_main_queue_wakeup(self, event=None):
+        """Root <Destroy> handler: stop watching and close the wakeup pipe."""
+        if event is not None and event.widget is not self.root:
+            return
+
+        # Under the lock: once it is released, no thread writes to the fd,
+        # which could be reused by another file as soon as it is closed.
+        with self._wakeup_lock:
+            reader, writer = self._wakeup_reader, self._wakeup_writer
+            if reader is None:
+                return
+            self._wakeup_reader = self._wakeup_writer = None
+
+        with suppress(Exception):
+            self.root.tk.deletefilehandler(reader)
+        for fd in (reader, writer):
+            with suppress(OSError):
+                os.close(fd)
+
+    def _wake_main_queue(self):
+        """Ask the Tk event loop to process the main queue (any thread)."""
+        if self._wakeup_pending:
+            return
+        with self._wakeup_lock:
+            writer = self._wakeup_writer
+            if writer is None:
+                return
+            self._wakeup_pending = True
+            with suppress(OSError):  # Full pipe: a wakeup is pending anyway
+                os.write(writer, b"\0")
+
+    def _main_queue_wakeup_received(self, fd, mask):
+        """Tk file handler: the wakeup pipe is readable, run the main queue."""
+        with suppress(OSError):
+            while os.read(fd, 4096):
+                pass
+        # Cleared before draining, so that work queued while draining wakes
+        # us up again instead of being missed.
+        self._wakeup_pending = False
+        self.run_main_queue()
+
+    def schedule_on_main_thread(
+        self, fct, args=None, kwargs=None, priority=MainQueuePriority.normal,
+        coalesce_key=None,
+    ):
         """Schedules a function call to be executed on the main thread.
 
+        Safe to call from any thread. The call runs as soon as the Tk event
+        loop gets control (see `is_main_queue_event_driven`), after the
+        pending calls of higher or equal priority.
+
+        With a `coalesce_key`, a call replaces the pending call scheduled with
+        the same key, if any: only the latest one runs, at the position of
+        the first. Use it for updates where only the last one matters (e.g.
+        redrawing a plot with new data). If the replacement has a higher
+        priority, the call is moved to the queue of that priority instead.
+
         Args:
             fct (callable): The function to call.
             args (list, optional): Positional arguments for the function.
             kwargs (dict, optional): Keyword arguments for the function.
+            priority (MainQueuePriority): Priority of the call. Defaults to
+                `MainQueuePriority.normal`.
+            coalesce_key (hashable, optional): Key identifying calls that
+                replace each other while pending.
         """
-        self.main_queue.put((fct, args, kwargs))
+        priority = int(priority)
+        if coalesce_key is None:
+            sequence = next(self._main_queue_sequence)
+        else:
+            with self._coalesced_calls_lock:
+                pending = self._coalesced_calls.get(coalesce_key)
+                if pending is not None and pending[3] <= priority:
+                    # Replaced in place; the queued entry stays where it is
+                    self._coalesced_calls[coalesce_key] = (fct, args, kwargs, *pending[3:])
+                    return
+                # New, or more urgent: queued (again). An entry queued before
+                # is stale, and skipped when run (its sequence differs).
+                sequence = next(self._main_queue_sequence)
+                self._coalesced_calls[coalesce_key] = (fct, args, kwargs, priority, sequence)
+            fct, args, kwargs = None, None, None  # Looked up when run
+
+        self.main_queue.put(
+            (
+                priority, sequence, fct, args, kwargs, coalesce_key,
+                time.perf_counter(),
+            )
+        )
+        self._wake_main_queue()
 
     def run_main_queue(self):
-        """Processes all pending tasks in the main thread queue."""
+        """Processes the pending tasks in the main thread queue.
+
+        Calls run in priority order until the queue is empty or
+        `main_queue_time_budget` ms have elapsed, in which case the rest is
+        left for the next turn of the event loop so Tk stays responsive. In
+        polling mode, it is called every `run_loop_delay` ms by the
+        `frame_clock`.
+        """
         assert is_main_thread()
 
+        profiler = EventCapable.main_thread_profiler
+        deadline = time.perf_counter() + self.main_queue_time_budget / 1000
         while not self.main_queue.empty():
             try:
-                f, args, kwargs = self.main_queue.get_nowait()
-                f(*(args or []), **(kwargs or {}))
+                _, sequence, f, args, kwargs, coalesce_key, enqueued = (
+                    self.main_queue.get_nowait()
+                )
             except Empty:
-                pass
+                break
+
+            if coalesce_key is not None:
+                with self._coalesced_calls_lock:
+                    pending = self._coalesced_calls.get(coalesce_key)
+                    if pending is None or pending[4] != sequence:
+                        continue  # Moved to a higher priority, and run there
+                    del self._coalesced_calls[coalesce_key]
+                f, args, kwargs = pending[:3]
+
+            try:
+                if profiler is None:
+                    f(*(args or []), **(kwargs or {}))
+                else:
+                    wait = time.perf_counter() - enqueued
+                    with profiler.measure("main_queue", f, wait=wait):
+                        f(*(args or []), **(kwargs or {}))
             except Exception as e:
                 print(
-                    "Unable to call scheduled function {fct} with arguments {args}:",
+                    f"Unable to call scheduled function {f} with arguments {args}:",
                     e,
                 )
 
-        if self.is_running:
-            self.after(self.run_loop_delay, self.run_main_queue)
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self.is_running:
+            return
+
+        if self.is_main_queue_event_driven and not self.main_queue.empty():
+            # Out of time: come back after Tk has serviced pending events.
+            self._wake_main_queue()
+
+    @property
+    def frame_clock(self):
+        """The `FrameClock` driving the periodic updates, created on first use.
+
+        See `EventCapable.add_frame_callback`.
+        """
+        if self._frame_clock is None:
+            self._frame_clock = FrameClock(self.root)
+        return self._frame_clock
+
+    @property
+    def async_loop(self):
+        """The asyncio event loop of the application, started on first use.
+
+        The loop runs in a background thread ("mytk-asyncio") and is stopped
+        when the application quits. Coroutines running on it must not touch
+        widgets directly: use `run_on_main_thread` for that.
+
+        Returns:
+            asyncio.AbstractEventLoop: The running loop.
+        """
+        return self._start_async_loop()
+
+    def _start_async_loop(self):
+        """Start the asyncio loop thread if needed, and return the loop."""
+        if self._async_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="mytk-asyncio", daemon=True
+            )
+            thread.start()
+            self._async_loop, self._async_thread = loop, thread
+            if self.is_running:
+                self.root.bind("<Destroy>", self._stop_async_loop, add="+")
+        return self._async_loop
+
+    def run_async(self, coro, on_done=None, on_error=None):
+        """Runs a coroutine on the application's asyncio loop.
+
+        Returns immediately. The Tk event loop keeps running normally, so
+        `after`, `schedule_on_main_thread` and the remote server are not
+        affected. The callbacks are called on the main thread, so they may
+        update widgets.
+
+        Args:
+            coro (coroutine): The coroutine to run.
+            on_done (callable, optional): Called with the result of the
+                coroutine when it completes.
+            on_error (callable, optional): Called with the exception if the
+                coroutine raises.
+
+        Returns:
+            concurrent.futures.Future: The future of the coroutine's result.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.async_loop)
+        if on_done is not None or on_error is not None:
+            future.add_done_callback(
+                lambda f: self.schedule_on_main_thread(
+                    self._deliver_future_result, [f, on_done, on_error]
+                )
+            )
+        return future
+
+    @staticmethod
+    def _deliver_future_result(future, on_done, on_error):
+        """Call on_done or on_error with the outcome of a completed future."""
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is None:
+            if on_done is not None:
+                on_done(future.result())
+        elif on_error is not None:
+            on_error(exception)
+        else:
+            raise exception
+
+    async def run_on_main_thread(self, fct, *args, **kwargs):
+        """Awaitable call of a function on the Tk main thread.
+
+        Lets a coroutine update widgets without blocking its event loop::
+
+            async def acquire(self):
+                value = await self.device.read()
+                await self.run_on_main_thread(self.label.value_variable.set, value)
+
+        Args:
+            fct (callable): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            The return value of the function. Its exceptions are raised.
+        """
+        future = Future()
+
+        def task():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fct(*args, **kwargs))
+            except Exception as exc:
+                future.set_exception(exc)
+
+        self.schedule_on_main_thread(task)
+        return await asyncio.wrap_future(future)
+
+    def mainloop_async(self, coro=None):
+        """Enters the Tk main event loop with the asyncio loop running alongside.
+
+        The asyncio loop is started (see `async_loop`), `coro` is scheduled on
+        it if given, and the Tk main loop runs until the application quits.
+        Neither loop polls the other: Tk is woken up through the main queue,
+        and asyncio by its own selector. On exit, the pending tasks are
+        cancelled and the asyncio loop is stopped.
+
+        Args:
+            coro (coroutine, optional): A coroutine to run once the loops run.
+        """
+        self._start_async_loop()
+        if coro is not None:
+            self.run_async(coro)
+        try:
+            self.mainloop()
+        finally:
+            self._stop_async_loop()
+
+    def _stop_async_loop(self, event=None):
+        """Cancel the pending tasks and stop the asyncio loop, if it was started."""
+        if event is not None and event.widget is not self.root:
+            return
+
+        loop, thread = self._async_loop, self._async_thread
+        if loop is None:
+            return
+        self._async_loop = self._async_thread = None
+
+        async def shutdown():
+            tasks = [
+                task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            loop.stop()
+
+        with suppress(RuntimeError):  # Loop already closed
+            asyncio.run_coroutine_threadsafe(shutdown(), loop)
+        thread.join(timeout=1)
+        if not thread.is_alive():
+            loop.close()
+
+    @property
+    def profiler(self):
+        """The `MainThreadProfiler` enabled with `enable_profiling`, or None."""
+        return self._profiler
+
+    def enable_profiling(self, stall_threshold=100, overlay=False):
+        """Starts measuring the latency of the work done on the main thread.
+
+        Measures the queue wait and run time of the calls scheduled with
+        `schedule_on_main_thread` and of the callbacks scheduled with `after`
+        from now on, and the run time of the event handlers bound with
+        `bind_event`, including those bound before. Reports the callbacks
+        that block the main thread for longer than `stall_threshold` ms, with
+        the stack where they were stalled. See `main_thread_stats`.
+
+        Only these callbacks are measured: handlers bound directly with the
+        Tk widget's ``bind``, widget ``command`` callbacks and Tk's own work
+        (layout, redraws) are not, although a stall they cause still delays
+        the callbacks that are.
+
+        Args:
+            stall_threshold (float): Run time (ms) above which a callback is a
+                stall.
+            overlay (bool): Also show the stats over the top-right corner of
+                the window.
+
+        Returns:
+            MainThreadProfiler: The profiler.
+        """
+        if self._profiler is None:
+            self._profiler = MainThreadProfiler(stall_threshold=stall_threshold)
+            if self.is_running:
+                self.root.bind("<Destroy>", self._stop_profiling, add="+")
+        profiler = self._profiler
+        profiler.stall_threshold = stall_threshold
+        profiler.start()
+        EventCapable.main_thread_profiler = profiler
+
+        if overlay and self.is_running and self._profiler_overlay is None:
+            self._profiler_overlay = MainThreadOverlay(profiler)
+            self._profiler_overlay.place_over(self.window)
+        return profiler
+
+    def disable_profiling(self):
+        """Stops measuring, and removes the overlay.
+
+        Callbacks registered while profiling was enabled are not measured
+        anymore.
+        """
+        if self._profiler_overlay is not None:
+            overlay, self._profiler_overlay = self._profiler_overlay, None
+            overlay.after_cancel_all()
+            with suppress(TclError):
+                overlay.widget.destroy()
+
+        if self._profiler is not None:
+            self._profiler.stop()
+            if EventCapable.main_thread_profiler is self._profiler:
+                EventCapable.main_thread_profiler = None
+
+    def _stop_profiling(self, event):
+        """Root <Destroy> handler: stop profiling, keeping the measurements."""
+        if event.widget is self.root:
+            self._profiler_overlay = None
+            self.disable_profiling()
+
+    def main_thread_stats(self):
+        """Returns the main thread measurements (see `enable_profiling`).
+
+        Safe to call from any thread, which is also how it is exposed to
+        remote clients: it answers even while the main thread is stalled.
+
+        Returns:
+            dict: See `MainThreadProfiler.stats`. Only {"enabled": False} if
+            profiling was never enabled.
+        """
+        if self._profiler is None:
+            return {"enabled": False}
+        return self._profiler.stats()
+
+    def run_in_background(
+        self, fct, *args, on_done=None, on_error=None, on_progress=None,
+        owner=None, use_process=False, **kwargs
+    ):
+        """Runs a function in a worker, keeping the interface responsive.
+
+        Use it for slow work triggered from the interface (reading files,
+        pandas loads, directory scans) instead of running it in the callback::
+
+            def open_file(self, event, button):
+                self.run_in_background(
+                    pandas.read_csv, filepath, on_done=self.show_table, owner=button
+                )
+
+        Threads come from a shared pool. With use_process=True, the function
+        runs in a shared process pool instead, for CPU-bound pure-Python work
+        (the function and its arguments must then be picklable).
+
+        The callbacks are called on the main thread, so they may update
+        widgets. To report progress, the function must accept a `progress`
+        keyword argument: it is given a callable to call with any value (e.g.
+        a percentage), which is passed to on_progress. Progress reports are
+        coalesced, so reporting often is cheap. on_progress may also be a
+        `ProgressBar` or a `ProgressWindow`, whose bar is then set to the
+        reported value.
+
+        Args:
+            fct (callable): The function to run.
+            *args: Positional arguments for the function.
+            on_done (callable, optional): Called with the return value.
+            on_error (callable, optional): Called with the exception raised by
+                the function. Without it, the error is printed.
+            on_progress (callable | ProgressBar | ProgressWindow, optional):
+                Called with each reported progress value.
+            owner (Base, optional): Widget on behalf of which the work runs:
+                it is cancelled if the widget is destroyed.
+            use_process (bool): Run in a process instead of a thread. Progress
+                reports are not available in that case.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            BackgroundTask: A handle to cancel the work or wait for its result.
+
+        Raises:
+            ValueError: If on_progress is used with use_process=True.
+        """
+        task = BackgroundTask()
+
+        if on_progress is not None:
+            if use_process:
+                raise ValueError("Progress reports are not available with use_process=True")
+            if isinstance(on_progress, ProgressWindow):
+                on_progress = on_progress.progress_bar
+            if isinstance(on_progress, ProgressBar):
+                progress_bar = on_progress
+
+                def on_progress(value):
+                    progress_bar.value = value
+
+            kwargs["progress"] = self._progress_reporter(task, on_progress)
+
+        if self.is_running and self._thread_executor is None and self._process_executor is None:
+            self.root.bind("<Destroy>", self._shutdown_executors, add="+")
+        if use_process:
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor()
+            executor = self._process_executor
+        else:
+            if self._thread_executor is None:
+                self._thread_executor = ThreadPoolExecutor(
+                    thread_name_prefix="mytk-background"
+                )
+            executor = self._thread_executor
+
+        task.future = executor.submit(fct, *args, **kwargs)
+        if owner is not None:
+            self._cancel_with_owner(task, owner)
+
+        def deliver(future):
+            if task.is_cancelled:
+                return
+            self._deliver_future_result(
+                future, on_done, on_error or self._print_background_error
+            )
+
+        task.future.add_done_callback(
+            lambda future: self.schedule_on_main_thread(deliver, [future])
+        )
+        return task
+
+    def _progress_reporter(self, task, on_progress):
+        """Return the `progress` callable given to a background function."""
+
+        def progress(value):
+            if task.is_cancelled:
+                raise CancelledError()
+            self.schedule_on_main_thread(
+                on_progress, [value], coalesce_key=("progress", id(task))
+            )
+
+        return progress
+
+    @staticmethod
+    def _print_background_error(exception):
+        """Default on_error of run_in_background."""
+        print(f"Background task failed: {exception!r}")
+
+    @staticmethod
+    def _cancel_with_owner(task, owner):
+        """Cancel the task when the owner's widget is destroyed.
+
+        The owner keeps a list of its unfinished tasks; a single <Destroy>
+        handler is bound per owner.
+        """
+        owner_tasks = owner.__dict__.get("_background_tasks")
+        if owner_tasks is None:
+            owner_tasks = owner.__dict__["_background_tasks"] = []
+
+            def cancel_owner_tasks(event):
+                if event.widget is owner.widget:
+                    for owner_task in list(owner_tasks):
+                        owner_task.cancel()
+                    owner_tasks.clear()
+
+            if owner.widget is not None:
+                owner.widget.bind("<Destroy>", cancel_owner_tasks, add="+")
+
+        owner_tasks[:] = [t for t in owner_tasks if not t.done()]
+        owner_tasks.append(task)
+
+    def _shutdown_executors(self, event=None):
+        """Root <Destroy> handler: cancel pending background work."""
+        if event is not None and event.widget is not self.root:
+            return
+
+        for executor in (self._thread_executor, self._process_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._thread_executor = self._process_executor = None
 
     def create_menu(self):
         """Creates the application menu bar with File, Edit, and Help items."""
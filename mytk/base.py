@@ -76,8 +76,13 @@ class _BaseWidget:
         )
 
     def _bind_destroy_cancel(self):
-        """No-op fallback. Overridden by EventCapable when present in the MRO."""
-        pass
+        """Defers to EventCapable when present in the MRO, otherwise does nothing.
+
+        EventCapable comes after this class in `Base`.
+        """
+        bind_destroy_cancel = getattr(super(), "_bind_destroy_cancel", None)
+        if bind_destroy_cancel is not None:
+            bind_destroy_cancel()
 
     """
     Placing widgets in other widgets
@@ -528,6 +533,23 @@ class Base(_BaseWidget, Bindable, EventCapable, DragAndDropCapable):
     """Composite base class combining widget management, binding, event, and
     drag-and-drop capabilities."""
 
+    def _bind_destroy_cancel(self):
+        """Bind the <Destroy> cleanup of the widget.
+
+        Cancels its scheduled tasks (EventCapable) and removes it from the
+        observer graph (Bindable) when its Tk widget is destroyed, so that
+        models bound to it stop notifying it.
+        """
+        if self.widget is None or self._destroy_bound_widget is self.widget:
+            return  # Already bound (placement methods call it again)
+
+        super()._bind_destroy_cancel()
+        self.widget.bind(
+            "<Destroy>",
+            lambda e: self.disconnect_observers() if e.widget is self.widget else None,
+            add="+",
+        )
+
     def _propagate_disabled(self, widget, disabled):
         for child in widget.winfo_children():
             try:
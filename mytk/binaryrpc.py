@@ -0,0 +1,216 @@
+"""binaryrpc.py — Binary framing of remote calls, for NumPy arrays and bytes.
+
+XML-RPC carries every value as XML text: a camera frame or a long spectrum
+becomes megabytes of base64 or `<double>` elements, and NumPy arrays are not
+supported at all. This module encodes a call, or its result, as a small JSON
+header followed by the raw bytes of its arrays::
+
+    b"MYTK" | version (1 byte) | header length (4 bytes, big-endian)
+    | header (JSON, UTF-8, padded with spaces) | buffer 0 | padding | buffer 1 | ...
+
+In the header, an array is replaced by ``{"__mytk__": "ndarray", "buffer": i,
+"dtype": "<f8", "shape": [1024, 1024]}`` and bytes by ``{"__mytk__": "bytes",
+"buffer": i}``, and ``"buffers"`` lists the offset and size of each buffer.
+The buffers are sent as they are in memory (a contiguous array is not
+copied), and the arrays received are views on the received message (they are
+not copied either). Every buffer starts at a multiple of `ALIGNMENT` bytes
+from the start of the message, so the arrays received are aligned, as code
+that needs aligned memory (BLAS, OpenCV) expects, instead of being copied.
+
+It is served by `RemoteRequestHandler` on `BINARY_PATH`, next to XML-RPC, and
+used by clients created with ``mytk.connect(..., transport="binary")``.
+
+NumPy is only needed to receive arrays: sending a value that is not an array
+does not import it.
+"""
+
+import json
+import struct
+import sys
+import xmlrpc.client
+
+BINARY_PATH = "/binary"
+CONTENT_TYPE = "application/x-mytk-binary"
+
+MAGIC = b"MYTK"
+VERSION = 2
+PREFIX = struct.Struct("!4sBI")
+ALIGNMENT = 64  # Bytes; the buffers start at multiples of it
+
+
+def encode_message(header):
+    """Encode a message, extracting its arrays and bytes into buffers.
+
+    Args:
+        header (dict): A request (``{"method": ..., "params": [...]}``) or a
+            response (``{"result": ...}`` or ``{"fault": {...}}``).
+
+    Returns:
+        tuple[list, int]: The chunks to send in order (bytes or memoryviews),
+        and their total size in bytes.
+
+    Raises:
+        TypeError: If a value cannot be sent.
+    """
+    buffers = []
+    encoded = {key: _encode_value(value, buffers) for key, value in header.items()}
+    chunks = [None]  # For the header, once the offsets are known
+    layout = []
+    offset = 0  # From the end of the header
+    for buffer in buffers:
+        padding = -offset % ALIGNMENT
+        if padding:
+            chunks.append(bytes(padding))
+            offset += padding
+        layout.append([offset, buffer.nbytes])
+        chunks.append(buffer)
+        offset += buffer.nbytes
+    encoded["buffers"] = layout
+
+    encoded_header = json.dumps(encoded, separators=(",", ":")).encode()
+    padding = -(PREFIX.size + len(encoded_header)) % ALIGNMENT
+    encoded_header += b" " * padding  # Whitespace, ignored by the JSON parser
+    chunks[0] = PREFIX.pack(MAGIC, VERSION, len(encoded_header)) + encoded_header
+    return chunks, len(chunks[0]) + offset
+
+
+def decode_message(body):
+    """Decode a message encoded by `encode_message`.
+
+    Args:
+        body (bytearray | bytes): The whole message. Arrays are decoded as
+            views on it, writable if it is a bytearray.
+
+    Returns:
+        dict: The header, with its arrays and bytes restored.
+
+    Raises:
+        ValueError: If the message is not a valid binary message.
+        ImportError: If it contains arrays and NumPy is not installed.
+    """
+    if len(body) < PREFIX.size:
+        raise ValueError("Truncated binary message")
+    magic, version, header_length = PREFIX.unpack_from(body)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} binary message")
+
+    start = PREFIX.size + header_length
+    header = json.loads(bytes(body[PREFIX.size : start]))
+    buffers = []
+    end = start
+    for offset, nbytes in header.pop("buffers"):
+        if start + offset < end:
+            raise ValueError("Overlapping buffers in binary message")
+        buffers.append((start + offset, nbytes))
+        end = start + offset + nbytes
+    if end != len(body):
+        raise ValueError("The size of the binary message does not match its header")
+
+    return {key: _decode_value(value, body, buffers) for key, value in header.items()}
+
+
+def encode_request(method, params):
+    """Encode a call of `method` (see `encode_message`)."""
+    return encode_message({"method": method, "params": list(params)})
+
+
+def encode_response(result=None, fault=None):
+    """Encode the result of a call, or its `xmlrpc.client.Fault`."""
+    if fault is not None:
+        return encode_message(
+            {"fault": {"faultCode": fault.faultCode, "faultString": fault.faultString}}
+        )
+    return encode_message({"result": result})
+
+
+def decode_response(body):
+    """Return the result of a call from its encoded response.
+
+    Raises:
+        xmlrpc.client.Fault: If the call failed on the server.
+    """
+    response = decode_message(body)
+    fault = response.get("fault")
+    if fault is not None:
+        raise xmlrpc.client.Fault(fault["faultCode"], fault["faultString"])
+    return response.get("result")
+
+
+def read_body(stream, length):
+    """Read exactly `length` bytes from `stream` into a new bytearray.
+
+    Reading into a preallocated buffer avoids assembling the message from
+    chunks, so the arrays decoded from it are its only copy in memory.
+    """
+    body = bytearray(length)
+    view = memoryview(body)
+    received = 0
+    while received < length:
+        count = stream.readinto(view[received:])
+        if not count:
+            raise ConnectionError(
+                f"Connection closed after {received} of {length} bytes"
+            )
+        received += count
+    return body
+
+
+def _encode_value(value, buffers):
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, list | tuple):
+        return [_encode_value(item, buffers) for item in value]
+    if isinstance(value, dict):
+        for key in value:
+            if not isinstance(key, str):
+                raise TypeError(f"Dictionary keys must be strings, not {key!r}")
+        return {key: _encode_value(item, buffers) for key, item in value.items()}
+    if isinstance(value, bytes | bytearray | memoryview):
+        buffers.append(memoryview(value).cast("B"))
+        return {"__mytk__": "bytes", "buffer": len(buffers) - 1}
+
+    numpy = sys.modules.get("numpy")  # No array can exist if it was never imported
+    if numpy is not None:
+        if isinstance(value, numpy.generic):
+            return _encode_value(value.item(), buffers)
+        if isinstance(value, numpy.ndarray):
+            if value.dtype.hasobject or value.dtype.fields is not None:
+                raise TypeError(f"Arrays of dtype {value.dtype} cannot be sent")
+            contiguous = numpy.ascontiguousarray(value)  # Copies only if needed
+            buffers.append(memoryview(contiguous.reshape(-1).view(numpy.uint8)))
+            return {
+                "__mytk__": "ndarray",
+                "buffer": len(buffers) - 1,
+                "dtype": value.dtype.str,
+                "shape": list(value.shape),
+            }
+
+    raise TypeError(f"Values of type {type(value).__name__} cannot be sent")
+
+
+def _decode_value(value, body, buffers):
+    if isinstance(value, list):
+        return [_decode_value(item, body, buffers) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    kind = value.get("__mytk__")
+    if kind is None:
+        return {key: _decode_value(item, body, buffers) for key, item in value.items()}
+
+    offset, nbytes = buffers[value["buffer"]]
+    if kind == "bytes":
+        return bytes(body[offset : offset + nbytes])
+    if kind == "ndarray":
+        try:
+            import numpy
+        except ImportError as err:
+            raise ImportError(
+                "Receiving arrays needs the 'numpy' package. Install it with "
+                "'pip install numpy'."
+            ) from err
+        dtype = numpy.dtype(value["dtype"])
+        count = nbytes // dtype.itemsize if dtype.itemsize else 0
+        array = numpy.frombuffer(body, dtype=dtype, count=count, offset=offset)
+        return array.reshape(value["shape"])
+    raise ValueError(f"Unknown value kind {kind!r} in binary message")
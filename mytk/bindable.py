@@ -15,6 +15,18 @@ to build reactive MVC-style architectures in Python/Tkinter applications.
 Classes:
     - Bindable: Base class that supports observing and binding properties.
 
+Observers are held through weak references: registering an observer does not
+keep it alive, and registrations of observers that have been garbage-collected
+are pruned automatically. Use `remove_observer`, `unbind_properties` or
+`disconnect_observers` to unregister explicitly.
+
+Several changes can be grouped with `batch_changes()`: observers are notified
+once per modified property, with its final value, when the batch ends.
+
+Models written from worker threads can set `notify_on_main_thread = True`:
+changes made off the main thread are then coalesced per property and
+delivered to observers on the Tk main thread, through the App main queue.
+
 Usage Example:
     class Model(Bindable):
         def __init__(self):
@@ -30,13 +42,47 @@ Usage Example:
 
 """
 
+import threading
+import weakref
 from collections import namedtuple
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from tkinter import Variable
 
-ObserverInfo = namedtuple(
-    "ObserverInfo", ["observer", "observed_property_name", "context"]
-)
+from .utils import is_main_thread
+
+
+class ObserverInfo(
+    namedtuple("ObserverInfo", ["observer_ref", "observed_property_name", "context"])
+):
+    """A registration in `Bindable.observing_me`.
+
+    The observer itself is held through `observer_ref` (normally a weak
+    reference) and is available as `observer`, which is None once the observer
+    has been garbage-collected.
+    """
+
+    __slots__ = ()
+
+    @property
+    def observer(self):
+        """The registered observer, or None if it no longer exists."""
+        return self.observer_ref()
+
+
+class _StrongRef:
+    """Callable with the same interface as `weakref.ref`, but holding a strong reference.
+
+    Used for observers registered with weak=False and for objects that cannot
+    be weakly referenced.
+    """
+
+    __slots__ = ("referent",)
+
+    def __init__(self, referent):
+        self.referent = referent
+
+    def __call__(self):
+        return self.referent
 
 
 class Bindable:
@@ -55,18 +101,36 @@ class Bindable:
     another object.
     2. a binding mechanism so that two properties are always
     synchronized, regardless of which one changed
+
+    Attributes:
+        notify_on_main_thread (bool): If True, changes made from a thread other
+            than the main thread are not notified on that thread. They are
+            coalesced per property and delivered on the Tk main thread at the
+            next run of the App main queue, so producer threads never call
+            into Tk (nor wait for it). Defaults to False (observers are called
+            synchronously, on the thread that made the change).
     """
 
+    notify_on_main_thread = False
+
     def __init__(self, *args, **kwargs):
         """Assign observing_me before super().__init__().
 
         The overridden __setattr__ will be active for subclasses
         in case this is part of a multiple inheritance (it is).
         """
+        # First, and bypassing __setattr__: the assignments below already go
+        # through property_value_did_change, possibly on a worker thread.
+        object.__setattr__(self, "_main_thread_changes", {})
+        object.__setattr__(self, "_main_thread_changes_lock", threading.Lock())
         self.observing_me = []
+        self._tk_variable_traces = {}
+        self._observed_objects = []
+        self._pending_changes = None
+        self._binding_echoes = {}
         super().__init__()  # cooperative!
 
-    def add_observer(self, observer, my_property_name, context=None):
+    def add_observer(self, observer, my_property_name, context=None, weak=True):
         """Register an observer for changes to a named property of this object.
 
         When the property "my_property_name" of object "self" changes, the
@@ -89,28 +153,139 @@ class Bindable:
         observer pattern with Tk and generalize it to any property. To do so,
         we register à-la-TkVariable with trace_add and redirect the call with
         our observed_property_changed mechanism.
+
+        The observer is only weakly referenced, so observing an object never
+        keeps the observer alive: once it is garbage-collected, its
+        registrations are removed. Pass weak=False to keep a strong reference
+        (e.g. for a helper object nobody else holds on to). Objects that do not
+        support weak references are always held strongly.
         """
         try:
             var = getattr(self, my_property_name)
-
-            observer_info = ObserverInfo(observer, my_property_name, context)
-            self.observing_me.append(observer_info)
-
-            """
-            If the property is a regular object property, then __setattr__
-            will catch the change and call property_did_change. This is done
-            automatically. On the other hand, if the property is a
-            Tk.Variable, then we must register using Tk's mechanism (trace_add) to
-            observe not the variable itself but when its value is modified.
-            """
-            if isinstance(var, Variable):
-                var.trace_add("write", self.traced_tk_variable_changed)
-
         except AttributeError as err:
             raise AttributeError(
                 f"Attempting to observe inexistent property '{my_property_name}' in Bindable object {self}"
             ) from err
 
+        observer_ref = self._make_observer_ref(observer, weak)
+        self.observing_me.append(ObserverInfo(observer_ref, my_property_name, context))
+
+        # Let a Bindable observer know what it observes, so that it can
+        # unregister itself everywhere with disconnect_observers().
+        observed_objects = getattr(observer, "_observed_objects", None)
+        if isinstance(observed_objects, list):
+            alive = [ref for ref in observed_objects if ref() is not None]
+            if not any(ref() is self for ref in alive):
+                alive.append(weakref.ref(self))
+            observed_objects[:] = alive
+
+        """
+        If the property is a regular object property, then __setattr__
+        will catch the change and call property_did_change. This is done
+        automatically. On the other hand, if the property is a
+        Tk.Variable, then we must register using Tk's mechanism (trace_add) to
+        observe not the variable itself but when its value is modified.
+        A single trace per property is enough, regardless of the number of
+        observers.
+        """
+        if isinstance(var, Variable):
+            self._trace_tk_variable(my_property_name, var)
+
+    def remove_observer(self, observer, my_property_name=None, context=None):
+        """Unregister an observer.
+
+        Removes the registrations of "observer" for "my_property_name", or for
+        all properties if it is None. If "context" is given, only the
+        registrations made with an equal context are removed. Removing an
+        observer that is not registered is not an error.
+        """
+
+        def matches(observer_info):
+            if observer_info.observer is not observer:
+                return False
+            if (
+                my_property_name is not None
+                and observer_info.observed_property_name != my_property_name
+            ):
+                return False
+            return context is None or observer_info.context == context
+
+        self._remove_observer_infos(matches)
+
+    def disconnect_observers(self):
+        """Remove this object from the observer graph entirely.
+
+        Drops every observer of this object (including bindings) and
+        unregisters this object from every object it observes. Widgets call
+        this automatically when their Tk widget is destroyed, so that a model
+        stops notifying (and keeping busy) views that are gone.
+        """
+        observed_objects = list(self._observed_objects)
+        self._observed_objects.clear()
+        for observed_ref in observed_objects:
+            observed = observed_ref()
+            if observed is not None:
+                observed.remove_observer(self)
+
+        self._remove_observer_infos(lambda observer_info: True)
+
+    def _make_observer_ref(self, observer, weak=True):
+        """Return a reference to observer that prunes its registrations when it dies.
+
+        The pruning callback only holds a weak reference to self, so that
+        registering observers does not create reference cycles through self.
+        """
+        if weak:
+            observed_ref = weakref.ref(self)
+
+            def prune(observer_ref):
+                observed = observed_ref()
+                if observed is not None:
+                    observed._remove_observer_infos(
+                        lambda observer_info: observer_info.observer_ref is observer_ref
+                    )
+
+            with suppress(TypeError):
+                return weakref.ref(observer, prune)
+        return _StrongRef(observer)
+
+    def _remove_observer_infos(self, matches):
+        """Remove the registrations for which matches(observer_info) is True.
+
+        Tk traces of properties that are no longer observed are removed as
+        well, so Tk no longer holds on to this object through them.
+        """
+        observing_me = self.__dict__.get("observing_me")
+        if observing_me is None:
+            return
+
+        observing_me[:] = [
+            observer_info for observer_info in observing_me if not matches(observer_info)
+        ]
+
+        still_observed = {
+            observer_info.observed_property_name for observer_info in observing_me
+        }
+        tk_variable_traces = self.__dict__.get("_tk_variable_traces", {})
+        for property_name in list(tk_variable_traces):
+            if property_name not in still_observed:
+                var, trace_id = tk_variable_traces.pop(property_name)
+                with suppress(Exception):  # Tk may already be gone
+                    var.trace_remove("write", trace_id)
+
+    def _trace_tk_variable(self, property_name, var):
+        """Trace writes to the Tk Variable held in property_name, once."""
+        traced_var, trace_id = self._tk_variable_traces.get(property_name, (None, None))
+        if traced_var is var:
+            return
+
+        if traced_var is not None:  # The property now holds another Variable
+            with suppress(Exception):
+                traced_var.trace_remove("write", trace_id)
+
+        trace_id = var.trace_add("write", self.traced_tk_variable_changed)
+        self._tk_variable_traces[property_name] = (var, trace_id)
+
     def __setattr__(self, property_name, new_value):
         """Assigns a value to a property and notifies observers if it changed.
 
@@ -151,13 +326,41 @@ class Bindable:
         with trace_add (see above) and call our property_value_did_change
         mechanism.
         """
-        for _, property_name, _ in self.observing_me:
-            observed_property = getattr(self, property_name)
+        for property_name in list(self._tk_variable_traces):
+            observed_property = getattr(self, property_name, None)
 
             # pylint: disable=protected-access
             if isinstance(observed_property, Variable) and observed_property._name == var:
                 self.property_value_did_change(property_name)
 
+    @contextmanager
+    def batch_changes(self):
+        """Group several property changes into a single round of notifications.
+
+        Inside the block, changes are recorded instead of being sent to the
+        observers. When the outermost block exits, each modified property is
+        notified once, in the order it was first modified, with its value at
+        that time (i.e. the last value assigned). Nested blocks are merged
+        into the outermost one.
+
+            with model.batch_changes():
+                model.exposure = 10
+                model.gain = 2
+                model.exposure = 20   # observers only see exposure == 20
+        """
+        is_outermost = self.__dict__.get("_pending_changes") is None
+        if is_outermost:
+            # Bookkeeping: bypass __setattr__, it is not an observable change.
+            object.__setattr__(self, "_pending_changes", {})
+        try:
+            yield self
+        finally:
+            if is_outermost:
+                pending_changes = self._pending_changes
+                object.__setattr__(self, "_pending_changes", None)
+                for property_name in pending_changes:
+                    self.property_value_did_change(property_name)
+
     def property_value_did_change(self, property_name):
         """Notify all observers that a property value has changed.
 
@@ -165,19 +368,102 @@ class Bindable:
         what is the context that was provided when registering) before calling
         the observer callback. Tk.Variables need special treatment because we
         are looking at their values, not the Tk.Variable object itself.
+
+        Inside batch_changes(), the change is only recorded and will be
+        notified when the batch ends. With notify_on_main_thread, a change
+        made off the main thread is handed over to the main thread.
         """
+        if (self.notify_on_main_thread and not is_main_thread()
+                and self._defer_to_main_thread(property_name)):
+            return
+
+        pending_changes = self.__dict__.get("_pending_changes")
+        if pending_changes is not None:
+            pending_changes[property_name] = None  # Ordered set
+            return
+
         new_value = getattr(self, property_name)  # Assume python property
         if isinstance(new_value, Variable):  # If tk Variable, get its value
             new_value = new_value.get()
 
         if hasattr(self, "observing_me"):
-            for observer_info in self.observing_me:
-                observer, observed_property_name, context = observer_info
+            binding_echoes = self.__dict__.get("_binding_echoes")
+            # Iterate over a snapshot: observers may unregister (or be
+            # collected) while being notified.
+            for observer_ref, observed_property_name, context in tuple(self.observing_me):
                 if observed_property_name == property_name:
+                    observer = observer_ref()
+                    if observer is None:
+                        continue
+                    if binding_echoes and self._is_binding_echo(
+                        observer, context, new_value
+                    ):
+                        continue
                     observer.observed_property_changed(
                         self, observed_property_name, new_value, context
                     )
 
+    def _defer_to_main_thread(self, property_name):
+        """Record a change made off the main thread, to be notified on the main thread.
+
+        Changes are coalesced per property: however many times a property is
+        written before the main thread gets to it, its observers are notified
+        once, with the value it has then. A single delivery is scheduled on
+        the App main queue for all pending properties.
+
+        Private attributes and `observing_me` are bookkeeping, not
+        observable properties: they are never deferred.
+
+        Returns:
+            bool: False if there is no running App to deliver the change, or
+            if the change is not deferred, in which case the caller notifies
+            synchronously as usual.
+        """
+        from .app import App  # Late import: App is itself a Bindable
+
+        if property_name.startswith("_") or property_name == "observing_me":
+            return False
+        if "_main_thread_changes_lock" not in self.__dict__:
+            return False  # Not initialized by Bindable.__init__ yet
+
+        app = App.app
+        if app is None or not app.is_running:
+            return False
+
+        with self._main_thread_changes_lock:
+            must_schedule = not self._main_thread_changes
+            self._main_thread_changes[property_name] = None  # Ordered set
+
+        if must_schedule:
+            app.schedule_on_main_thread(self._deliver_main_thread_changes)
+        return True
+
+    def _deliver_main_thread_changes(self):
+        """Notify, on the main thread, the changes recorded by worker threads."""
+        with self._main_thread_changes_lock:
+            property_names = list(self._main_thread_changes)
+            self._main_thread_changes.clear()
+
+        for property_name in property_names:
+            self.property_value_did_change(property_name)
+
+    def _is_binding_echo(self, observer, context, new_value):
+        """Whether notifying observer would only send back the value it just sent us.
+
+        While a bound property is being updated from the other side of a
+        binding, notifying that other side with the very same value is a
+        redundant round-trip. A different value (e.g. after sanitizing) is
+        still sent back.
+        """
+        if not isinstance(context, dict) or context.get("binding") is None:
+            return False
+        key = (id(observer), context["binding"])
+        if key not in self._binding_echoes:
+            return False
+        with suppress(Exception):  # e.g. values that cannot be compared
+            return bool(self._binding_echoes[key] == new_value)
+        return False
+
     def observed_property_changed(
         self, observed_object, observed_property_name, new_value, context
     ):
@@ -210,10 +496,17 @@ class Bindable:
                     old_value = var.get()
 
                 if old_value != new_value:
-                    if var is not None:
-                        var.set(new_value)
-                    else:
-                        setattr(self, bound_variable, new_value)
+                    # Remember what observed_object sent, so that the change
+                    # we are about to make is not echoed back to it.
+                    echo_key = (id(observed_object), observed_property_name)
+                    self._binding_echoes[echo_key] = new_value
+                    try:
+                        if var is not None:
+                            var.set(new_value)
+                        else:
+                            setattr(self, bound_variable, new_value)
+                    finally:
+                        self._binding_echoes.pop(echo_key, None)
 
     def bind_properties(
         self, this_property_name, other_object, other_property_name
@@ -234,6 +527,21 @@ class Bindable:
         )
         self.property_value_did_change(this_property_name)
 
+    def unbind_properties(
+        self, this_property_name, other_object, other_property_name
+    ):
+        """Undo a binding made with bind_properties.
+
+        Both directions are removed. Other observers of either property are
+        left untouched.
+        """
+        other_object.remove_observer(
+            self, other_property_name, context={"binding": this_property_name}
+        )
+        self.remove_observer(
+            other_object, this_property_name, context={"binding": other_property_name}
+        )
+
     def bind_property_to_widget_value(
         self, property_name: str, control_widget: "Base"  # noqa: F821
     ):
@@ -77,6 +77,7 @@ Available property types
 
 import numbers
 import re
+from contextlib import nullcontext
 from typing import Any
 
 from mytk.dialog import Dialog
@@ -350,9 +351,13 @@ class Configurable:
         """Apply a possibly partial dict of new values.
 
         Each value is sanitized by its property descriptor on assignment.
+        When the object is also a ``Bindable``, the changes are batched so
+        observers are notified once per property, after all values are set.
         """
-        for key, value in new_values.items():
-            setattr(self, key, value)
+        batch_changes = getattr(self, "batch_changes", None)
+        with batch_changes() if batch_changes is not None else nullcontext():
+            for key, value in new_values.items():
+                setattr(self, key, value)
 
     def is_valid(self, values: dict) -> dict:
         """Return a per-key dict of booleans indicating validity per property schema."""
@@ -12,6 +12,8 @@ presence for type-checkers.
 """
 
 import tkinter as tk
+from contextlib import suppress
+from functools import wraps
 from typing import Callable, Protocol, Sequence, runtime_checkable
 
 
@@ -32,16 +34,22 @@ class EventCapable:
     as a `tk.Widget`. This class should not be used on its own.
 
     Responsibilities:
-    - Scheduling and cancelling timed callbacks (`after`, `after_cancel`, etc.)
+    - Scheduling and cancelling timed callbacks (`after`, `after_idle`,
+      `after_coalesced`, `after_cancel`, etc.), tracked until they run
+    - Periodic callbacks driven by the App frame clock (`add_frame_callback`)
     - Event binding and generation via `widget.bind` and `widget.event_generate`
     - Lifecycle cleanup via `__del__`
     """
 
     widget: "tk.Widget"  # Hint for static type checkers and linters like pylint
 
+    main_thread_profiler = None  # Set by App.enable_profiling()
+
     def __init__(self, *args, **kwargs):
         """Initialize internal scheduling structures for cooperative multiple inheritance."""
-        self.scheduled_tasks = []
+        self.scheduled_tasks = {}  # task_id -> coalescing key (or None)
+        self._coalesced_tasks = {}  # key -> [task_id, function]
+        self._destroy_bound_widget = None
         super().__init__()  # cooperative!
 
     # def __del__(self):
@@ -71,6 +79,8 @@ class EventCapable:
     def after(self, delay: int, function: Callable) -> int:
         """Schedules a function to be called after a given time delay.
 
+        The task is tracked in `scheduled_tasks` until it runs or is cancelled.
+
         Args:
             delay (int): Delay in milliseconds.
             function (Callable): Function to invoke.
@@ -79,22 +89,99 @@ class EventCapable:
             int: Identifier of the scheduled task, which can be used with `after_cancel`.
         """
         self._valid_mixin_class()
+        if self.widget is None or function is None:
+            return None
+
+        profiler = EventCapable.main_thread_profiler
+        if profiler is not None:
+            function = profiler.wrap_after(function, delay)
+        return self._register_task(lambda fired: self.widget.after(delay, fired), function)
+
+    def after_idle(self, function: Callable) -> int:
+        """Schedules a function to be called when Tk is idle.
+
+        It runs once the pending events have been processed, e.g. to redraw
+        once after a burst of changes. Tracked and cancelled like `after`.
+
+        Args:
+            function (Callable): Function to invoke.
+
+        Returns:
+            int: Identifier of the scheduled task, which can be used with `after_cancel`.
+        """
+        self._valid_mixin_class()
+        if self.widget is None or function is None:
+            return None
+
+        profiler = EventCapable.main_thread_profiler
+        if profiler is not None:
+            function = profiler.wrap_after(function, 0)
+        return self._register_task(lambda fired: self.widget.after_idle(fired), function)
+
+    def after_coalesced(self, key, delay: int, function: Callable) -> int:
+        """Schedules a function, unless a call with the same key is pending.
+
+        If a task scheduled with `key` has not run yet, it is not scheduled
+        again: the pending task keeps its time but calls `function` instead
+        of the one it was scheduled with. Use it for work where only the last
+        request matters, such as resizing or redrawing after many events::
+
+            def event_resized(self, event):
+                self.after_coalesced("resize", 100, self.resize_image_to_fit_widget)
+
+        Args:
+            key (hashable): Identifies the calls that replace each other.
+            delay (int): Delay in milliseconds, if no call is pending.
+            function (Callable): Function to invoke.
+
+        Returns:
+            int: Identifier of the scheduled (or pending) task.
+        """
+        pending = self._coalesced_tasks.get(key)
+        if pending is not None:
+            pending[1] = function
+            return pending[0]
+
+        pending = [None, function]
+        task_id = self.after(delay, lambda: pending[1]())
+        if task_id is not None:
+            pending[0] = task_id
+            self._coalesced_tasks[key] = pending
+            self.scheduled_tasks[task_id] = key
+        return task_id
+
+    def _register_task(self, schedule, function):
+        """Schedule `function` with `schedule(fired)` and track its task id.
+
+        The task removes itself from `scheduled_tasks` when it runs, so the
+        registry only holds pending tasks.
+        """
         task_id = None
-        if self.widget is not None and function is not None:
-            task_id = self.widget.after(delay, function)
-            self.scheduled_tasks.append(task_id)
+
+        def fired(*args):
+            key = self.scheduled_tasks.pop(task_id, None)
+            if key is not None:
+                self._coalesced_tasks.pop(key, None)
+            return function(*args)
+
+        task_id = schedule(fired)
+        self.scheduled_tasks[task_id] = None
         return task_id
 
     def after_cancel(self, task_id: int):
         """Cancels a previously scheduled task by its ID.
 
+        Cancelling a task that already ran or was cancelled does nothing.
+
         Args:
             task_id (int): ID of the task returned by `after()`.
         """
         self._valid_mixin_class()
+        key = self.scheduled_tasks.pop(task_id, None)
+        if key is not None:
+            self._coalesced_tasks.pop(key, None)
         if self.widget is not None:
             self.widget.after_cancel(task_id)
-            self.scheduled_tasks.remove(task_id)
 
     def after_cancel_many(self, task_ids: Sequence[int]):
         """Cancels multiple tasks given a sequence of IDs.
@@ -109,26 +196,106 @@ class EventCapable:
         """Cancel all currently scheduled tasks for this object."""
         self.after_cancel_many(list(self.scheduled_tasks))
 
+    def add_frame_callback(self, callback: Callable, rate: float = None):
+        """Calls a function periodically, from the shared clock of the App.
+
+        Prefer it to a function that reschedules itself with `after`: the
+        callbacks of all widgets due at the same time run in the same tick,
+        frames are dropped rather than run in a burst when the main thread is
+        late, and the callback is not called while this widget is not on
+        screen. It is removed when the widget is destroyed.
+
+        Without an App (e.g. widgets in a bare Tk root), the callback is
+        called from its own `after` loop instead.
+
+        Args:
+            callback (Callable): Function to call, without arguments.
+            rate (float, optional): Calls per second. Defaults to the maximum
+                rate of the clock (see `FrameClock.max_rate`).
+
+        Returns:
+            FrameCallback: Handle to give to `remove_frame_callback`.
+        """
+        from .app import App
+
+        self._valid_mixin_class()
+        if App.app is None:
+            return self._add_after_loop(callback, rate)
+        widget = None if self is App.app else self
+        return App.app.frame_clock.add(callback, rate=rate, widget=widget)
+
+    def _add_after_loop(self, callback, rate):
+        """`add_frame_callback` without an App: call from an `after` loop."""
+        from .frameclock import DEFAULT_MAX_RATE, FrameCallback
+
+        if rate is None:
+            rate = DEFAULT_MAX_RATE
+        if rate <= 0:
+            raise ValueError(f"The rate must be positive, not {rate}")
+        frame_callback = FrameCallback(callback, rate, widget=self)
+        delay = max(round(frame_callback.period * 1000), 1)
+
+        def tick():
+            if frame_callback.is_active:
+                frame_callback.frame_count += 1
+                callback()
+                frame_callback.task_id = self.after(delay, tick)
+
+        frame_callback.task_id = self.after(delay, tick)
+        return frame_callback
+
+    def remove_frame_callback(self, frame_callback):
+        """Stops calling a function registered with `add_frame_callback`.
+
+        Args:
+            frame_callback (FrameCallback): Handle returned by `add_frame_callback`.
+        """
+        from .app import App
+
+        task_id = getattr(frame_callback, "task_id", None)
+        if task_id is not None:  # From an `after` loop, without an App
+            frame_callback.is_active = False
+            self.after_cancel(task_id)
+        elif App.app is not None:
+            App.app.frame_clock.remove(frame_callback)
+
     def _bind_destroy_cancel(self):
         """Bind a Destroy handler that cancels all scheduled tasks on widget destruction.
 
         Called automatically after create_widget() in grid_into/pack_into/place_into.
         """
-        if self.widget is not None:
-            self.widget.bind(
-                '<Destroy>',
-                lambda e: self.after_cancel_all() if e.widget is self.widget else None
-            )
+        if self.widget is None or self._destroy_bound_widget is self.widget:
+            return
+
+        def cancel_all(event):
+            if event.widget is self.widget:
+                with suppress(tk.TclError):
+                    self.after_cancel_all()
+
+        self.widget.bind("<Destroy>", cancel_all, add="+")
+        self._destroy_bound_widget = self.widget
 
     def bind_event(self, event: str, callback: Callable):
         """Binds a callback function to a specific event on the underlying widget.
 
+        The handler is measured whenever profiling is enabled (see
+        `App.enable_profiling`), including when it was bound before.
+
         Args:
             event (str): Tkinter event string (e.g. "<Button-1>").
             callback (Callable): Function to be called when the event occurs.
         """
         self._valid_mixin_class()
-        self.widget.bind(event, callback)
+
+        @wraps(callback)
+        def handler(*args):
+            profiler = EventCapable.main_thread_profiler
+            if profiler is None:
+                return callback(*args)
+            with profiler.measure("event", callback):
+                return callback(*args)  # Its return value (e.g. "break") is kept
+
+        self.widget.bind(event, handler)
 
     def event_generate(self, event: str):
         """Triggers an event on the underlying widget programmatically.
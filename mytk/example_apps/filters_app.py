@@ -28,6 +28,7 @@ class FilterDBApp(App):
         self.temp_root = Path(tempfile.TemporaryDirectory().name)
         self.download_files = False
         self.webbrowser_download_path = None
+        self.filter_load_task = None
 
         self.window.widget.title("Filters")
         self.window.row_resize_weight(0,1) # Tables
@@ -233,27 +234,36 @@ class FilterDBApp(App):
             filename_idx = list(self.filters.columns).index('filename')
             filename = record[filename_idx]
             filepath = self.filepath_root / filename
-            if filepath.exists() and not filepath.is_dir():
-
-                data = self.load_filter_data(filepath)
-                self.filter_data.empty()
-                self.filter_plot.clear_plot()
-                with PostponeChangeCalls(self.filter_data.data_source):
-                    for x,y in data:
-                        # self.filter_data.data_source.append_record({"wavelength":x,"transmission":y})
-                        self.filter_plot.append(x,y)
-
-                self.filter_plot.first_axis.set_ylabel("Transmission")
-                self.filter_plot.first_axis.set_xlabel("Wavelength [nm]")
-                self.filter_plot.update_plot()
-                self.copy_data_button.enable()
+            if self.filter_load_task is not None:
+                self.filter_load_task.cancel()
+                self.filter_load_task = None
 
+            if filepath.exists() and not filepath.is_dir():
+                # Large spectra take a while to parse: keep the interface responsive
+                self.filter_load_task = self.run_in_background(
+                    self.load_filter_data, filepath,
+                    on_done=self.show_filter_data, owner=self.filter_plot
+                )
             else:
                 self.filter_data.empty()
                 self.filter_plot.clear_plot()
                 self.filter_plot.update_plot()
                 self.copy_data_button.disable()
 
+    def show_filter_data(self, data):
+        self.filter_load_task = None
+        self.filter_data.empty()
+        self.filter_plot.clear_plot()
+        with PostponeChangeCalls(self.filter_data.data_source):
+            for x,y in data or []:
+                # self.filter_data.data_source.append_record({"wavelength":x,"transmission":y})
+                self.filter_plot.append(x,y)
+
+        self.filter_plot.first_axis.set_ylabel("Transmission")
+        self.filter_plot.first_axis.set_xlabel("Wavelength [nm]")
+        self.filter_plot.update_plot()
+        self.copy_data_button.enable()
+
     def preferences(self):
         dlg = Dialog(title="Preferences")
 
@@ -52,6 +52,7 @@ class PowerMeterApp(App):
 
         self.device = PowerMeterDevice()
         self.is_refreshing = False
+        self.refresh_frame_callback = None
 
 
         self.device.bind_properties("wavelength", self.wavelength_entry.entry, "value_variable")
@@ -65,10 +66,12 @@ class PowerMeterApp(App):
     def click_start(self, event, button):
         if not self.is_refreshing:
             self.is_refreshing = True
-            self.update_loop()
+            self.refresh_frame_callback = self.add_frame_callback(self.update_loop, rate=1000/300)
             button.label = "Stop"
         else:
             self.is_refreshing = False
+            self.remove_frame_callback(self.refresh_frame_callback)
+            self.refresh_frame_callback = None
             button.label = "Start"
 
     def update_loop(self):
@@ -81,9 +84,6 @@ class PowerMeterApp(App):
         self.plot.append(last, power)
         self.plot.update_plot()
 
-        if self.is_refreshing:
-            self.after(300, self.update_loop)
-
 
     def click_save(self, event, button):
         filepath = filedialog.asksaveasfilename(
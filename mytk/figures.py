@@ -292,12 +292,19 @@ class XYPlot(Figure):
 
 
 class Histogram(Figure):
-    """Histogram plot backed by matplotlib and numpy."""
+    """Histogram plot backed by matplotlib and numpy.
+
+    `update_plot` redraws the histogram in `x` and `y`. For live data, use
+    `show_counts` instead: it updates the existing curves and redraws only
+    them (blitting), not the whole figure.
+    """
 
     def __init__(self, figsize):
         super().__init__(figsize=figsize)
         self.x = []
         self.y = []
+        self._count_artists = None  # Curves updated by show_counts
+        self._background = None  # The axes without the curves, for blitting
 
     def is_environment_valid(self):
         """Check that matplotlib and numpy are installed and importable."""
@@ -313,6 +320,7 @@ class Histogram(Figure):
 
         if self.first_axis is None:
             self.figure.add_subplot()
+        self.canvas.mpl_connect("draw_event", self._store_background)
 
         self.update_plot()
 
@@ -320,8 +328,76 @@ class Histogram(Figure):
         """Clear all histogram data and the axes."""
         self.x = []
         self.y = []
+        self._count_artists = None
         self.first_axis.clear()
 
+    def show_counts(self, counts):
+        """Show histogram counts, updating the curves already shown.
+
+        The first call (or a call with another number of channels or bins)
+        creates the curves; the following ones only change their data and
+        redraw them over the saved background of the axes. The whole figure
+        is redrawn only when the vertical scale must change.
+
+        Args:
+            counts (numpy.ndarray): Counts of shape (channels, bins), one
+                curve per channel: red, green and blue for 3 channels, black
+                otherwise.
+        """
+        numpy = ModulesManager.imported["numpy"]
+        counts = numpy.asarray(counts)
+        axis = self.first_axis
+        channels, bins = counts.shape
+
+        artists = self._count_artists
+        if artists is None or len(artists) != channels or len(artists[0].get_data().values) != bins:
+            self.clear_plot()
+            colors = ["red", "green", "blue"] if channels == 3 else ["black"] * channels
+            edges = numpy.arange(bins + 1)
+            self._count_artists = [
+                axis.stairs(row, edges, color=color, animated=True)
+                for row, color in zip(counts, colors, strict=True)
+            ]
+            axis.set_xlim((0, bins))
+            axis.set_ylim((0, 1))
+            axis.set_xticks([])
+            axis.set_yticks([])
+            redraw = True
+        else:
+            for artist, row in zip(artists, counts, strict=True):
+                artist.set_data(row)
+            redraw = False
+
+        # Same scale as update_plot, with a margin so it rarely changes
+        top = float(numpy.mean(counts) + numpy.std(counts) * 2) or 1.0
+        current_top = axis.get_ylim()[1]
+        if top > current_top or top < current_top / 2:
+            axis.set_ylim((0, top * 1.25))
+            redraw = True
+
+        if redraw or self._background is None:
+            self.figure.canvas.draw()  # Calls _store_background
+        else:
+            canvas = self.figure.canvas
+            canvas.restore_region(self._background)
+            for artist in self._count_artists:
+                axis.draw_artist(artist)
+            canvas.blit(axis.bbox)
+
+    def _store_background(self, event):
+        """Save the axes without the curves after a full draw, then draw the curves.
+
+        A full draw skips the curves, since they are animated.
+        """
+        axis = self.first_axis
+        if axis is None:
+            return
+        self._background = event.canvas.copy_from_bbox(axis.bbox)
+        if self._count_artists is not None:
+            for artist in self._count_artists:
+                axis.draw_artist(artist)
+            event.canvas.blit(axis.bbox)
+
     def update_plot(self):
         """Redraw the histogram with the current data."""
         if len(self.x) > 1:
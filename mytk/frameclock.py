@@ -0,0 +1,231 @@
+"""A single clock driving every periodic update of the interface.
+
+Provides `FrameClock`, owned by the `App` (see `App.frame_clock`), and
+`FrameCallback`, the handle of a registered callback. Widgets register their
+periodic updates with `EventCapable.add_frame_callback` instead of each
+rescheduling itself with its own `after` timer:
+
+- the callbacks due at the same time run in the same tick, so they stay in
+  step instead of drifting apart;
+- a callback that falls behind (the main thread was busy) runs once, late,
+  and the frames it missed are dropped instead of run in a burst;
+- the callbacks of a widget that is not on screen (unmapped, withdrawn,
+  in another tab) are not called until it is shown again, and are removed
+  when the widget is destroyed. When no widget is on screen, the clock
+  stops until one is mapped again.
+"""
+
+import time
+from contextlib import suppress
+from tkinter import TclError
+
+from .eventcapable import EventCapable
+
+DEFAULT_MAX_RATE = 60  # Ticks per second
+
+
+class FrameCallback:
+    """A callback registered with a `FrameClock`.
+
+    Attributes:
+        callback (callable): Called without arguments at each frame.
+        period (float): Time (s) between frames, 1/rate.
+        widget (tk.Widget | Base | None): The callback is not called while
+            this widget is not on screen, and is removed when it is destroyed.
+        frame_count (int): Number of times the callback was called.
+        dropped_frames (int): Number of frames skipped because the main
+            thread was late.
+        hidden_frames (int): Number of frames skipped because the widget was
+            not on screen.
+    """
+
+    def __init__(self, callback, rate, widget=None):
+        self.callback = callback
+        self.period = 1 / rate
+        self.widget = widget
+        self.next_due = time.perf_counter()
+        self.frame_count = 0
+        self.dropped_frames = 0
+        self.hidden_frames = 0
+        self.is_active = True
+
+    @property
+    def rate(self):
+        """Target number of calls per second."""
+        return 1 / self.period
+
+    @property
+    def tk_widget(self):
+        """The Tk widget, if `widget` is a myTk widget."""
+        return getattr(self.widget, "widget", self.widget)
+
+
+class FrameClock:
+    """Calls registered callbacks at their rate, from a single Tk timer.
+
+    The clock only runs while callbacks are registered, and at least one of
+    them is on screen: when all their widgets are hidden, it waits for a
+    ``<Map>`` event in their toplevel windows. Its ticks are not more
+    frequent than `max_rate` per second: callbacks due within half a tick of
+    each other run together.
+
+    Attributes:
+        root (tk.Tk): The root window, whose `after` drives the clock.
+        max_rate (float): Maximum number of ticks per second.
+        frame_callbacks (list[FrameCallback]): The registered callbacks.
+    """
+
+    def __init__(self, root, max_rate=DEFAULT_MAX_RATE):
+        self.root = root
+        self.max_rate = max_rate
+        self.frame_callbacks = []
+        self._next_tick = None
+        self._map_bound = set()  # Toplevels whose <Map> resumes the clock
+
+    def add(self, callback, rate=None, widget=None):
+        """Register a callback, called `rate` times per second.
+
+        Args:
+            callback (callable): Called without arguments at each frame.
+            rate (float, optional): Calls per second. Defaults to `max_rate`.
+            widget (tk.Widget | Base, optional): Pause the callback while this
+                widget is not on screen, and remove it when it is destroyed.
+
+        Returns:
+            FrameCallback: The handle to give to `remove`.
+        """
+        if rate is None:
+            rate = self.max_rate
+        if rate <= 0:
+            raise ValueError(f"The rate must be positive, not {rate}")
+
+        frame_callback = FrameCallback(callback, rate, widget)
+        self.frame_callbacks.append(frame_callback)
+        self._schedule_tick()
+        return frame_callback
+
+    def remove(self, frame_callback):
+        """Unregister a callback. Does nothing if it was already removed."""
+        frame_callback.is_active = False
+        if frame_callback in self.frame_callbacks:
+            self.frame_callbacks.remove(frame_callback)
+        if not self.frame_callbacks:
+            self.stop()
+
+    def stop(self):
+        """Unregister every callback and stop the clock."""
+        for frame_callback in self.frame_callbacks:
+            frame_callback.is_active = False
+        self.frame_callbacks = []
+        if self._next_tick is not None:
+            next_tick, self._next_tick = self._next_tick, None
+            with suppress(TclError):  # Root already destroyed
+                self.root.after_cancel(next_tick)
+
+    @property
+    def tick_period(self):
+        """Minimum time (s) between two ticks, 1/max_rate."""
+        return 1 / self.max_rate
+
+    def tick(self):
+        """Call every callback that is due, then schedule the next tick."""
+        self._next_tick = None
+        now = time.perf_counter()
+        tolerance = self.tick_period / 2
+        hidden = []
+
+        for frame_callback in list(self.frame_callbacks):
+            if not frame_callback.is_active:
+                continue
+            if now < frame_callback.next_due - tolerance:
+                if self.is_visible(frame_callback) is False:
+                    hidden.append(frame_callback)
+                continue
+
+            late = now - frame_callback.next_due
+            if late > frame_callback.period:
+                frame_callback.dropped_frames += int(late / frame_callback.period)
+                frame_callback.next_due = now + frame_callback.period
+            else:
+                frame_callback.next_due += frame_callback.period
+
+            is_visible = self.is_visible(frame_callback)
+            if is_visible is None:
+                self.remove(frame_callback)
+            elif not is_visible:
+                frame_callback.hidden_frames += 1
+                hidden.append(frame_callback)
+            else:
+                frame_callback.frame_count += 1
+                try:
+                    frame_callback.callback()
+                except Exception as err:
+                    print(f"Frame callback {frame_callback.callback} failed: {err}")
+
+        if self.frame_callbacks and len(hidden) == len(self.frame_callbacks):
+            self._wait_for_map(hidden)  # No work while nothing is on screen
+        else:
+            self._schedule_tick()
+
+    def _wait_for_map(self, hidden):
+        """Leave the clock stopped until a widget is mapped.
+
+        Waits for a ``<Map>`` event in the toplevel windows of the hidden
+        callbacks, or in the root window.
+        """
+        toplevels = {self.root}
+        for frame_callback in hidden:
+            with suppress(AttributeError, TclError):
+                toplevels.add(frame_callback.tk_widget.winfo_toplevel())
+        toplevels.discard(None)
+        for toplevel in toplevels - self._map_bound:
+            with suppress(TclError):
+                toplevel.bind("<Map>", self._widget_mapped, add="+")
+                self._map_bound.add(toplevel)
+
+    def _widget_mapped(self, event=None):
+        """<Map> handler: restart the clock if it is waiting for a widget."""
+        if self._next_tick is not None or not self.frame_callbacks:
+            return
+        now = time.perf_counter()
+        for frame_callback in self.frame_callbacks:
+            frame_callback.next_due = now  # Due at once, and not late
+        self._schedule_tick()
+
+    def _schedule_tick(self):
+        """Schedule the next tick at the time the next callback is due."""
+        if self._next_tick is not None or not self.frame_callbacks:
+            return
+
+        next_due = min(frame_callback.next_due for frame_callback in self.frame_callbacks)
+        delay = max(next_due - time.perf_counter(), self.tick_period / 2)
+        delay = int(round(delay * 1000))
+
+        tick = self.tick
+        profiler = EventCapable.main_thread_profiler
+        if profiler is not None:
+            tick = profiler.wrap_after(tick, delay)
+        try:
+            self._next_tick = self.root.after(delay, tick)
+        except TclError:
+            self.frame_callbacks = []  # Root destroyed: the clock is over
+
+    @staticmethod
+    def is_visible(frame_callback):
+        """Whether the widget of the callback is on screen.
+
+        Returns:
+            bool | None: True if there is no widget, None if it was destroyed.
+        """
+        if frame_callback.widget is None:
+            return True
+
+        tk_widget = frame_callback.tk_widget
+        if tk_widget is None:
+            return False  # Not placed yet
+        try:
+            if not tk_widget.winfo_exists():
+                return None
+            return bool(tk_widget.winfo_ismapped())
+        except TclError:
+            return None
@@ -115,11 +115,11 @@ class Image(Base):
         """Resize the image if is_rescalable, throttling to avoid infinite loops."""
         if self.is_rescalable:
             if self.resize_update_delay > 0:
-                if len(self.scheduled_tasks) == 0:
-                    self.after(
-                        self.resize_update_delay,
-                        self.resize_image_to_fit_widget,
-                    )
+                self.after_coalesced(
+                    "resize",
+                    self.resize_update_delay,
+                    self.resize_image_to_fit_widget,
+                )
             else:
                 self.resize_image_to_fit_widget()
         else:
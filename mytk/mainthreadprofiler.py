@@ -0,0 +1,267 @@
+"""Latency and stall measurements of the work done on the Tk main thread.
+
+Provides `MainThreadProfiler`, which times the callbacks that run on the Tk
+thread, and `MainThreadOverlay`, a label showing its measurements over the
+application window. Profiling is opt-in: see `App.enable_profiling`.
+
+Three kinds of callbacks are measured, each in its own category:
+
+- "main_queue": calls scheduled with `App.schedule_on_main_thread`. The wait
+  is the time spent in the queue.
+- "after": callbacks scheduled with `EventCapable.after`. The wait is how late
+  the callback ran compared to the requested delay.
+- "event": handlers bound with `EventCapable.bind_event`, whenever they
+  were bound. Tk does not tell when the event occurred, so only the run time
+  is measured.
+
+Callbacks given to Tk directly (``widget.bind``, ``command=``) are not
+measured: this is not a profile of everything that runs on the main thread.
+
+A callback running longer than `stall_threshold` ms is a stall: a watchdog
+thread captures the stack of the main thread while it is stalled, so the
+report shows where the time goes, not only which callback was slow.
+"""
+
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from functools import partial, wraps
+
+from .labels import Label
+
+
+class MainThreadProfiler:
+    """Rolling statistics of the callbacks run on the Tk main thread.
+
+    Attributes:
+        stall_threshold (float): Run time (ms) above which a callback is
+            reported as a stall.
+        window (int): Number of most recent samples per category used for
+            the percentiles.
+        max_stalls (int): Number of most recent stalls kept.
+    """
+
+    categories = ("main_queue", "after", "event")
+
+    def __init__(self, stall_threshold=100, window=1000, max_stalls=20):
+        self.stall_threshold = stall_threshold
+        self.window = window
+        self.max_stalls = max_stalls
+        self.is_enabled = False
+
+        self._lock = threading.Lock()
+        self._main_thread_id = threading.main_thread().ident
+        self._running = []  # Stack of [category, callback, start, stack]
+        self._watchdog = None
+        self._stop_watchdog = threading.Event()
+        self.reset()
+
+    def reset(self):
+        """Forget every measurement."""
+        with self._lock:
+            self._wait_samples = {
+                category: deque(maxlen=self.window) for category in self.categories
+            }
+            self._run_samples = {
+                category: deque(maxlen=self.window) for category in self.categories
+            }
+            self._counts = dict.fromkeys(self.categories, 0)
+            self._stalls = deque(maxlen=self.max_stalls)
+            self._stall_count = 0
+
+    def start(self):
+        """Start measuring, and start the stall watchdog thread."""
+        self.is_enabled = True
+        if self._watchdog is None:
+            self._stop_watchdog.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch_for_stalls, name="mytk-profiler", daemon=True
+            )
+            self._watchdog.start()
+
+    def stop(self):
+        """Stop measuring. The measurements are kept."""
+        self.is_enabled = False
+        if self._watchdog is not None:
+            self._stop_watchdog.set()
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    @contextmanager
+    def measure(self, category, callback, wait=None):
+        """Time the block as a run of `callback` on the main thread.
+
+        Args:
+            category (str): One of `categories`.
+            callback (callable): The callback run in the block, used to name it.
+            wait (float, optional): Time (s) the callback waited before running.
+        """
+        if not self.is_enabled:
+            yield
+            return
+
+        running = [category, callback, time.perf_counter(), None]
+        self._running.append(running)
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - running[2]
+            self._running.remove(running)
+            self.record(category, callback, duration, wait, stack=running[3])
+
+    def record(self, category, callback, duration, wait=None, stack=None):
+        """Add a measurement.
+
+        Args:
+            category (str): One of `categories`.
+            callback (callable): The callback that ran.
+            duration (float): Its run time (s).
+            wait (float, optional): Time (s) it waited before running.
+            stack (list[str], optional): Stack captured while it was stalled.
+        """
+        with self._lock:
+            self._counts[category] += 1
+            self._run_samples[category].append(duration * 1000)
+            if wait is not None:
+                self._wait_samples[category].append(max(wait, 0) * 1000)
+
+            if duration * 1000 > self.stall_threshold:
+                self._stall_count += 1
+                self._stalls.append(
+                    {
+                        "category": category,
+                        "callback": self.callback_name(callback),
+                        "duration_ms": duration * 1000,
+                        "time": time.time(),
+                        "stack": "".join(stack or []),
+                    }
+                )
+
+    def wrap(self, category, callback):
+        """Return `callback` wrapped so that its calls are measured.
+
+        Used for event handlers, whose return value (e.g. "break") is kept.
+        """
+
+        @wraps(callback)
+        def measured(*args, **kwargs):
+            with self.measure(category, callback):
+                return callback(*args, **kwargs)
+
+        return measured
+
+    def wrap_after(self, callback, delay):
+        """Return `callback`, scheduled in `delay` ms, wrapped to measure it.
+
+        The wait is the time the callback ran late.
+        """
+        due = time.perf_counter() + delay / 1000
+
+        @wraps(callback)
+        def measured(*args, **kwargs):
+            with self.measure("after", callback, wait=time.perf_counter() - due):
+                return callback(*args, **kwargs)
+
+        return measured
+
+    def stats(self):
+        """Return the measurements.
+
+        Safe to call from any thread. Times are in milliseconds; the
+        percentiles cover the last `window` samples of each category.
+
+        Returns:
+            dict: With keys "enabled", "stall_threshold_ms", one key per
+            category (a dict with "count", "run_ms" and "wait_ms", each with
+            "p50", "p95", "p99" and "max"), "stall_count", and "stalls" (the
+            most recent stalls, with their "category", "callback",
+            "duration_ms", "time" and "stack").
+        """
+        with self._lock:
+            stats = {
+                "enabled": self.is_enabled,
+                "stall_threshold_ms": self.stall_threshold,
+                "stall_count": self._stall_count,
+                "stalls": list(self._stalls),
+            }
+            for category in self.categories:
+                stats[category] = {
+                    "count": self._counts[category],
+                    "run_ms": self.percentiles(self._run_samples[category]),
+                    "wait_ms": self.percentiles(self._wait_samples[category]),
+                }
+        return stats
+
+    @staticmethod
+    def percentiles(samples):
+        """Return the p50, p95, p99 (nearest rank) and max of the samples.
+
+        Returns:
+            dict: All 0.0 when there are no samples.
+        """
+        ordered = sorted(samples)
+        if not ordered:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+        def rank(p):
+            return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+        return {"p50": rank(50), "p95": rank(95), "p99": rank(99), "max": ordered[-1]}
+
+    @staticmethod
+    def callback_name(callback):
+        """A readable name for a callback, e.g. "VideoView.update_display"."""
+        while isinstance(callback, partial):
+            callback = callback.func
+        return getattr(callback, "__qualname__", None) or repr(callback)
+
+    def _watch_for_stalls(self):
+        """Watchdog thread: capture the main thread's stack while it stalls."""
+        period = max(self.stall_threshold / 4000, 0.005)
+        while not self._stop_watchdog.wait(period):
+            for running in self._running[-1:]:  # Innermost callback, if any
+                if running[3] is not None:
+                    continue
+                if (time.perf_counter() - running[2]) * 1000 > self.stall_threshold:
+                    frame = sys._current_frames().get(self._main_thread_id)
+                    if frame is not None:
+                        running[3] = traceback.format_stack(frame)
+
+
+class MainThreadOverlay(Label):
+    """A label over the top-right corner of a window showing profiler stats.
+
+    Refreshed every `refresh_delay` ms from `MainThreadProfiler.stats`.
+    """
+
+    def __init__(self, profiler, refresh_delay=500, **kwargs):
+        super().__init__(text="", **kwargs)
+        self.profiler = profiler
+        self.refresh_delay = refresh_delay
+
+    def place_over(self, parent):
+        """Create the label over the top-right corner of the parent."""
+        self.create_widget(master=parent.widget)
+        self.parent = parent
+        self._bind_destroy_cancel()
+        self.widget.place(relx=1.0, x=-8, y=8, anchor="ne")
+        self.refresh()
+
+    def refresh(self):
+        """Show the current stats, and schedule the next refresh."""
+        stats = self.profiler.stats()
+        lines = []
+        for category in self.profiler.categories:
+            run_ms = stats[category]["run_ms"]
+            lines.append(
+                f"{category}: {stats[category]['count']} "
+                f"p50 {run_ms['p50']:.1f} p95 {run_ms['p95']:.1f} "
+                f"p99 {run_ms['p99']:.1f} ms"
+            )
+        lines.append(f"stalls: {stats['stall_count']}")
+        self.text = "\n".join(lines)
+        self.after(self.refresh_delay, self.refresh)
@@ -23,6 +23,7 @@ class ProgressBar(Base):
         Base.__init__(self)
         self.maximum = maximum
         self.mode = mode
+        self._animation = None
 
     def create_widget(self, master):
         """Create the underlying ttk.Progressbar widget."""
@@ -81,12 +82,35 @@ class ProgressBar(Base):
         self.value = new_value
 
     def start(self, interval=50):
-        """Start the indeterminate progress animation."""
-        self.widget.start(interval)
+        """Start the progress animation, advancing every `interval` ms.
+
+        The animation is driven by the App frame clock (see
+        `add_frame_callback`), so it pauses while the bar is not on screen.
+        Without an App (a bare Tk root), ttk animates the bar itself.
+        """
+        from .app import App
+
+        if App.app is None:
+            self.widget.start(interval)
+        elif self._animation is None:
+            self._animation = self.add_frame_callback(
+                self._advance_animation, rate=1000 / interval
+            )
 
     def stop(self):
-        """Stop the indeterminate progress animation."""
-        self.widget.stop()
+        """Stop the progress animation."""
+        if self._animation is not None:
+            animation, self._animation = self._animation, None
+            self.remove_frame_callback(animation)
+        elif self.widget is not None:
+            self.widget.stop()
+
+    def _advance_animation(self):
+        """Frame callback of `start`: move the bar like ttk's own animation."""
+        if self.mode == "indeterminate":
+            self.widget.step()
+        else:
+            self.step(1)
 
 
 class ProgressWindow(Dialog):
@@ -9,17 +9,59 @@ expose functions with the ``@app.remote`` decorator and serve them with
     far = mytk.connect("192.168.1.5", 9000)
     far.blabla(1, 2)
 
+Several calls can be sent in one request, and run in one go on the app's
+main thread::
+
+    with far.batch() as batch:
+        batch.set_power(1)
+        batch.move(3)
+
+Values the app publishes are pushed to subscribers, without polling::
+
+    for topic, value in mytk.subscribe(["power"], max_rate=10):
+        print(topic, value)
+
 The transport is stdlib XML-RPC, so arguments and return values must be
 XML-RPC serializable (numbers, str, bool, None, list, dict).
 """
 
+import asyncio
+import atexit
+import http.client
+import json
+import queue
+import select
+import socket
+import threading
+import time
+import warnings
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from contextlib import aclosing, closing, suppress
+from functools import partial
+from urllib.parse import urlencode
+
+from . import binaryrpc
+from .remotecontrollable import EVENTS_PATH
+
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8777
 
 # Methods every RemoteControllable server auto-exposes (see start_remote); they
 # are not listed by remote_signatures (which reports user functions only), so
 # the client must treat them as always available.
-BUILTIN_REMOTE_METHODS = ("remote_signatures", "remote_app_name")
+BUILTIN_REMOTE_METHODS = (
+    "remote_signatures",
+    "remote_api",
+    "remote_app_name",
+    "remote_transports",
+    "remote_topics",
+    "remote_stats",
+    "main_thread_stats",
+)
+
+TRANSPORTS = ("xmlrpc", "binary")
 
 
 class RemoteAppMismatch(Exception):
@@ -30,7 +72,334 @@ class RemoteAppMismatch(Exception):
     """
 
 
-def connect(host=DEFAULT_HOST, port=DEFAULT_PORT, app_name=None):
+class ConnectionPool:
+    """Idle HTTP connections to remote apps, kept open to be reused.
+
+    Connections are kept per server (``"host:port"``), so every proxy to the
+    same app shares them: after the first call, calls do not pay for a new
+    TCP connection. Thread-safe; each call uses its own connection, so
+    several threads can call the same app concurrently.
+
+    The server closes the connections it has kept idle for its
+    ``keep_alive_timeout`` (15 s by default). A connection idle for longer
+    than `max_idle_time`, or already closed by the server, is therefore not
+    reused.
+
+    Attributes:
+        max_idle (int): Maximum number of idle connections kept per server.
+        max_idle_time (float): Time (s) after which an idle connection is
+            closed instead of reused. Keep it below the keep-alive timeout of
+            the servers.
+        timeout (float | None): Socket timeout (s) of new connections.
+    """
+
+    def __init__(self, max_idle=8, max_idle_time=10, timeout=None):
+        self.max_idle = max_idle
+        self.max_idle_time = max_idle_time
+        self.timeout = timeout
+        self._idle = {}  # host -> [(connection, time released)], oldest first
+        self._lock = threading.Lock()
+
+    def acquire(self, host):
+        """Return an idle connection to `host` ("host:port"), or a new one."""
+        stale = []
+        connection = None
+        with self._lock:
+            idle = self._idle.get(host)
+            while idle:
+                candidate, released = idle.pop()
+                if (time.monotonic() - released > self.max_idle_time
+                        or self._is_closed(candidate)):
+                    stale.append(candidate)
+                else:
+                    connection = candidate
+                    break
+        for candidate in stale:
+            candidate.close()
+        return connection or self.connect(host)
+
+    def connect(self, host):
+        """Return a new connection to `host` ("host:port"), not from the pool."""
+        return http.client.HTTPConnection(host, timeout=self.timeout)
+
+    def release(self, host, connection):
+        """Give back a connection after a complete request and response."""
+        with self._lock:
+            idle = self._idle.setdefault(host, [])
+            if len(idle) < self.max_idle:
+                idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def clear(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    @staticmethod
+    def _is_closed(connection):
+        """Whether the server has closed an idle connection.
+
+        Its socket is then readable (at EOF), while an idle connection has
+        nothing to read.
+        """
+        if connection.sock is None:
+            return False  # Not connected yet
+        try:
+            readable, _, _ = select.select([connection.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+
+connection_pool = ConnectionPool()
+atexit.register(connection_pool.clear)
+
+
+class PooledTransport(xmlrpc.client.Transport):
+    """XML-RPC transport taking its connections from a `ConnectionPool`.
+
+    The stdlib transport keeps a single connection, which cannot be used by
+    two threads at once. This one checks a connection out of the pool for the
+    duration of each request, and gives it back, still open, afterwards.
+    """
+
+    def __init__(self, pool=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool or connection_pool
+        self._local = threading.local()
+
+    def request(self, host, handler, request_body, verbose=False):
+        """Send a request on a connection of the pool, and give it back."""
+        chost, self._extra_headers, _ = self.get_host_info(host)
+        self._local.host = chost
+        self._local.connection = None
+        self._local.reconnect = False
+        try:
+            response = super().request(host, handler, request_body, verbose)
+        except xmlrpc.client.Fault:
+            # The call failed, not the connection: the response was read
+            self._release(chost)
+            raise
+        except BaseException:
+            self.close()
+            raise
+        self._release(chost)
+        return response
+
+    def _release(self, chost):
+        connection, self._local.connection = self._local.connection, None
+        if connection is not None:
+            self.pool.release(chost, connection)
+
+    def make_connection(self, host):
+        """Return the connection of the current request.
+
+        It comes from the pool, or is a new one when the stdlib retries after
+        a connection error.
+        """
+        if self._local.connection is None:
+            if getattr(self._local, "reconnect", False):
+                self._local.connection = self.pool.connect(self._local.host)
+            else:
+                self._local.connection = self.pool.acquire(self._local.host)
+        return self._local.connection
+
+    def close(self):
+        """Close the connection of the current request, after an error."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            self._local.reconnect = True  # Do not retry on another pooled one
+            connection.close()
+
+
+class RemoteBatch:
+    """Calls recorded to be sent to a remote app in a single request.
+
+    Obtained from :meth:`RemoteServerProxy.batch` or
+    :meth:`RemoteAppProxy.batch`, and used as a context manager: calls made
+    on it inside the block are only recorded, and sent together when the
+    block exits. The server runs them one after the other in a single task
+    on its main thread::
+
+        with mytk.remote_app.batch() as batch:
+            batch.set_power(1)
+            batch.move(3)
+            batch.status()
+        power, position, status = batch.results
+
+    Attributes:
+        results (list | None): After the block, the result of each call in
+            order, or the `xmlrpc.client.Fault` of a call that failed.
+    """
+
+    def __init__(self, proxy, signatures=None, raise_on_fault=True):
+        """Prepares an empty batch for the remote app behind `proxy`.
+
+        Args:
+            proxy (xmlrpc.client.ServerProxy): Proxy of the remote app.
+            signatures (dict, optional): The app's ``remote_signatures``; if
+                given, calls to names not exposed raise AttributeError when
+                recorded.
+            raise_on_fault (bool): When the batch is sent, raise the first
+                fault instead of only storing it in `results`.
+        """
+        self._proxy = proxy
+        self._signatures = signatures
+        self._raise_on_fault = raise_on_fault
+        self._calls = []
+        self.results = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        signatures = self.__dict__.get("_signatures")
+        if signatures is not None and name not in signatures and name not in BUILTIN_REMOTE_METHODS:
+            raise AttributeError(f"{name!r} is not exposed by the remote app.")
+
+        def record(*args):
+            self._calls.append({"methodName": name, "params": list(args)})
+
+        return record
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
+    def send(self):
+        """Send the recorded calls and return their results (see `results`).
+
+        Raises:
+            xmlrpc.client.Fault: If a call failed and ``raise_on_fault`` is True.
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            self.results = []
+            return self.results
+
+        responses = getattr(self._proxy, "system.multicall")(calls)
+        self.results = [
+            xmlrpc.client.Fault(response["faultCode"], response["faultString"])
+            if isinstance(response, dict)
+            else response[0]
+            for response in responses
+        ]
+        if self._raise_on_fault:
+            for result in self.results:
+                if isinstance(result, xmlrpc.client.Fault):
+                    raise result
+        return self.results
+
+
+class RemoteServerProxy(xmlrpc.client.ServerProxy):
+    """The proxy returned by :func:`connect`, which can also send batches.
+
+    A `ServerProxy` that sends batches of calls with :meth:`batch`.
+
+    A remote function named ``batch`` is shadowed by this method; call it with
+    ``proxy.__getattr__("batch")()``.
+    """
+
+    def batch(self, raise_on_fault=True):
+        """Return a `RemoteBatch` to record calls sent in a single request."""
+        return RemoteBatch(self, raise_on_fault=raise_on_fault)
+
+
+class BinaryServerProxy:
+    """Proxy sending its calls with the binary transport of :mod:`mytk.binaryrpc`.
+
+    Returned by ``connect(..., transport="binary")``; used like the XML-RPC
+    proxy, but arguments and results can also be NumPy arrays and bytes,
+    sent as raw buffers; the arrays received are views on the received
+    message, which is not copied. Connections come from the same `ConnectionPool` as the XML-RPC proxies.
+
+    As with `xmlrpc.client.ServerProxy`, ``proxy("close")()`` closes the
+    proxy instead of calling a remote function named ``close``.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, pool=None):
+        self._address = f"{host}:{port}"
+        self._pool = pool or connection_pool
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _BinaryMethod(self._request, name)
+
+    def __call__(self, attr):
+        """Return ``close`` (a no-op), as `xmlrpc.client.ServerProxy` does."""
+        if attr == "close":
+            return lambda: None  # Connections belong to the pool
+        raise AttributeError(f"Attribute {attr!r} not found")
+
+    def __repr__(self):
+        return f"<BinaryServerProxy for {self._address}>"
+
+    def batch(self, raise_on_fault=True):
+        """Return a `RemoteBatch` to record calls sent in a single request."""
+        return RemoteBatch(self, raise_on_fault=raise_on_fault)
+
+    def _request(self, method, params):
+        chunks, length = binaryrpc.encode_request(method, params)
+        headers = {
+            "Content-Type": binaryrpc.CONTENT_TYPE,
+            "Content-Length": str(length),
+        }
+        for attempt in (0, 1):
+            if attempt:
+                connection = self._pool.connect(self._address)
+            else:
+                connection = self._pool.acquire(self._address)
+            try:
+                connection.request("POST", binaryrpc.BINARY_PATH, chunks, headers)
+                response = connection.getresponse()
+                length = int(response.getheader("Content-Length", 0))
+                body = binaryrpc.read_body(response, length)
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    ConnectionAbortedError, BrokenPipeError):
+                connection.close()
+                if attempt:
+                    raise
+                continue  # A kept-alive connection closed by the server: retry once
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.status != 200:
+                connection.close()
+                raise xmlrpc.client.ProtocolError(
+                    self._address + binaryrpc.BINARY_PATH,
+                    response.status,
+                    response.reason,
+                    response.msg,
+                )
+            self._pool.release(self._address, connection)
+            return binaryrpc.decode_response(body)
+
+
+class _BinaryMethod:
+    """A remote function of a `BinaryServerProxy`; supports dotted names."""
+
+    def __init__(self, request, name):
+        self._request = request
+        self._name = name
+
+    def __getattr__(self, name):
+        return _BinaryMethod(self._request, f"{self._name}.{name}")
+
+    def __call__(self, *args):
+        return self._request(self._name, args)
+
+
+def connect(host=DEFAULT_HOST, port=DEFAULT_PORT, app_name=None, transport="xmlrpc"):
     """Return a proxy to a myTk remote server.
 
     Exposed functions are called as attributes of the proxy::
@@ -38,23 +407,57 @@ def connect(host=DEFAULT_HOST, port=DEFAULT_PORT, app_name=None):
         proxy = connect("127.0.0.1", 8777)
         proxy.blabla(1, 2)
 
+    Connections are kept alive and shared by every proxy to the same server
+    (see `ConnectionPool`), so calling `connect()` again, or calling from
+    several threads, is cheap.
+
+    With ``transport="binary"``, calls are sent with :mod:`mytk.binaryrpc`
+    instead of XML-RPC, so NumPy arrays and bytes can be passed and returned
+    as raw buffers, e.g. camera frames::
+
+        camera = connect("192.168.1.5", 9000, transport="binary")
+        frame = camera.last_frame()   # numpy.ndarray
+
+    The server is asked first which transports it accepts; a server that
+    does not accept the binary transport is used with XML-RPC, with a warning.
+
     Args:
         host (str): Server host. Defaults to localhost.
         port (int): Server port. Defaults to 8777.
         app_name (str, optional): If given, verify the server reports this name
             and raise :class:`RemoteAppMismatch` otherwise. Useful when several
             apps run on the same machine.
+        transport (str): ``"xmlrpc"`` or ``"binary"``.
 
     Returns:
-        xmlrpc.client.ServerProxy: A proxy whose attribute calls become
-        remote calls.
+        RemoteServerProxy | BinaryServerProxy: A proxy whose attribute calls
+        become remote calls, and whose ``batch()`` sends several calls at once.
 
     Raises:
         RemoteAppMismatch: If ``app_name`` is given and does not match.
+        ValueError: If the transport is unknown.
     """
-    from xmlrpc.client import ServerProxy
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport {transport!r}, use one of {TRANSPORTS}")
+
+    proxy = RemoteServerProxy(
+        f"http://{host}:{port}/", allow_none=True, transport=PooledTransport()
+    )
+    if transport == "binary":
+        try:
+            accepted = proxy.remote_transports()
+        except xmlrpc.client.Fault:  # Server older than the binary transport
+            accepted = ["xmlrpc"]
+        if "binary" in accepted:
+            proxy = BinaryServerProxy(host, port)
+        else:
+            warnings.warn(
+                f"The app at {host}:{port} does not accept the binary "
+                "transport: using XML-RPC",
+                RuntimeWarning,
+                stacklevel=2,
+            )
 
-    proxy = ServerProxy(f"http://{host}:{port}/", allow_none=True)
     if app_name is not None:
         actual = proxy.remote_app_name()
         if actual != app_name:
@@ -65,23 +468,411 @@ def connect(host=DEFAULT_HOST, port=DEFAULT_PORT, app_name=None):
     return proxy
 
 
+class RemoteSubscription:
+    """The values a remote app publishes on some topics, as they change.
+
+    Returned by :func:`subscribe`. Iterating gives ``(topic, value)`` pairs,
+    blocking until the app publishes; it stops when the app closes the
+    connection. The app pushes the events (see
+    :meth:`~mytk.remotecontrollable.RemoteControllable.publish`), so there is
+    no polling::
+
+        with mytk.subscribe(["power", "position"], max_rate=10) as updates:
+            for topic, value in updates:
+                print(topic, value)
+
+    Can be closed from another thread to stop an iteration in progress.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, topics=None,
+                 max_rate=None, timeout=None):
+        query = {}
+        if topics is not None:
+            query["topics"] = ",".join(topics)
+        if max_rate is not None:
+            query["max_rate"] = max_rate
+        path = EVENTS_PATH + (f"?{urlencode(query)}" if query else "")
+
+        self._connection = http.client.HTTPConnection(host, port, timeout=timeout)
+        self._connection.request("GET", path, headers={"Accept": "text/event-stream"})
+        self._socket = self._connection.sock
+        self._response = self._connection.getresponse()
+        if self._response.status != 200:
+            self.close()
+            raise xmlrpc.client.ProtocolError(
+                f"{host}:{port}{path}",
+                self._response.status,
+                self._response.reason,
+                self._response.msg,
+            )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        topic, data = None, []
+        while True:
+            try:
+                line = self._response.readline()
+            except (OSError, ValueError):  # Closed from another thread
+                line = b""
+            if not line:
+                raise StopIteration
+
+            line = line.decode().rstrip("\r\n")
+            if not line:  # End of an event
+                if data:
+                    return topic or "message", json.loads("\n".join(data))
+                topic = None
+            elif not line.startswith(":"):  # Lines starting with ":" are comments
+                field, _, value = line.partition(":")
+                value = value.removeprefix(" ")
+                if field == "event":
+                    topic = value
+                elif field == "data":
+                    data.append(value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unsubscribe, closing the connection."""
+        if self._socket is not None:
+            with suppress(OSError):
+                self._socket.shutdown(socket.SHUT_RDWR)
+        self._connection.close()
+        self._response.close()
+
+
+def subscribe(topics=None, host=DEFAULT_HOST, port=DEFAULT_PORT, max_rate=None,
+              timeout=None):
+    """Subscribe to topics published by a remote app, instead of polling it.
+
+    Args:
+        topics (list[str], optional): Topics to receive; all of them if None.
+            ``remote_topics()`` lists the topics published so far.
+        host (str): Server host. Defaults to localhost.
+        port (int): Server port. Defaults to 8777.
+        max_rate (float, optional): Maximum events per second for each topic;
+            faster changes are coalesced, and only the latest value is sent.
+            Capped, and defaulted, by the app's ``remote_publisher.max_rate``.
+        timeout (float, optional): Time (s) to wait for an event before
+            raising TimeoutError. The app sends a heartbeat every 15 s
+            without events; None waits forever.
+
+    Returns:
+        RemoteSubscription: An iterator of ``(topic, value)`` pairs.
+    """
+    return RemoteSubscription(host, port, topics, max_rate, timeout)
+
+
 DEFAULT_SERVICE_TYPE = "_mytk._tcp.local."
 
+# (app_name, service_type) -> (host, port, expiry): where discover() last found
+# an app, so that calling it again does not browse the network again.
+_discovery_cache = {}
+_discovery_lock = threading.Lock()
+
+
+def clear_discovery_cache():
+    """Forget the servers found by :func:`discover`."""
+    with _discovery_lock:
+        _discovery_cache.clear()
+
+
+def _cached_discovery(app_name, service_type, transport):
+    """Return a proxy to the cached server of `app_name`.
+
+    Returns None if it is not cached or does not answer.
+    """
+    key = (app_name, service_type)
+    with _discovery_lock:
+        host, port, expiry = _discovery_cache.get(key, (None, None, 0))
+    if time.monotonic() >= expiry:
+        return None
+    try:
+        proxy = connect(host, port, app_name, transport=transport)
+        if app_name is None:
+            proxy.remote_app_name()  # connect() did not reach the server
+        return proxy
+    except (OSError, RemoteAppMismatch, xmlrpc.client.Error):
+        with _discovery_lock:  # The app moved or quit: browse again
+            _discovery_cache.pop(key, None)
+        return None
+
+
+def _cache_discovery(app_name, service_type, server, cache_ttl):
+    """Remember where `app_name` was found, for `cache_ttl` seconds."""
+    with _discovery_lock:
+        _discovery_cache[(app_name, service_type)] = (
+            server["host"],
+            server["port"],
+            time.monotonic() + cache_ttl,
+        )
+
+
+def _import_zeroconf():
+    """Return the `Zeroconf` and `ServiceBrowser` classes of ``zeroconf``."""
+    try:
+        from zeroconf import ServiceBrowser, Zeroconf
+    except ImportError as err:
+        raise ImportError(
+            "Discovering remote apps needs the 'zeroconf' package. Install it "
+            "with 'pip install zeroconf'."
+        ) from err
+    return Zeroconf, ServiceBrowser
+
+
+class _ServiceListener:
+    """Zeroconf listener reporting the changes of the services.
+
+    Calls ``on_change(name, info)`` when a service is added or updated, and
+    ``on_change(name, None)`` when it is removed.
+    """
+
+    def __init__(self, on_change):
+        self.on_change = on_change
+
+    def add_service(self, zc, type_, name):
+        info = zc.get_service_info(type_, name)
+        if info is not None:
+            self.on_change(name, info)
+
+    def update_service(self, zc, type_, name):
+        self.add_service(zc, type_, name)
+
+    def remove_service(self, zc, type_, name):
+        self.on_change(name, None)
+
+
+def _server_description(name, info):
+    """Return the :func:`browse` entry of a service, or None if it has no address."""
+    addresses = info.parsed_addresses()
+    if not addresses:
+        return None
+    properties = {
+        key.decode(): (value or b"").decode() for key, value in info.properties.items()
+    }
+    return {
+        "app": properties.get("app"),
+        "host": addresses[0],
+        "port": info.port,
+        "service": name,
+    }
+
+
+class RemoteServiceBrowser:
+    """Follows the myTk remote servers advertised on the local network.
+
+    A single instance, returned by :func:`service_browser`, is shared by the
+    whole process: it owns one `Zeroconf` instance, browses each service
+    type once, and keeps the servers currently advertised. Discovering an
+    app that was already seen is therefore immediate, and servers are
+    reported as soon as they are advertised, instead of after a fixed delay.
+
+    Servers are delivered to listeners (see :meth:`add_listener`) or through
+    :meth:`iter_servers`. Listeners are called on a zeroconf thread.
+
+    Requires the optional ``zeroconf`` package. Unlike the server side, this
+    is imported directly (not through ``ModulesManager``) because a client
+    is often a plain script with no Tk root, so a dialog-based installer
+    would be wrong here; a clear ImportError is raised instead.
+    """
+
+    def __init__(self):
+        zeroconf_class, self._ServiceBrowser = _import_zeroconf()
+        self.zeroconf = zeroconf_class()
+        self._browsers = {}  # service_type -> ServiceBrowser
+        self._servers = {}  # service_type -> {service name: server}
+        self._listeners = {}  # service_type -> [callback]
+        self._lock = threading.RLock()
+
+    def servers(self, service_type=DEFAULT_SERVICE_TYPE):
+        """Return the servers currently known, and start browsing if needed."""
+        self._browse(service_type)
+        with self._lock:
+            return list(self._servers[service_type].values())
+
+    def add_listener(self, callback, service_type=DEFAULT_SERVICE_TYPE):
+        """Call ``callback(server)`` for each server, as it is advertised.
+
+        The servers already known are given right away. A server can be
+        given again when its advertisement is updated.
 
-def discover(app_name=None, service_type=DEFAULT_SERVICE_TYPE, timeout=3.0):
+        Args:
+            callback (callable): Called with the server, as described in
+                :func:`browse`, on the calling thread for the servers
+                already known and on a zeroconf thread for the next ones.
+            service_type (str): DNS-SD service type to browse.
+        """
+        with self._lock:
+            self._listeners.setdefault(service_type, []).append(callback)
+            known = list(self._servers.get(service_type, {}).values())
+        for server in known:
+            callback(server)
+        self._browse(service_type)
+
+    def remove_listener(self, callback, service_type=DEFAULT_SERVICE_TYPE):
+        """Stop calling a callback given to :meth:`add_listener`."""
+        with self._lock:
+            listeners = self._listeners.get(service_type, [])
+            if callback in listeners:
+                listeners.remove(callback)
+
+    def iter_servers(
+        self, service_type=DEFAULT_SERVICE_TYPE, timeout=3.0, expected_count=None,
+        until=None,
+    ):
+        """Yield the servers as they are advertised (see :func:`iter_servers`)."""
+        received = queue.SimpleQueue()
+        self.add_listener(received.put, service_type)
+        try:
+            yield from _servers_until(
+                lambda remaining: received.get(timeout=remaining),
+                timeout, expected_count, until,
+            )
+        finally:
+            self.remove_listener(received.put, service_type)
+
+    def close(self):
+        """Stop browsing and close the Zeroconf instance."""
+        with self._lock:
+            self._browsers.clear()
+            self._servers.clear()
+            self._listeners.clear()
+        self.zeroconf.close()
+
+    def _browse(self, service_type):
+        """Start browsing for a service type, once."""
+        with self._lock:
+            if service_type in self._browsers:
+                return
+            self._browsers[service_type] = None
+            self._servers[service_type] = {}
+        listener = _ServiceListener(partial(self._service_changed, service_type))
+        browser = self._ServiceBrowser(self.zeroconf, service_type, listener)
+        with self._lock:
+            self._browsers[service_type] = browser
+
+    def _service_changed(self, service_type, name, info):
+        """Zeroconf thread: record the service, and tell the listeners."""
+        server = None if info is None else _server_description(name, info)
+        with self._lock:
+            servers = self._servers.setdefault(service_type, {})
+            if server is None:
+                servers.pop(name, None)
+                return
+            servers[name] = server
+            listeners = list(self._listeners.get(service_type, []))
+        for listener in listeners:
+            listener(server)
+
+
+def _servers_until(next_server, timeout, expected_count=None, until=None):
+    """Yield the servers from ``next_server(remaining_time)``, once each.
+
+    ``next_server`` raises `queue.Empty` on timeout. Stops at the first of
+    the stop conditions.
+    """
+    seen = set()
+    deadline = time.monotonic() + timeout
+    while (remaining := deadline - time.monotonic()) > 0:
+        try:
+            server = next_server(remaining)
+        except queue.Empty:
+            return
+        key = (server["service"], server["host"], server["port"])
+        if key in seen:
+            continue
+        seen.add(key)
+        yield server
+        if expected_count is not None and len(seen) >= expected_count:
+            return
+        if until is not None and until(server):
+            return
+
+
+_service_browser = None
+_service_browser_lock = threading.Lock()
+
+
+def service_browser():
+    """Return the `RemoteServiceBrowser` shared by the process.
+
+    Raises:
+        ImportError: If the ``zeroconf`` package is not installed.
+    """
+    global _service_browser
+    with _service_browser_lock:
+        if _service_browser is None:
+            _service_browser = RemoteServiceBrowser()
+        return _service_browser
+
+
+def close_service_browser():
+    """Close the shared `RemoteServiceBrowser`, forgetting the servers seen.
+
+    A new one is started by the next discovery.
+    """
+    global _service_browser
+    with _service_browser_lock:
+        browser, _service_browser = _service_browser, None
+    if browser is not None:
+        browser.close()
+
+
+atexit.register(close_service_browser)
+
+
+def iter_servers(
+    service_type=DEFAULT_SERVICE_TYPE, timeout=3.0, expected_count=None, until=None
+):
+    """Yield the myTk remote servers of the local network as they appear.
+
+    The servers already seen by the process are yielded right away, then the
+    others as they are advertised. Stops after ``timeout``, or earlier when
+    ``expected_count`` servers were yielded or ``until`` is satisfied::
+
+        for server in mytk.iter_servers(expected_count=3):
+            print(server["app"], server["host"], server["port"])
+
+    Args:
+        service_type (str): DNS-SD service type to browse. Must match what the
+            servers advertised.
+        timeout (float): Maximum time (s) to wait for the servers.
+        expected_count (int, optional): Stop after this many servers.
+        until (callable, optional): Stop after the server for which
+            ``until(server)`` is true.
+
+    Yields:
+        dict: The servers, as described in :func:`browse`, once each.
+
+    Raises:
+        ImportError: If the ``zeroconf`` package is not installed.
+    """
+    yield from service_browser().iter_servers(service_type, timeout, expected_count, until)
+
+
+def discover(
+    app_name=None,
+    service_type=DEFAULT_SERVICE_TYPE,
+    timeout=3.0,
+    cache_ttl=30.0,
+    transport="xmlrpc",
+):
     """Find a myTk remote server on the local network and connect to it.
 
     Browses for services advertised by :meth:`~mytk.remotecontrollable.RemoteControllable.advertise_remote`
-    and returns a proxy to the first match, so callers never need a hard-coded
-    host or port::
+    and returns a proxy to the first match, as soon as it is advertised, so
+    callers never need a hard-coded host or port::
 
         far = mytk.discover(app_name="Microscope")
         far.turn_on()
 
-    Requires the optional ``zeroconf`` package. Unlike the server side, this is
-    imported directly (not through ``ModulesManager``) because a client is often
-    a plain script with no Tk root, so a dialog-based installer would be wrong
-    here; a clear ImportError is raised instead if the package is missing.
+    Requires the optional ``zeroconf`` package (see `RemoteServiceBrowser`).
 
     Args:
         app_name (str, optional): If given, only match a server advertising this
@@ -90,6 +881,11 @@ def discover(app_name=None, service_type=DEFAULT_SERVICE_TYPE, timeout=3.0):
         service_type (str): DNS-SD service type to browse. Must match what the
             server advertised.
         timeout (float): Seconds to wait for an advertisement before giving up.
+        cache_ttl (float): Seconds during which the address found is reused
+            by the next calls, without browsing again. The cached address is
+            dropped, and the network browsed, if it cannot be reached. 0
+            disables the cache.
+        transport (str): ``"xmlrpc"`` or ``"binary"`` (see :func:`connect`).
 
     Returns:
         xmlrpc.client.ServerProxy: A proxy to the discovered server, as returned
@@ -99,51 +895,21 @@ def discover(app_name=None, service_type=DEFAULT_SERVICE_TYPE, timeout=3.0):
         ImportError: If the ``zeroconf`` package is not installed.
         TimeoutError: If no matching service appears within ``timeout``.
     """
-    import time
+    if cache_ttl > 0:
+        proxy = _cached_discovery(app_name, service_type, transport)
+        if proxy is not None:
+            return proxy
 
-    try:
-        from zeroconf import ServiceBrowser, Zeroconf
-    except ImportError as err:
-        raise ImportError(
-            "discover() needs the 'zeroconf' package. Install it with "
-            "'pip install zeroconf'."
-        ) from err
+    def is_match(server):
+        return app_name is None or server["app"] == app_name
 
-    found = {}
-
-    class _Listener:
-        def add_service(self, zc, type_, name):
-            info = zc.get_service_info(type_, name)
-            if info is not None:
-                found[name] = info
-
-        def update_service(self, zc, type_, name):
-            info = zc.get_service_info(type_, name)
-            if info is not None:
-                found[name] = info
-
-        def remove_service(self, zc, type_, name):
-            found.pop(name, None)
-
-    zc = Zeroconf()
-    ServiceBrowser(zc, service_type, _Listener())
-    try:
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            for info in list(found.values()):
-                properties = {
-                    key.decode(): (value or b"").decode()
-                    for key, value in info.properties.items()
-                }
-                if app_name is not None and properties.get("app") != app_name:
-                    continue
-                addresses = info.parsed_addresses()
-                if not addresses:
-                    continue
-                return connect(addresses[0], info.port, app_name)
-            time.sleep(0.05)
-    finally:
-        zc.close()
+    with closing(iter_servers(service_type, timeout, until=is_match)) as servers:
+        for server in servers:
+            if is_match(server):
+                proxy = connect(server["host"], server["port"], app_name, transport=transport)
+                if cache_ttl > 0:
+                    _cache_discovery(app_name, service_type, server, cache_ttl)
+                return proxy
 
     target = f" for app {app_name!r}" if app_name is not None else ""
     raise TimeoutError(
@@ -151,25 +917,28 @@ def discover(app_name=None, service_type=DEFAULT_SERVICE_TYPE, timeout=3.0):
     )
 
 
-def browse(service_type=DEFAULT_SERVICE_TYPE, timeout=3.0):
+def browse(
+    service_type=DEFAULT_SERVICE_TYPE, timeout=3.0, expected_count=None, until=None
+):
     """List every myTk remote server advertised on the local network.
 
     Unlike :func:`discover`, which connects to the first match, this collects
-    every service seen within ``timeout`` and returns their addresses *without*
-    connecting, so a caller (or ``mytk --browse``) can show what is
-    running::
+    the services seen within ``timeout`` and returns their addresses *without*
+    connecting, so a caller can show what is running::
 
         for server in mytk.browse():
             print(server["app"], server["host"], server["port"])
 
-    Requires the optional ``zeroconf`` package, imported directly (as in
-    :func:`discover`) so a plain client script gets a clear ImportError rather
-    than a Tk install dialog.
+    Use :func:`iter_servers` to get each server as soon as it appears.
 
     Args:
         service_type (str): DNS-SD service type to browse. Must match what the
             servers advertised.
         timeout (float): Seconds to collect advertisements before returning.
+        expected_count (int, optional): Return as soon as this many servers
+            were seen.
+        until (callable, optional): Return as soon as ``until(server)`` is
+            true for a server seen.
 
     Returns:
         list[dict]: One entry per server, sorted by advertised name then
@@ -180,58 +949,232 @@ def browse(service_type=DEFAULT_SERVICE_TYPE, timeout=3.0):
     Raises:
         ImportError: If the ``zeroconf`` package is not installed.
     """
-    import time
+    servers = list(iter_servers(service_type, timeout, expected_count, until))
+    servers.sort(key=lambda server: (server["app"] or "", server["host"], server["port"]))
+    return servers
 
-    try:
-        from zeroconf import ServiceBrowser, Zeroconf
-    except ImportError as err:
-        raise ImportError(
-            "browse() needs the 'zeroconf' package. Install it with "
-            "'pip install zeroconf'."
-        ) from err
 
-    found = {}
 
-    class _Listener:
-        def add_service(self, zc, type_, name):
-            info = zc.get_service_info(type_, name)
-            if info is not None:
-                found[name] = info
+_client_executor = None
+_client_executor_lock = threading.Lock()
+
+
+def _client_pool():
+    """The thread pool running the calls of `call_many` and async proxies."""
+    global _client_executor
+    with _client_executor_lock:
+        if _client_executor is None:
+            _client_executor = ThreadPoolExecutor(
+                max_workers=32, thread_name_prefix="mytk-remote-client"
+            )
+        return _client_executor
+
+
+class AsyncRemoteProxy:
+    """Proxy whose remote calls are awaited instead of blocking.
+
+    Returned by :func:`connect_async` and :func:`discover_async`. Each call
+    runs on a shared thread pool, over the kept-alive connections of the
+    blocking `proxy`, so calls to several apps run concurrently::
+
+        async def read_all(ports):
+            proxies = [await mytk.connect_async(port=port) for port in ports]
+            return await asyncio.gather(*(proxy.status() for proxy in proxies))
+
+    Use :func:`asyncio.wait_for` to bound the time of a call. A remote
+    function named ``proxy`` is shadowed by the attribute below; call it with
+    ``proxy.__getattr__("proxy")()``.
+
+    Attributes:
+        proxy (RemoteServerProxy | BinaryServerProxy): The blocking proxy.
+    """
+
+    def __init__(self, proxy):
+        self.proxy = proxy
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        method = getattr(self.proxy, name)
+
+        async def call(*args):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_client_pool(), partial(method, *args))
+
+        return call
+
+    def __repr__(self):
+        return f"<AsyncRemoteProxy for {self.proxy!r}>"
+
+
+async def connect_async(
+    host=DEFAULT_HOST, port=DEFAULT_PORT, app_name=None, transport="xmlrpc"
+):
+    """Return an awaitable proxy to a myTk remote server.
+
+    Same as :func:`connect`, without blocking the event loop, for a client
+    written with asyncio::
+
+        microscope = await mytk.connect_async(port=9000, app_name="Microscope")
+        await microscope.turn_on()
+
+    Returns:
+        AsyncRemoteProxy: A proxy whose calls return awaitables.
+
+    Raises:
+        RemoteAppMismatch: If ``app_name`` is given and does not match.
+    """
+    loop = asyncio.get_running_loop()
+    proxy = await loop.run_in_executor(
+        _client_pool(), partial(connect, host, port, app_name, transport=transport)
+    )
+    return AsyncRemoteProxy(proxy)
+
+
+def call_many(calls, timeout=None):
+    """Call functions of several remote apps at once, and wait for all.
+
+    The calls run concurrently, so calling 10 apps takes the time of the
+    slowest call, not of the 10 calls one after the other::
+
+        results = mytk.call_many(
+            [(laser, "power"), (stage, "move", 3), (camera, "status")], timeout=2
+        )
+
+    Args:
+        calls (list[tuple]): ``(proxy, name, *args)`` for each call. The proxy
+            is any proxy returned by :func:`connect`, :func:`discover` or
+            :func:`connect_async`, or ``mytk.remote_app``.
+        timeout (float, optional): Time (s) to wait for all the calls. None
+            waits as long as needed.
+
+    Returns:
+        list: For each call, in order, its result, or the exception it raised
+        (TimeoutError if it did not return within ``timeout``; the app still
+        runs it).
+    """
+
+    def call(proxy, name, args):
+        if isinstance(proxy, AsyncRemoteProxy):
+            proxy = proxy.proxy
+        return getattr(proxy, name)(*args)
+
+    pool = _client_pool()
+    futures = [pool.submit(call, proxy, name, args) for proxy, name, *args in calls]
+
+    done, _ = wait_for_futures(futures, timeout=timeout)
+    results = []
+    for (_, name, *_args), future in zip(calls, futures, strict=True):
+        if future not in done:
+            future.cancel()
+            results.append(TimeoutError(f"{name}() did not return within {timeout}s"))
+        elif future.exception() is not None:
+            results.append(future.exception())
+        else:
+            results.append(future.result())
+    return results
+
 
-        def update_service(self, zc, type_, name):
-            info = zc.get_service_info(type_, name)
-            if info is not None:
-                found[name] = info
+async def browse_async(
+    service_type=DEFAULT_SERVICE_TYPE, timeout=3.0, expected_count=None, until=None
+):
+    """Yield the myTk remote servers of the local network as they appear.
 
-        def remove_service(self, zc, type_, name):
-            found.pop(name, None)
+    The asyncio version of :func:`iter_servers` (see it for the arguments):
+    each server is yielded as soon as it is seen, without blocking the event
+    loop::
+
+        async for server in mytk.browse_async():
+            print(server["app"], server["host"], server["port"])
 
-    zc = Zeroconf()
-    ServiceBrowser(zc, service_type, _Listener())
+    Yields:
+        dict: A server, as described in :func:`browse`, once each.
+
+    Raises:
+        ImportError: If the ``zeroconf`` package is not installed.
+    """
+    browser = service_browser()
+    loop = asyncio.get_running_loop()
+    received = asyncio.Queue()
+
+    def on_server(server):  # Called on a zeroconf thread
+        with suppress(RuntimeError):  # Loop closed
+            loop.call_soon_threadsafe(received.put_nowait, server)
+
+    browser.add_listener(on_server, service_type)
     try:
-        time.sleep(timeout)  # collect for the whole window, don't stop early
+        seen = set()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                server = await asyncio.wait_for(received.get(), remaining)
+            except TimeoutError:
+                return
+            key = (server["service"], server["host"], server["port"])
+            if key in seen:
+                continue
+            seen.add(key)
+            yield server
+            if expected_count is not None and len(seen) >= expected_count:
+                return
+            if until is not None and until(server):
+                return
     finally:
-        zc.close()
+        browser.remove_listener(on_server, service_type)
 
-    servers = []
-    for name, info in found.items():
-        addresses = info.parsed_addresses()
-        if not addresses:
-            continue
-        properties = {
-            key.decode(): (value or b"").decode()
-            for key, value in info.properties.items()
-        }
-        servers.append(
-            {
-                "app": properties.get("app"),
-                "host": addresses[0],
-                "port": info.port,
-                "service": name,
-            }
+
+async def discover_async(
+    app_name=None,
+    service_type=DEFAULT_SERVICE_TYPE,
+    timeout=3.0,
+    cache_ttl=30.0,
+    transport="xmlrpc",
+):
+    """Find a myTk remote server and connect to it, without blocking.
+
+    The asyncio version of :func:`discover` (see it for the arguments): it
+    returns as soon as a matching server is seen.
+
+    Returns:
+        AsyncRemoteProxy: An awaitable proxy to the discovered server.
+
+    Raises:
+        ImportError: If the ``zeroconf`` package is not installed.
+        TimeoutError: If no matching service appears within ``timeout``.
+    """
+    loop = asyncio.get_running_loop()
+    if cache_ttl > 0:
+        proxy = await loop.run_in_executor(
+            _client_pool(), _cached_discovery, app_name, service_type, transport
         )
-    servers.sort(key=lambda server: (server["app"] or "", server["host"], server["port"]))
-    return servers
+        if proxy is not None:
+            return AsyncRemoteProxy(proxy)
+
+    def is_match(server):
+        return app_name is None or server["app"] == app_name
+
+    async with aclosing(browse_async(service_type, timeout, until=is_match)) as servers:
+        async for server in servers:
+            if is_match(server):
+                proxy = await connect_async(
+                    server["host"], server["port"], app_name, transport=transport
+                )
+                if cache_ttl > 0:
+                    _cache_discovery(app_name, service_type, server, cache_ttl)
+                return proxy
+
+    target = f" for app {app_name!r}" if app_name is not None else ""
+    raise TimeoutError(f"No {service_type} server found{target} within {timeout}s")
+
+
+_api_cache = {}  # "host:port" -> (version, signatures)
+_api_lock = threading.Lock()
+
+
+def clear_api_cache():
+    """Forget the signatures of the remote apps kept by `RemoteAppProxy`."""
+    with _api_lock:
+        _api_cache.clear()
 
 
 class RemoteAppProxy:
@@ -241,24 +1184,29 @@ class RemoteAppProxy:
     Defaults to localhost:8777; call :meth:`configure` to target another
     server before the first call.
 
-    On first use it fetches the server's exposed API (``remote_signatures``)
-    and validates every call against it, so an unknown method raises a clear
+    On first use it fetches the server's exposed API (``remote_api``) and
+    validates every call against it, so an unknown method raises a clear
     ``AttributeError`` here instead of a cryptic XML-RPC fault when called.
+    The API is kept for the process, per server address, with its version:
+    reconnecting to the same address reuses it without a request, and it is
+    revalidated with its version (a small request, answered without the
+    signatures if they did not change) only when a name is not in it.
 
     Every attribute access that is not one of this proxy's own names is
     forwarded to the remote server, so avoid exposing remote functions literally
-    named ``host``, ``port``, ``proxy``, ``app_name``, ``signatures``, or
-    ``configure``.
+    named ``host``, ``port``, ``proxy``, ``app_name``, ``transport``,
+    ``signatures``, ``configure``, or ``batch``.
     """
 
     def __init__(self):
         self.host = DEFAULT_HOST
         self.port = DEFAULT_PORT
         self.app_name = None
+        self.transport = "xmlrpc"
         self.proxy = None
         self.signatures = None
 
-    def configure(self, host=None, port=None, app_name=None):
+    def configure(self, host=None, port=None, app_name=None, transport=None):
         """Point the proxy at a different server, dropping any open connection.
 
         Args:
@@ -266,6 +1214,8 @@ class RemoteAppProxy:
             port (int, optional): New port. Unchanged if None.
             app_name (str, optional): Expected server identity to verify on the
                 next connection. Unchanged if None.
+            transport (str, optional): ``"xmlrpc"`` or ``"binary"`` (see
+                :func:`connect`). Unchanged if None.
         """
         if host is not None:
             self.host = host
@@ -273,32 +1223,71 @@ class RemoteAppProxy:
             self.port = port
         if app_name is not None:
             self.app_name = app_name
+        if transport is not None:
+            self.transport = transport
         self.proxy = None
         self.signatures = None
 
-    def __getattr__(self, name):
-        # __getattr__ only runs for names not found normally. Dunders and other
-        # underscore-prefixed names are Python internals (copy/pickle probes),
-        # never remote calls. Reach into __dict__ for our own state so this can
-        # never recurse, even before __init__ has run.
-        if name.startswith("_"):
-            raise AttributeError(name)
+    def batch(self, raise_on_fault=True):
+        """Return a `RemoteBatch` recording calls to send in a single request.
+
+        Calls are validated against the server's API as they are recorded.
+        """
+        proxy, available = self._connected()
+        return RemoteBatch(proxy, signatures=available, raise_on_fault=raise_on_fault)
 
+    def _connected(self):
+        """Connect if needed, and return the proxy and the server's API."""
         proxy = self.__dict__.get("proxy")
         if proxy is None:
             proxy = connect(
                 self.__dict__.get("host", DEFAULT_HOST),
                 self.__dict__.get("port", DEFAULT_PORT),
                 self.__dict__.get("app_name"),
+                transport=self.__dict__.get("transport", "xmlrpc"),
             )
             self.proxy = proxy
             self.signatures = None  # refetch for the new connection
 
         available = self.__dict__.get("signatures")
         if available is None:
-            available = proxy.remote_signatures()
-            self.signatures = available
+            available = self._fetch_api(proxy)
+        return proxy, available
+
+    def _fetch_api(self, proxy, revalidate=False):
+        """Return the server's signatures, from the cache unless `revalidate`."""
+        host = self.__dict__.get("host", DEFAULT_HOST)
+        address = f"{host}:{self.__dict__.get('port', DEFAULT_PORT)}"
+        with _api_lock:
+            cached = _api_cache.get(address)
+        if cached is not None and not revalidate:
+            self.signatures = cached[1]
+            return cached[1]
+
+        try:
+            api = proxy.remote_api(cached[0] if cached is not None else None)
+        except xmlrpc.client.Fault:  # Server older than remote_api
+            api = {"version": None, "signatures": proxy.remote_signatures()}
+        if api["signatures"] is None:
+            signatures = cached[1]  # Unchanged
+        else:
+            signatures = api["signatures"]
+            with _api_lock:
+                _api_cache[address] = (api["version"], signatures)
+        self.signatures = signatures
+        return signatures
 
+    def __getattr__(self, name):
+        # __getattr__ only runs for names not found normally. Dunders and other
+        # underscore-prefixed names are Python internals (copy/pickle probes),
+        # never remote calls. Reach into __dict__ for our own state so this can
+        # never recurse, even before __init__ has run.
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        proxy, available = self._connected()
+        if name not in available and name not in BUILTIN_REMOTE_METHODS:
+            available = self._fetch_api(proxy, revalidate=True)
         if name not in available and name not in BUILTIN_REMOTE_METHODS:
             offered = sorted(set(available) | set(BUILTIN_REMOTE_METHODS))
             raise AttributeError(
@@ -1,10 +1,11 @@
 """remotecli.py — Command-line client for a RemoteControllable mytk app.
 
-Send a single call to a running app that exposed functions with
+Send a call to a running app that exposed functions with
 :class:`~mytk.remotecontrollable.RemoteControllable` and print the result::
 
     mytk "add(2, 3)"                        # the `mytk` console script
     mytk --app-name Acquisition "status()"
+    mytk "set_power(2.5)" "move(3)" "status()"   # several calls, one request
     mytk --list                             # show the exposed functions
     python -m mytk --remote "turn_on()"     # equivalent module form
     python -m mytk --remote "set_power(2.5)" --port 9000
@@ -16,6 +17,19 @@ network via mDNS/Bonjour (as published by ``advertise_remote``)::
     mytk --discover --app-name Microscope "status()"
     mytk --discover --list
     mytk --browse                           # list all apps on the network
+    mytk --browse --expect 2                # stop as soon as two are found
+
+With ``--bench``, the calls are sent repeatedly from several clients at once,
+and the throughput, the latency percentiles and, from the app's
+``remote_stats()``, where the time goes on the server are reported::
+
+    mytk --bench "status()" --concurrency 8 --duration 10
+
+With ``--transport binary``, the calls are sent with the binary transport of
+:mod:`mytk.binaryrpc` (negotiated with the app), which returns NumPy arrays
+as arrays instead of failing to convert them to XML-RPC::
+
+    mytk --transport binary "last_frame()"
 
 Arguments in the call string must be Python literals (numbers, strings,
 True/False/None, lists, dicts, tuples); a bare ``"turn_on"`` is treated as
@@ -26,16 +40,22 @@ positional arguments only.
 import argparse
 import ast
 import sys
+import threading
+import time
 import xmlrpc.client
 
+from .mainthreadprofiler import MainThreadProfiler
 from .remote import (
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_SERVICE_TYPE,
+    TRANSPORTS,
     RemoteAppMismatch,
-    browse,
+    RemoteBatch,
     connect,
+    connection_pool,
     discover,
+    iter_servers,
 )
 
 
@@ -74,6 +94,127 @@ def parse_command(command):
     return node.func.id, args
 
 
+def benchmark(call, concurrency=8, duration=10.0):
+    """Call `call()` repeatedly from several threads, and time the calls.
+
+    Args:
+        call (callable): Sends one request, and raises if it fails.
+        concurrency (int): Number of threads calling at the same time.
+        duration (float): Time (s) during which requests are sent.
+
+    Returns:
+        dict: With keys "count" (requests sent), "errors" (requests that
+        failed), "first_error" (the first exception, or None), "elapsed_s",
+        "rate" (requests per second) and "latency_ms" ("p50", "p95", "p99"
+        and "max" of the requests that succeeded).
+    """
+    latencies = []
+    errors = []  # The first error of each thread, and the count
+    error_count = 0
+    lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = start + duration
+
+    def send_requests():
+        nonlocal error_count
+        thread_latencies = []
+        thread_errors = []
+        thread_error_count = 0
+        while time.perf_counter() < deadline:
+            request_start = time.perf_counter()
+            try:
+                call()
+            except Exception as exc:
+                thread_error_count += 1
+                if not thread_errors:
+                    thread_errors.append(exc)
+            else:
+                thread_latencies.append((time.perf_counter() - request_start) * 1000)
+        with lock:
+            latencies.extend(thread_latencies)
+            errors.extend(thread_errors)
+            error_count += thread_error_count
+
+    threads = [
+        threading.Thread(target=send_requests, name=f"mytk-bench-{i}", daemon=True)
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+    count = len(latencies) + error_count
+    return {
+        "count": count,
+        "errors": error_count,
+        "first_error": errors[0] if errors else None,
+        "elapsed_s": elapsed,
+        "rate": count / elapsed,
+        "latency_ms": MainThreadProfiler.percentiles(latencies),
+    }
+
+
+def run_benchmark(proxy, commands, calls, concurrency, duration):
+    """Benchmark the calls on `proxy` and print the report (see `benchmark`).
+
+    Several calls are sent as one batch per request, as without ``--bench``.
+    The server side of the report comes from the app's ``remote_stats()``.
+
+    Returns:
+        int: Exit code, 1 if a request failed.
+    """
+    if len(calls) == 1:
+        name, call_args = calls[0]
+        method = getattr(proxy, name)
+
+        def call():
+            method(*call_args)
+    else:
+        name = "system.multicall"
+
+        def call():
+            batch = RemoteBatch(proxy)
+            for batch_name, batch_args in calls:
+                getattr(batch, batch_name)(*batch_args)
+            batch.send()
+
+    # Keep every client's connection open between its requests
+    connection_pool.max_idle = max(connection_pool.max_idle, concurrency)
+    result = benchmark(call, concurrency, duration)
+
+    latency = result["latency_ms"]
+    print(f"{' '.join(commands)}: {concurrency} clients for {result['elapsed_s']:.1f} s")
+    print(
+        f"  {result['count']} requests, {result['errors']} errors, "
+        f"{result['rate']:.1f} requests/s"
+    )
+    print(
+        f"  latency (ms): p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  "
+        f"p99 {latency['p99']:.2f}  max {latency['max']:.2f}"
+    )
+
+    try:
+        server = proxy.remote_stats()["functions"].get(name)
+    except (xmlrpc.client.Fault, KeyError):  # App older than remote_stats
+        server = None
+    if server is not None:
+        phases = "  ".join(
+            f"{phase} {server[f'{phase}_ms']['p50']:.2f}"
+            for phase in ("read", "decode", "queue", "run", "encode", "write", "total")
+        )
+        print(f"  server p50 (ms): {phases}")
+        network = latency["p50"] - server["total_ms"]["p50"]
+        print(f"  network and client p50 (ms): {max(network, 0):.2f}")
+
+    if result["first_error"] is not None:
+        print(f"error: {result['errors']} requests failed, first: "
+              f"{result['first_error']}", file=sys.stderr)
+        return 1
+    return 0
+
+
 def build_parser(prog=None):
     """Build the argument parser for the remote command-line client."""
     parser = argparse.ArgumentParser(
@@ -82,8 +223,9 @@ def build_parser(prog=None):
     )
     parser.add_argument(
         "command",
-        nargs="?",
-        help='function call, e.g. "turn_on()" or "add(2, 3)"',
+        nargs="*",
+        help='function call, e.g. "turn_on()" or "add(2, 3)"; several calls '
+             "are sent in a single request and run in order",
     )
     parser.add_argument(
         "--host", default=DEFAULT_HOST, help=f"server host (default: {DEFAULT_HOST})"
@@ -97,6 +239,11 @@ def build_parser(prog=None):
         help="verify the server identifies as this name before calling; "
              "with --discover, also selects which advertised app to use",
     )
+    parser.add_argument(
+        "--transport", choices=TRANSPORTS, default="xmlrpc",
+        help="how calls are sent: xmlrpc, or binary to send and receive NumPy "
+             "arrays as raw bytes (default: xmlrpc)",
+    )
     parser.add_argument(
         "--discover", action="store_true",
         help="find the server on the local network via mDNS instead of "
@@ -105,7 +252,13 @@ def build_parser(prog=None):
     parser.add_argument(
         "--browse", action="store_true",
         help="list every myTk app advertised on the local network "
-             "(name and address), then exit; uses --service-type/--timeout",
+             "(name and address) as it is found, then exit; uses "
+             "--service-type/--timeout",
+    )
+    parser.add_argument(
+        "--expect", type=int, default=None, metavar="N",
+        help="with --browse, exit as soon as N apps were found instead of "
+             "waiting for --timeout",
     )
     parser.add_argument(
         "--service-type", default=DEFAULT_SERVICE_TYPE,
@@ -120,6 +273,19 @@ def build_parser(prog=None):
         "--list", action="store_true",
         help="list the exposed functions and their signatures, then exit",
     )
+    parser.add_argument(
+        "--bench", action="store_true",
+        help="send the calls repeatedly and report the throughput and "
+             "latencies, then exit",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8,
+        help="number of clients sending calls at once with --bench (default: 8)",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0,
+        help="seconds during which --bench sends calls (default: 10.0)",
+    )
     return parser
 
 
@@ -139,14 +305,18 @@ def run(argv=None, prog=None):
 
     if not args.list and not args.browse and not args.command:
         parser.error("a command is required unless --list or --browse is given")
+    if args.bench and args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
     try:
         if args.browse:
-            for server in browse(
-                service_type=args.service_type, timeout=args.timeout
+            for server in iter_servers(
+                service_type=args.service_type,
+                timeout=args.timeout,
+                expected_count=args.expect,
             ):
                 label = server["app"] or server["service"]
-                print(f"{label}\t{server['host']}:{server['port']}")
+                print(f"{label}\t{server['host']}:{server['port']}", flush=True)
             return 0
 
         if args.discover:
@@ -154,9 +324,12 @@ def run(argv=None, prog=None):
                 app_name=args.app_name,
                 service_type=args.service_type,
                 timeout=args.timeout,
+                transport=args.transport,
             )
         else:
-            proxy = connect(args.host, args.port, app_name=args.app_name)
+            proxy = connect(
+                args.host, args.port, app_name=args.app_name, transport=args.transport
+            )
 
         if args.list:
             signatures = proxy.remote_signatures()
@@ -164,11 +337,29 @@ def run(argv=None, prog=None):
                 print(f"{name}{signatures[name]}")
             return 0
 
-        name, call_args = parse_command(args.command)
-        result = getattr(proxy, name)(*call_args)
-        if result is not None:
-            print(result)
-        return 0
+        calls = [parse_command(command) for command in args.command]
+        if args.bench:
+            return run_benchmark(
+                proxy, args.command, calls, args.concurrency, args.duration
+            )
+        if len(calls) == 1:
+            name, call_args = calls[0]
+            result = getattr(proxy, name)(*call_args)
+            if result is not None:
+                print(result)
+            return 0
+
+        batch = RemoteBatch(proxy, raise_on_fault=False)
+        for name, call_args in calls:
+            getattr(batch, name)(*call_args)
+        exit_code = 0
+        for command, result in zip(args.command, batch.send(), strict=True):
+            if isinstance(result, xmlrpc.client.Fault):
+                print(f"error: {command} failed: {result.faultString}", file=sys.stderr)
+                exit_code = 1
+            elif result is not None:
+                print(result)
+        return exit_code
     except ValueError as exc:  # bad command string
         print(f"error: {exc}", file=sys.stderr)
         return 2
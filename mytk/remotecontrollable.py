@@ -24,7 +24,19 @@ Clients connect with ``mytk.connect(...)`` or ``mytk.remote_app`` (see
 :mod:`mytk.remote`), or from the command line with the ``mytk`` command /
 ``python -m mytk --remote`` (see :mod:`mytk.remotecli`). The transport is stdlib
 XML-RPC, so arguments and return values must be XML-RPC serializable (numbers,
-str, bool, None, list, dict).
+str, bool, None, list, dict). Clients connected with ``transport="binary"``
+(see :mod:`mytk.binaryrpc`) can also send and receive NumPy arrays and bytes,
+without converting them to text.
+
+Every call served is timed, per function and per phase (reading the
+request, decoding, waiting for the main thread, running, encoding, sending);
+clients read the measurements with the built-in ``remote_stats()`` (see
+:class:`RemoteCallStats`), and ``mytk --bench`` drives load to measure them.
+
+Instead of being polled, the app can push values to subscribed clients:
+``app.publish("power", 2.5)``, or ``app.publish_property("power")`` for a
+`Bindable` property (see :class:`RemotePublisher` and
+:func:`mytk.remote.subscribe`).
 
 For a free function, or to register something dynamically at runtime, the
 low-level primitive ``app.remote(fct, name=...)`` registers it directly;
@@ -33,13 +45,33 @@ feeds to it.
 
 The host class must provide ``schedule_on_main_thread`` and ``root`` (both are
 supplied by `App`): every call is marshaled onto the Tk main thread, so exposed
-functions may safely touch widgets.
+functions may safely touch widgets. Functions that never touch Tk can opt out
+with ``@remote_command(thread_safe=True)`` and run on the server thread.
 """
 
+import hashlib
+import inspect
+import json
+import select
+import socket
+import threading
+import time
+import xmlrpc.client
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from socketserver import StreamRequestHandler
+from tkinter import Variable
+from urllib.parse import parse_qs
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+from . import binaryrpc
+from .mainthreadprofiler import MainThreadProfiler
 
+EVENTS_PATH = "/events"
 
-def remote_command(fct=None, *, name=None):
+
+def remote_command(fct=None, *, name=None, thread_safe=False):
     """Mark a method for remote exposure by :class:`RemoteControllable`.
 
     A *tag* only: it records the RPC name on the function and returns it
@@ -54,7 +86,7 @@ def remote_command(fct=None, *, name=None):
             @remote_command
             def turn_on(self): ...
 
-            @remote_command(name="status")
+            @remote_command(name="status", thread_safe=True)
             def read_status(self): ...
 
     Args:
@@ -62,16 +94,642 @@ def remote_command(fct=None, *, name=None):
             ``@remote_command(name=...)``.
         name (str, optional): Name clients call it by. Defaults to the
             method's own name.
+        thread_safe (bool): Run the method directly on the server thread
+            instead of the Tk main thread (see :meth:`RemoteControllable.remote`).
 
     Returns:
         callable: The method, unchanged, so it works as a decorator.
     """
     if fct is None:
-        return lambda f: remote_command(f, name=name)
+        return lambda f: remote_command(f, name=name, thread_safe=thread_safe)
     fct._remote_name = name or fct.__name__
+    fct._remote_thread_safe = thread_safe
     return fct
 
 
+class RemoteRequestHandler(SimpleXMLRPCRequestHandler):
+    """Request handler serving one request of a keep-alive connection at a time.
+
+    `RemoteXMLRPCServer` then decides when to serve the next.
+    """
+
+    protocol_version = "HTTP/1.1"  # Keep connections alive between calls
+    timeout = 30  # Bound a request that is sent partially
+
+    def handle(self):
+        """Serve the first request; the server serves the next ones."""
+        self.close_connection = True
+        self.handle_one_request()
+
+    def handle_one_request(self):
+        """Serve one request, timing it in the `RemoteCallStats` of the server."""
+        stats = self.server.call_stats
+        stats.start_call()
+        try:
+            super().handle_one_request()
+        finally:
+            stats.end_call()
+
+    def finish(self):
+        """Leave the connection open, unlike `StreamRequestHandler`."""
+        pass  # The connection stays open: the server closes it when done
+
+    def do_GET(self):  # noqa: N802
+        """Serve a subscription to the events published, on `EVENTS_PATH`."""
+        path, _, query = self.path.partition("?")
+        publisher = getattr(self.server, "publisher", None)
+        if path != EVENTS_PATH or publisher is None:
+            self.report_404()
+            return
+        self.serve_subscription(publisher, parse_qs(query))
+
+    def serve_subscription(self, publisher, options):
+        """Hand the connection over to the publisher, as an event stream.
+
+        The connection leaves the worker pool: the publisher thread writes
+        the events to it until the client disconnects.
+
+        Args:
+            publisher (RemotePublisher): The publisher of the server.
+            options (dict): The query of the request: ``topics`` (comma
+                separated, all topics if absent) and ``max_rate`` (events
+                per second and per topic).
+        """
+        topics = None
+        if "topics" in options:
+            topics = [topic for topic in options["topics"][0].split(",") if topic]
+        try:
+            max_rate = float(options["max_rate"][0]) if "max_rate" in options else None
+        except ValueError:
+            max_rate = 0
+        if max_rate is not None and max_rate <= 0:
+            self.send_error(400, "max_rate must be a positive number")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.flush()  # Before the publisher writes to the socket
+        self.close_connection = True
+        self.detached = True  # Not closed by the server: the publisher owns it
+        publisher.subscribe(self.request, topics, max_rate)
+
+    def do_POST(self):  # noqa: N802
+        """Serve a binary call on `BINARY_PATH`, an XML-RPC call otherwise."""
+        if self.path == binaryrpc.BINARY_PATH:
+            self.serve_binary_request()
+        else:
+            super().do_POST()
+
+    def serve_binary_request(self):
+        """Serve a call encoded with `mytk.binaryrpc` instead of XML-RPC.
+
+        Dispatched like an XML-RPC call; a failure is sent back as a fault,
+        as XML-RPC does. The buffers of the response are written to the
+        socket one after the other, without being joined first.
+        """
+        stats = self.server.call_stats
+        try:
+            length = int(self.headers["content-length"])
+            body = binaryrpc.read_body(self.rfile, length)
+            stats.end_phase("read")
+            request = binaryrpc.decode_message(body)
+            method, params = request["method"], request["params"]
+            stats.end_phase("decode")
+        except Exception as err:
+            self.send_error(400, f"Invalid binary request: {err}")
+            return
+
+        try:
+            result = self.server._dispatch(method, params)
+            chunks, length = binaryrpc.encode_response(result)
+        except xmlrpc.client.Fault as fault:
+            chunks, length = binaryrpc.encode_response(fault=fault)
+        except BaseException as exc:
+            fault = xmlrpc.client.Fault(1, f"{type(exc)}:{exc}")
+            chunks, length = binaryrpc.encode_response(fault=fault)
+        stats.end_phase("encode")
+        stats.record_call()
+
+        self.send_response(200)
+        self.send_header("Content-Type", binaryrpc.CONTENT_TYPE)
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+        for chunk in chunks:
+            self.wfile.write(chunk)
+
+
+class RemoteXMLRPCServer(SimpleXMLRPCServer):
+    """XML-RPC server serving its clients concurrently on a bounded pool.
+
+    Connections are kept alive between calls (HTTP/1.1), and served by at
+    most `max_workers` threads. A worker serves one request at a time from a
+    connection: between two requests, if other connections are waiting for a
+    worker, it moves on to them and the connection waits its turn. A client
+    sending many calls, or keeping an idle connection open, therefore cannot
+    hold a worker while other clients wait. Idle connections are closed after
+    `keep_alive_timeout` seconds.
+
+    Calls to the app still run one at a time on the Tk main thread; what the
+    pool brings is that waiting for the main thread, reading requests and
+    sending responses happen concurrently for all clients.
+    """
+
+    poll_interval = 0.05  # Time (s) a worker waits on an idle connection before yielding
+
+    def __init__(self, address, max_workers=8, keep_alive_timeout=15, **kwargs):
+        kwargs.setdefault("requestHandler", RemoteRequestHandler)
+        super().__init__(address, **kwargs)
+        self.max_workers = max_workers
+        self.keep_alive_timeout = keep_alive_timeout
+        self._workers = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mytk-server-worker"
+        )
+        self.publisher = None  # A RemotePublisher serving subscriptions, if any
+        self.call_stats = RemoteCallStats()
+        self._waiting = 0  # Connections submitted to the pool, not started yet
+        self._waiting_lock = threading.Lock()
+        self._is_closed = False
+
+    def _marshaled_dispatch(self, data, dispatch_method=None, path=None):
+        """Decode an XML-RPC request, dispatch it and encode its response.
+
+        As `SimpleXMLRPCDispatcher` does, but timing each phase.
+        """
+        self.call_stats.end_phase("read")
+        try:
+            params, method = xmlrpc.client.loads(
+                data, use_builtin_types=self.use_builtin_types
+            )
+            self.call_stats.end_phase("decode")
+            if dispatch_method is not None:
+                response = dispatch_method(method, params)
+            else:
+                response = self._dispatch(method, params)
+            response = xmlrpc.client.dumps(
+                (response,), methodresponse=1, allow_none=self.allow_none,
+                encoding=self.encoding,
+            )
+        except xmlrpc.client.Fault as fault:
+            response = xmlrpc.client.dumps(
+                fault, allow_none=self.allow_none, encoding=self.encoding
+            )
+        except BaseException as exc:
+            response = xmlrpc.client.dumps(
+                xmlrpc.client.Fault(1, f"{type(exc)}:{exc}"),
+                allow_none=self.allow_none, encoding=self.encoding,
+            )
+        self.call_stats.end_phase("encode")
+        self.call_stats.record_call()
+        return response.encode(self.encoding, "xmlcharrefreplace")
+
+    def _dispatch(self, method, params):
+        """Run a registered function, timing it as the call of `method`."""
+        if method not in self.funcs:
+            return super()._dispatch(method, params)
+        self.call_stats.set_method(method)
+        try:
+            return super()._dispatch(method, params)
+        except BaseException:
+            self.call_stats.set_error()
+            raise
+        finally:
+            self.call_stats.end_dispatch()
+
+    def process_request(self, request, client_address):
+        """Serve a new connection on the worker pool."""
+        self._submit(self._start_connection, request, client_address)
+
+    def _submit(self, fct, *args):
+        with self._waiting_lock:
+            self._waiting += 1
+        try:
+            self._workers.submit(self._run_worker_task, fct, *args)
+        except RuntimeError:  # Pool shut down: the server is closing
+            with self._waiting_lock:
+                self._waiting -= 1
+
+    def _run_worker_task(self, fct, *args):
+        with self._waiting_lock:
+            self._waiting -= 1
+        fct(*args)
+
+    def _start_connection(self, request, client_address):
+        """Serve the first request of a connection, then the next ones."""
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        self._serve_connection(handler, time.monotonic())
+
+    def _serve_connection(self, handler, last_request_time):
+        """Serve the requests of a connection until it closes, or has to yield.
+
+        It yields its worker when another connection waits for one and it
+        has no request ready.
+        """
+        try:
+            while not handler.close_connection and not self._is_closed:
+                readable = self._has_buffered_request(handler)
+                if not readable:
+                    readable, _, _ = select.select(
+                        [handler.request], [], [], self.poll_interval
+                    )
+                if readable:
+                    handler.handle_one_request()
+                    last_request_time = time.monotonic()
+                elif time.monotonic() - last_request_time > self.keep_alive_timeout:
+                    break
+                elif self._waiting > 0:
+                    self._submit(self._serve_connection, handler, last_request_time)
+                    return
+        except Exception:
+            self.handle_error(handler.request, handler.client_address)
+
+        if getattr(handler, "detached", False):
+            return  # Now a subscription, served by the publisher
+        with suppress(Exception):
+            StreamRequestHandler.finish(handler)
+        self.shutdown_request(handler.request)
+
+    @staticmethod
+    def _has_buffered_request(handler):
+        """Whether the next request of a connection is already in `handler.rfile`.
+
+        Pipelined requests are read into its buffer with the previous one,
+        where select does not see them.
+        """
+        peek = getattr(handler.rfile, "peek", None)
+        if peek is None:
+            return False
+        connection = handler.connection
+        timeout = connection.gettimeout()
+        connection.setblocking(False)  # Peek without waiting for the socket
+        try:
+            return len(peek(1)) > 0
+        except OSError:
+            return False
+        finally:
+            connection.settimeout(timeout)
+
+    def server_close(self):
+        """Close the listening socket and stop serving the open connections."""
+        self._is_closed = True
+        super().server_close()
+        self._workers.shutdown(wait=False, cancel_futures=True)
+        if self.publisher is not None:
+            self.publisher.close()
+
+
+class RemoteCallStats:
+    """Counts and latency breakdown of the remote calls served, per function.
+
+    Each call is timed on the worker thread serving it, in phases:
+
+    - "read": receiving the HTTP request.
+    - "decode": decoding the arguments (XML-RPC or binary).
+    - "queue": waiting for the Tk main thread (0 for thread-safe functions).
+    - "run": running the function.
+    - "encode": encoding the result.
+    - "write": sending the response.
+    - "total": from the first byte of the request to the last byte of the
+      response.
+
+    The latency a client measures, minus "total", is the time spent on the
+    network and in the client.
+
+    A call is counted when its response is ready, before it is sent, so a
+    client asking for the stats right after a call sees it; its "write" and
+    "total" times are added once the response is sent.
+
+    Attributes:
+        window (int): Number of most recent calls of each function used for
+            the percentiles.
+    """
+
+    phases = ("read", "decode", "queue", "run", "encode", "write", "total")
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._current = threading.local()  # The call served by this thread
+        self.reset()
+
+    def reset(self):
+        """Forget every measurement."""
+        with self._lock:
+            self._functions = {}
+            self._start_time = time.monotonic()
+
+    def start_call(self):
+        """Start timing a call on the current thread."""
+        now = time.perf_counter()
+        self._current.call = {"method": None, "error": False, "start": now, "mark": now}
+
+    def end_phase(self, phase):
+        """End a phase of the current call: it lasted since the previous one."""
+        call = getattr(self._current, "call", None)
+        if call is not None:
+            now = time.perf_counter()
+            call[phase] = call.get(phase, 0) + now - call["mark"]
+            call["mark"] = now
+
+    def set_method(self, method):
+        """Name the function of the current call."""
+        call = getattr(self._current, "call", None)
+        if call is not None:
+            call["method"] = method
+
+    def set_error(self):
+        """Count the current call as failed."""
+        call = getattr(self._current, "call", None)
+        if call is not None:
+            call["error"] = True
+
+    def set_run_time(self, duration):
+        """Set the run time (s) of the current call, run on another thread.
+
+        The rest of the dispatch is then queue time.
+        """
+        call = getattr(self._current, "call", None)
+        if call is not None:
+            call["run"] = call.get("run", 0) + duration
+
+    def end_dispatch(self):
+        """End the "queue" and "run" phases of the current call."""
+        call = getattr(self._current, "call", None)
+        if call is not None:
+            now = time.perf_counter()
+            elapsed = now - call["mark"]
+            run = min(call.get("run", elapsed), elapsed)
+            call["run"] = run
+            call["queue"] = elapsed - run
+            call["mark"] = now
+
+    def record_call(self):
+        """Count the current call, and record the times of its phases up to "encode".
+
+        Only for a call of a function. Called when the response is ready to
+        be sent.
+        """
+        call = getattr(self._current, "call", None)
+        if call is None or call["method"] is None or call.get("recorded"):
+            return
+        call["recorded"] = True
+        with self._lock:
+            function = self._function(call["method"])
+            function["count"] += 1
+            function["errors"] += call["error"]
+            for phase, samples in function["samples"].items():
+                if phase not in ("write", "total"):
+                    samples.append(call.get(phase, 0) * 1000)
+
+    def end_call(self):
+        """End the current call once its response is sent.
+
+        Records the call, if `record_call` was not called, and its "write"
+        and "total" times.
+        """
+        self.record_call()
+        call = getattr(self._current, "call", None)
+        self._current.call = None
+        if call is None or call["method"] is None:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            samples = self._function(call["method"])["samples"]
+            samples["write"].append((now - call["mark"]) * 1000)
+            samples["total"].append((now - call["start"]) * 1000)
+
+    def _function(self, method):
+        """The measurements of a function; call with the lock held."""
+        function = self._functions.get(method)
+        if function is None:
+            function = {
+                "count": 0,
+                "errors": 0,
+                "samples": {phase: deque(maxlen=self.window) for phase in self.phases},
+            }
+            self._functions[method] = function
+        return function
+
+    def stats(self):
+        """Return the measurements.
+
+        Safe to call from any thread. Times are in milliseconds; the
+        percentiles cover the last `window` calls of each function.
+
+        Returns:
+            dict: With keys "elapsed_s" (time since the measurements started),
+            "count" (calls served), and "functions", a dict with, for each
+            function called, its "count", "errors", "rate" (calls per
+            second) and one key per phase ("read_ms", ..., "total_ms"), each
+            with "p50", "p95", "p99" and "max".
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._start_time
+            functions = {}
+            for name, function in self._functions.items():
+                functions[name] = {
+                    "count": function["count"],
+                    "errors": function["errors"],
+                    "rate": function["count"] / elapsed if elapsed > 0 else 0.0,
+                }
+                for phase, samples in function["samples"].items():
+                    functions[name][f"{phase}_ms"] = MainThreadProfiler.percentiles(samples)
+        return {
+            "elapsed_s": elapsed,
+            "count": sum(function["count"] for function in functions.values()),
+            "functions": functions,
+        }
+
+
+class RemotePublisher:
+    """Pushes the values published on topics to subscribed clients.
+
+    Clients subscribe with a ``GET`` on `EVENTS_PATH` (see
+    :func:`mytk.remote.subscribe`) and receive Server-Sent Events
+    (``event: <topic>`` and ``data: <JSON value>``) over that connection,
+    instead of polling. A single thread, "mytk-server-publisher", writes to
+    every subscriber.
+
+    Updates are coalesced per topic and per subscriber: a subscriber gets at
+    most `max_rate` events per second for each topic, and when values are
+    published faster, only the latest one is sent. On subscription, the
+    current value of each topic is sent right away.
+
+    Attributes:
+        max_rate (float): Maximum events per second and per topic. Clients
+            can ask for less, not more.
+        send_timeout (float): Time (s) a subscriber can block a write before
+            it is disconnected.
+        heartbeat_interval (float): Time (s) without events after which a
+            comment is sent, to detect disconnected clients.
+    """
+
+    send_timeout = 5
+    heartbeat_interval = 15
+
+    def __init__(self, max_rate=20):
+        self.max_rate = max_rate
+        self._values = {}  # topic -> (version, value)
+        self._subscribers = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stop = None
+
+    @property
+    def topics(self):
+        """The topics published so far."""
+        with self._condition:
+            return sorted(self._values)
+
+    @property
+    def subscriber_count(self):
+        """The number of connected subscribers."""
+        with self._condition:
+            return len(self._subscribers)
+
+    def publish(self, topic, value):
+        """Set the value of a topic, to be pushed to its subscribers.
+
+        Safe to call from any thread; never waits for the clients. The value
+        is sent as JSON: arrays are sent as lists, and other values that are
+        not JSON serializable as their `str`.
+        """
+        with self._condition:
+            version = self._values.get(topic, (0, None))[0] + 1
+            self._values[topic] = (version, value)
+            self._condition.notify()
+
+    def subscribe(self, connection, topics=None, max_rate=None):
+        """Push the events of `topics` (all if None) to a connected socket."""
+        if max_rate is None or max_rate > self.max_rate:
+            max_rate = self.max_rate
+        connection.settimeout(self.send_timeout)
+        subscriber = _Subscriber(connection, topics, 1 / max_rate)
+
+        with self._condition:
+            self._subscribers.append(subscriber)
+            if self._thread is None:
+                self._stop = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._push_events,
+                    args=(self._stop,),
+                    name="mytk-server-publisher",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def close(self):
+        """Disconnect every subscriber and stop the publisher thread."""
+        with self._condition:
+            subscribers, self._subscribers = self._subscribers, []
+            if self._stop is not None:
+                self._stop.set()
+            self._thread = None
+            self._condition.notify()
+        for subscriber in subscribers:
+            subscriber.close()
+
+    def _push_events(self, stop):
+        """Publisher thread: send the due events, then wait for the next."""
+        while True:
+            with self._condition:
+                if stop.is_set():
+                    return
+                now = time.monotonic()
+                messages, next_due = self._collect_due_events(now)
+                if not messages:
+                    self._condition.wait(timeout=next_due - now)
+                    continue
+
+            for subscriber, message in messages:
+                if not subscriber.send(message):
+                    with self._condition:
+                        if subscriber in self._subscribers:
+                            self._subscribers.remove(subscriber)
+                    subscriber.close()
+
+    def _collect_due_events(self, now):
+        """Return the messages due now, and when the next event may be due."""
+        messages = []
+        next_due = now + self.heartbeat_interval
+        for subscriber in self._subscribers:
+            events = []
+            topics = self._values if subscriber.topics is None else subscriber.topics
+            for topic in topics:
+                version, value = self._values.get(topic, (0, None))
+                if version <= subscriber.sent_versions.get(topic, 0):
+                    continue
+                allowed = subscriber.next_allowed.get(topic, 0)
+                if now < allowed:
+                    next_due = min(next_due, allowed)
+                    continue
+                events.append(self.encode_event(topic, value))
+                subscriber.sent_versions[topic] = version
+                subscriber.next_allowed[topic] = now + subscriber.period
+
+            if not events and now - subscriber.last_write > self.heartbeat_interval:
+                events.append(b":\n\n")  # Comment: ignored by the client
+            if events:
+                subscriber.last_write = now
+                messages.append((subscriber, b"".join(events)))
+            else:
+                next_due = min(next_due, subscriber.last_write + self.heartbeat_interval)
+        return messages, next_due
+
+    @staticmethod
+    def encode_event(topic, value):
+        """Encode a value as a Server-Sent Event named after its topic."""
+        data = json.dumps(
+            value, default=lambda obj: obj.tolist() if hasattr(obj, "tolist") else str(obj)
+        )
+        return f"event: {topic}\ndata: {data}\n\n".encode()
+
+
+class _Subscriber:
+    """A connection subscribed to a `RemotePublisher`, and what it was sent."""
+
+    def __init__(self, connection, topics, period):
+        self.connection = connection
+        self.topics = topics
+        self.period = period
+        self.sent_versions = {}
+        self.next_allowed = {}
+        self.last_write = time.monotonic()
+
+    def send(self, message):
+        """Write a message; return False if the client is gone or too slow."""
+        try:
+            self.connection.sendall(message)
+        except OSError:
+            return False
+        return True
+
+    def close(self):
+        with suppress(OSError):
+            self.connection.shutdown(socket.SHUT_RDWR)
+        self.connection.close()
+
+
+class _TopicPublisher:
+    """Observer publishing the changes of a Bindable property on a topic."""
+
+    def __init__(self, publisher, topic):
+        self.publisher = publisher
+        self.topic = topic
+
+    def observed_property_changed(
+        self, observed_object, observed_property_name, new_value, context
+    ):
+        self.publisher.publish(self.topic, new_value)
+
+
 class RemoteControllable:
     """Mixin adding a remote-procedure-call server to an `App`.
 
@@ -86,14 +744,19 @@ class RemoteControllable:
     def __init__(self, *args, **kwargs):
         """Initialize remote-call state for cooperative multiple inheritance."""
         self.remote_functions = {}
+        self.remote_thread_safe_functions = set()
+        self._remote_api = None  # (version, signatures), computed once
+        self._remote_api_lock = threading.Lock()
         self.remote_server = None
         self.remote_call_timeout = 30
+        self.remote_publisher = RemotePublisher()
+        self.remote_call_stats = RemoteCallStats()
         self.app_name = None
         self._zeroconf = None
         self._remote_service_info = None
         super().__init__(*args, **kwargs)  # cooperative!
 
-    def remote(self, fct=None, *, name=None):
+    def remote(self, fct=None, *, name=None, thread_safe=False):
         """Low-level primitive: expose a function for remote invocation.
 
         Most code should prefer :func:`remote_command` on methods; this is the
@@ -104,18 +767,33 @@ class RemoteControllable:
         value must be XML-RPC serializable (numbers, str, bool, None, list,
         dict).
 
+        With ``thread_safe=True``, the call runs directly on the server thread
+        that received it, concurrently with the Tk main thread and with other
+        calls: it does not wait for the main thread, and adds no load to it.
+        Use it for functions that never touch Tk and only read data that is
+        safe to read from another thread (e.g. a ``status()`` polled at a high
+        rate).
+
         Args:
             fct (callable, optional): The function to expose. Omitted when used
                 as a bare decorator.
             name (str, optional): Name clients use to call it. Defaults to the
                 function's own name.
+            thread_safe (bool): Run it off the main thread. Defaults to False.
 
         Returns:
             callable: The function, so it can be used as a decorator.
         """
         if fct is None:
-            return lambda f: self.remote(f, name=name)
-        self.remote_functions[name or fct.__name__] = fct
+            return lambda f: self.remote(f, name=name, thread_safe=thread_safe)
+        name = name or fct.__name__
+        with self._remote_api_lock:
+            self.remote_functions[name] = fct
+            self._remote_api = None  # The signatures changed
+        if thread_safe:
+            self.remote_thread_safe_functions.add(name)
+        else:
+            self.remote_thread_safe_functions.discard(name)
         return fct
 
     def register_remote_commands(self):
@@ -135,7 +813,11 @@ class RemoteControllable:
             tagged = getattr(type(self), attr_name, None)
             remote_name = getattr(tagged, "_remote_name", None)
             if remote_name is not None:
-                self.remote(getattr(self, attr_name), name=remote_name)
+                self.remote(
+                    getattr(self, attr_name),
+                    name=remote_name,
+                    thread_safe=getattr(tagged, "_remote_thread_safe", False),
+                )
                 registered.append(remote_name)
         return registered
 
@@ -145,17 +827,43 @@ class RemoteControllable:
         Useful for discovering the remote API. Keys are the names clients use;
         values are signature strings such as ``"(a, b)"``. Also exposed
         remotely, so a client can call ``remote_app.remote_signatures()`` to
-        introspect the server.
+        introspect the server. Computed once, and again only after a function
+        is exposed (see :meth:`remote_api`).
 
         Returns:
             dict[str, str]: Mapping of function name to its signature string.
         """
-        import inspect
+        return dict(self.remote_api()["signatures"])
 
-        return {
-            name: str(inspect.signature(fct))
-            for name, fct in self.remote_functions.items()
-        }
+    def remote_api(self, version=None):
+        """Returns the version of the exposed API, and its signatures if needed.
+
+        The signatures are only sent to a client that does not have them
+        already. The version is a hash of the signatures: it changes when a function
+        is exposed or replaced, and is the same for an app restarted with the
+        same functions. A client that kept the signatures sends their version
+        to revalidate them, and only receives them again if they changed.
+
+        Args:
+            version (str, optional): The version the client has.
+
+        Returns:
+            dict: ``{"version": str, "signatures": dict}``, with
+            ``"signatures"`` None if `version` is the current one.
+        """
+        with self._remote_api_lock:
+            if self._remote_api is None:
+                signatures = {
+                    name: str(inspect.signature(fct))
+                    for name, fct in self.remote_functions.items()
+                }
+                encoded = json.dumps(signatures, sort_keys=True).encode()
+                self._remote_api = (hashlib.sha1(encoded).hexdigest()[:16], signatures)
+            current, signatures = self._remote_api
+
+        if version == current:
+            return {"version": current, "signatures": None}
+        return {"version": current, "signatures": signatures}
 
     def remote_app_name(self):
         """Returns this app's name so a client can confirm it reached the
@@ -169,15 +877,81 @@ class RemoteControllable:
         """
         return self.app_name
 
-    def start_remote(self, port=8777, host="127.0.0.1", app_name=None):
+    def remote_transports(self):
+        """Return the transports the server accepts, for clients to negotiate.
+
+        Returns:
+            list[str]: ``"xmlrpc"``, and ``"binary"`` (see :mod:`mytk.binaryrpc`).
+        """
+        return ["xmlrpc", "binary"]
+
+    def remote_topics(self):
+        """Return the topics clients can subscribe to (see :meth:`publish`)."""
+        return self.remote_publisher.topics
+
+    def remote_stats(self):
+        """Return the counts and latencies of the remote calls served.
+
+        Exposed remotely, and answered on the server thread, so a client can
+        see where the time of its calls goes while they run::
+
+            stats = remote_app.remote_stats()
+            stats["functions"]["status"]["queue_ms"]["p95"]
+
+        Returns:
+            dict: See :meth:`RemoteCallStats.stats`.
+        """
+        return self.remote_call_stats.stats()
+
+    def publish(self, topic, value):
+        """Push a new value of `topic` to the subscribed clients.
+
+        Clients subscribe with :func:`mytk.remote.subscribe` instead of
+        polling. Safe to call from any thread, and cheap: values published
+        faster than the clients' rate are coalesced, only the latest is sent
+        (see :class:`RemotePublisher`). The last value is kept, and sent to
+        clients that subscribe later.
+
+        Args:
+            topic (str): Name clients subscribe to.
+            value: Any JSON-serializable value (arrays are sent as lists).
+        """
+        self.remote_publisher.publish(topic, value)
+
+    def publish_property(self, property_name, model=None, topic=None):
+        """Publish every change of a `Bindable` property on a topic.
+
+        Args:
+            property_name (str): The property to observe.
+            model (Bindable, optional): The object with the property. Defaults
+                to the app itself.
+            topic (str, optional): The topic. Defaults to `property_name`.
+        """
+        model = self if model is None else model
+        topic = property_name if topic is None else topic
+
+        value = getattr(model, property_name)
+        if isinstance(value, Variable):
+            value = value.get()
+        self.publish(topic, value)
+        model.add_observer(
+            _TopicPublisher(self.remote_publisher, topic), property_name, weak=False
+        )
+
+    def start_remote(
+        self, port=8777, host="127.0.0.1", app_name=None, max_workers=8,
+        keep_alive_timeout=15,
+    ):
         """Starts a background server exposing the app's remote functions.
 
         Any method tagged with :func:`remote_command` is registered first (via
         :meth:`register_remote_commands`), so tagged methods just work without a
         separate call. Localhost-only by default. The server runs in a daemon
-        thread; each call is marshaled onto the Tk main thread and its return
-        value sent back to the client. Safe to call once; further calls are
-        no-ops.
+        thread and serves its clients concurrently on a pool of `max_workers`
+        threads, keeping their connections alive between calls (see
+        :class:`RemoteXMLRPCServer`); each call is marshaled onto the Tk main
+        thread and its return value sent back to the client. Safe to call
+        once; further calls are no-ops.
 
         Args:
             port (int): Port to bind. Use 0 to let the OS pick a free port.
@@ -185,13 +959,14 @@ class RemoteControllable:
             app_name (str, optional): Identity clients can verify (see
                 :meth:`remote_app_name`). Defaults to ``self.app_name`` if
                 already set, otherwise the App's ``name``.
+            max_workers (int): Maximum number of connections served at once.
+                Use 1 to serve the clients one after the other.
+            keep_alive_timeout (float): Time (s) after which an idle client
+                connection is closed.
 
         Returns:
             int: The port actually bound (useful with ``port=0``).
         """
-        import threading
-        from xmlrpc.server import SimpleXMLRPCServer
-
         if self.remote_server is not None:
             return self.remote_server.server_address[1]
 
@@ -202,19 +977,33 @@ class RemoteControllable:
 
         self.register_remote_commands()
 
-        server = SimpleXMLRPCServer(
-            (host, port), allow_none=True, logRequests=False
+        server = RemoteXMLRPCServer(
+            (host, port),
+            max_workers=max_workers,
+            keep_alive_timeout=keep_alive_timeout,
+            allow_none=True,
+            logRequests=False,
         )
         for exposed_name, fct in self.remote_functions.items():
-            server.register_function(self.remote_wrapper(fct), exposed_name)
+            if exposed_name not in self.remote_thread_safe_functions:
+                fct = self.remote_wrapper(fct)
+            server.register_function(fct, exposed_name)
 
         # Always let clients introspect the exposed API and verify identity.
-        server.register_function(
-            self.remote_wrapper(self.remote_signatures), "remote_signatures"
-        )
-        server.register_function(
-            self.remote_wrapper(self.remote_app_name), "remote_app_name"
-        )
+        # Neither touches Tk, so they are answered on the server thread.
+        server.register_function(self.remote_signatures, "remote_signatures")
+        server.register_function(self.remote_api, "remote_api")
+        server.register_function(self.remote_app_name, "remote_app_name")
+        server.register_function(self.remote_transports, "remote_transports")
+        server.register_function(self.remote_topics, "remote_topics")
+        server.register_function(self.remote_stats, "remote_stats")
+        server.publisher = self.remote_publisher
+        server.call_stats = self.remote_call_stats
+        # Answered on the server thread, so a stalled main thread can be
+        # diagnosed while it is stalled.
+        if hasattr(self, "main_thread_stats"):
+            server.register_function(self.main_thread_stats, "main_thread_stats")
+        server.register_function(self.remote_multicall, "system.multicall")
 
         self.remote_server = server
         thread = threading.Thread(
@@ -330,6 +1119,68 @@ class RemoteControllable:
         if event.widget is self.root:
             self.stop_remote()
 
+    def remote_multicall(self, calls):
+        """Runs a batch of calls in a single task on the Tk main thread.
+
+        Exposed as the standard XML-RPC ``system.multicall``, which
+        ``xmlrpc.client.MultiCall`` and :meth:`mytk.remote.RemoteServerProxy.batch`
+        use: the whole batch costs one round-trip and one main-thread hop, and
+        no UI event is processed between its calls. Thread-safe commands (see
+        :meth:`remote`) and the introspection functions run on the server
+        thread, as when called alone: consecutive main-thread calls between
+        them share a hop, and the calls still run in order. A failing call
+        does not stop the batch.
+
+        Args:
+            calls (list[dict]): Calls as ``{"methodName": name, "params": [...]}``.
+
+        Returns:
+            list: For each call, ``[result]`` or, if it failed, a fault
+            ``{"faultCode": 1, "faultString": ...}``.
+        """
+        functions = dict(self.remote_functions)
+        functions["remote_signatures"] = self.remote_signatures
+        functions["remote_api"] = self.remote_api
+        functions["remote_app_name"] = self.remote_app_name
+        functions["remote_transports"] = self.remote_transports
+        functions["remote_topics"] = self.remote_topics
+        functions["remote_stats"] = self.remote_stats
+        if hasattr(self, "main_thread_stats"):
+            functions["main_thread_stats"] = self.main_thread_stats
+        on_server_thread = set(self.remote_thread_safe_functions)
+        on_server_thread.update(set(functions) - set(self.remote_functions))
+
+        def run_batch(batch):
+            results = []
+            for call in batch:
+                try:
+                    name = call["methodName"]
+                    if name not in functions:
+                        raise Exception(f'method "{name}" is not supported')
+                    results.append([functions[name](*call.get("params", []))])
+                except Exception as exc:
+                    results.append(
+                        {"faultCode": 1, "faultString": f"{type(exc)}:{exc}"}
+                    )
+            return results
+
+        results = []
+        main_thread_calls = []
+        for call in calls:
+            name = call.get("methodName") if isinstance(call, dict) else None
+            if name not in on_server_thread:
+                main_thread_calls.append(call)
+                continue
+            if main_thread_calls:
+                results.extend(self.call_on_main_thread(run_batch, (main_thread_calls,)))
+                main_thread_calls = []
+            start = time.perf_counter()
+            results.extend(run_batch([call]))
+            self.remote_call_stats.set_run_time(time.perf_counter() - start)
+        if main_thread_calls:
+            results.extend(self.call_on_main_thread(run_batch, (main_thread_calls,)))
+        return results
+
     def remote_wrapper(self, fct):
         """Wraps an exposed function so the RPC thread runs it on the main
         thread and blocks for its result."""
@@ -345,12 +1196,22 @@ class RemoteControllable:
         from concurrent.futures import Future
 
         future = Future()
+        run_times = []
 
         def task():
+            start = time.perf_counter()
             try:
-                future.set_result(fct(*args, **(kwargs or {})))
+                result = fct(*args, **(kwargs or {}))
             except Exception as exc:
+                run_times.append(time.perf_counter() - start)
                 future.set_exception(exc)
+            else:
+                run_times.append(time.perf_counter() - start)
+                future.set_result(result)
 
         self.schedule_on_main_thread(task)
-        return future.result(timeout=self.remote_call_timeout)
+        try:
+            return future.result(timeout=self.remote_call_timeout)
+        finally:
+            if run_times:
+                self.remote_call_stats.set_run_time(run_times[0])
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import unittest
+
+from mytk import App
+
+
+class TestAppAsync(unittest.TestCase):
+    """Coroutines on the App asyncio loop, bridged to the Tk main thread."""
+
+    def setUp(self):
+        self.app = App(name=self.id())
+        self.result = None
+        self.error = None
+        self.thread_name = None
+
+    def tearDown(self):
+        self.app.quit()
+
+    def test_run_async_returns_future(self):
+        async def compute():
+            await asyncio.sleep(0.01)
+            return 42
+
+        future = self.app.run_async(compute())
+        self.assertEqual(future.result(timeout=2), 42)
+
+    def test_loop_runs_off_main_thread(self):
+        async def where():
+            return threading.current_thread().name
+
+        self.assertEqual(self.app.run_async(where()).result(timeout=2), "mytk-asyncio")
+
+    def test_on_done_called_on_main_thread(self):
+        async def compute():
+            return 7
+
+        def done(value):
+            self.result = value
+            self.thread_name = threading.current_thread().name
+            self.app.quit()
+
+        self.app.after(2000, self.app.quit)  # safety net
+        self.app.run_async(compute(), on_done=done)
+        self.app.mainloop()
+
+        self.assertEqual(self.result, 7)
+        self.assertEqual(self.thread_name, threading.main_thread().name)
+
+    def test_on_error_called_with_exception(self):
+        async def fail():
+            raise ValueError("nope")
+
+        def error(exc):
+            self.error = exc
+            self.app.quit()
+
+        self.app.after(2000, self.app.quit)
+        self.app.run_async(fail(), on_error=error)
+        self.app.mainloop()
+        self.assertIsInstance(self.error, ValueError)
+
+    def test_run_on_main_thread_from_coroutine(self):
+        async def set_title():
+            title = await self.app.run_on_main_thread(self.app.root.title, "from-async")
+            self.result = await self.app.run_on_main_thread(self.app.root.title)
+            return title
+
+        async def main():
+            await set_title()
+            await self.app.run_on_main_thread(self.app.quit)
+
+        self.app.after(2000, self.app.quit)
+        self.app.mainloop_async(main())
+        self.assertEqual(self.result, "from-async")
+
+    def test_quit_stops_loop_and_cancels_tasks(self):
+        cancelled = threading.Event()
+
+        async def forever():
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        loop = self.app.async_loop
+        self.app.after(100, self.app.quit)
+        self.app.mainloop_async(forever())
+
+        self.assertTrue(cancelled.is_set())
+        self.assertFalse(loop.is_running())
+
+
+if __name__ == "__main__":
+    unittest.main()
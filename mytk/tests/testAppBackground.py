@@ -0,0 +1,133 @@
+import threading
+import time
+import unittest
+
+from mytk import App, BackgroundTask, Label, ProgressBar
+
+
+def slow_sum(values, progress=None):
+    total = 0
+    for i, value in enumerate(values):
+        total += value
+        if progress is not None:
+            progress(100 * (i + 1) / len(values))
+    return total
+
+
+def square(value):
+    return value * value
+
+
+class TestAppBackground(unittest.TestCase):
+    """Work run with App.run_in_background, completed on the main thread."""
+
+    def setUp(self):
+        self.app = App(name=self.id())
+        self.result = None
+        self.error = None
+        self.thread_name = None
+        self.progress = []
+
+    def tearDown(self):
+        self.app.quit()
+
+    def done(self, value):
+        self.result = value
+        self.thread_name = threading.current_thread().name
+        self.app.quit()
+
+    def failed(self, error):
+        self.error = error
+        self.app.quit()
+
+    def test_returns_task(self):
+        task = self.app.run_in_background(square, 3)
+        self.assertIsInstance(task, BackgroundTask)
+        self.assertEqual(task.result(timeout=2), 9)
+        self.assertTrue(task.done())
+
+    def test_runs_in_worker_thread(self):
+        task = self.app.run_in_background(lambda: threading.current_thread().name)
+        self.assertTrue(task.result(timeout=2).startswith("mytk-background"))
+
+    def test_on_done_called_on_main_thread(self):
+        self.app.run_in_background(square, 4, on_done=self.done)
+        self.app.after(2000, self.app.quit)
+        self.app.mainloop()
+        self.assertEqual(self.result, 16)
+        self.assertEqual(self.thread_name, threading.main_thread().name)
+
+    def test_on_error(self):
+        self.app.run_in_background(square, "a", on_error=self.failed)
+        self.app.after(2000, self.app.quit)
+        self.app.mainloop()
+        self.assertIsInstance(self.error, TypeError)
+
+    def test_on_progress_coalesced(self):
+        self.app.run_in_background(
+            slow_sum, list(range(1000)), on_done=self.done,
+            on_progress=self.progress.append,
+        )
+        self.app.after(2000, self.app.quit)
+        self.app.mainloop()
+        self.assertEqual(self.result, sum(range(1000)))
+        self.assertTrue(0 < len(self.progress) <= 1000)
+        self.assertEqual(self.progress[-1], 100)
+
+    def test_on_progress_with_progress_bar(self):
+        progress_bar = ProgressBar()
+        progress_bar.grid_into(self.app.window, row=0, column=0)
+        self.app.run_in_background(
+            slow_sum, [1, 2, 3], on_done=self.done, on_progress=progress_bar
+        )
+        self.app.after(2000, self.app.quit)
+        self.app.mainloop()
+        self.assertEqual(progress_bar.value, 100)
+
+    def test_progress_with_process_raises(self):
+        with self.assertRaises(ValueError):
+            self.app.run_in_background(
+                slow_sum, [1], on_progress=print, use_process=True
+            )
+
+    def test_cancel_skips_callbacks(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked():
+            started.set()
+            release.wait(2)
+            return "late"
+
+        task = self.app.run_in_background(blocked, on_done=self.done)
+        started.wait(2)
+        task.cancel()
+        release.set()
+        self.assertTrue(task.is_cancelled)
+
+        self.app.after(300, self.app.quit)
+        self.app.mainloop()
+        self.assertIsNone(self.result)
+
+    def test_cancelled_task_stops_at_progress(self):
+        task = BackgroundTask()
+        task.cancel()
+        progress = self.app._progress_reporter(task, print)
+        with self.assertRaises(Exception):
+            progress(10)
+
+    def test_owner_destroyed_cancels_task(self):
+        label = Label(text="Loading")
+        label.grid_into(self.app.window, row=0, column=0)
+
+        task = self.app.run_in_background(time.sleep, 0.5, owner=label)
+        label.widget.destroy()
+        self.assertTrue(task.is_cancelled)
+
+    def test_use_process(self):
+        task = self.app.run_in_background(square, 5, use_process=True)
+        self.assertEqual(task.result(timeout=10), 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
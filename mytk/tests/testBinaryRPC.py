@@ -0,0 +1,95 @@
+import unittest
+import xmlrpc.client
+
+import numpy as np
+
+from mytk import binaryrpc
+
+
+def round_trip(header):
+    chunks, length = binaryrpc.encode_message(header)
+    body = bytearray(b"".join(chunks))
+    assert len(body) == length
+    return binaryrpc.decode_message(body)
+
+
+class TestBinaryRPC(unittest.TestCase):
+    def test_plain_values(self):
+        params = [1, 2.5, "text", None, True, [1, [2]], {"a": {"b": 3}}]
+        self.assertEqual(round_trip({"params": params}), {"params": params})
+
+    def test_tuples_become_lists(self):
+        self.assertEqual(round_trip({"result": (1, 2)}), {"result": [1, 2]})
+
+    def test_array_keeps_dtype_and_shape(self):
+        array = np.arange(12, dtype=">i4").reshape(3, 4)
+        decoded = round_trip({"result": array})["result"]
+
+        self.assertEqual(decoded.dtype, array.dtype)
+        np.testing.assert_array_equal(decoded, array)
+
+    def test_non_contiguous_array(self):
+        array = np.arange(20.0).reshape(4, 5)[:, ::2]
+        np.testing.assert_array_equal(round_trip({"result": array})["result"], array)
+
+    def test_contiguous_array_is_not_copied(self):
+        array = np.zeros((100, 100), dtype=np.uint16)
+        chunks, _ = binaryrpc.encode_message({"result": array})
+        self.assertTrue(np.shares_memory(np.asarray(chunks[1]), array))
+
+    def test_received_array_is_a_view_on_the_message(self):
+        chunks, _ = binaryrpc.encode_message({"result": np.ones(1000)})
+        body = bytearray(b"".join(chunks))
+        decoded = binaryrpc.decode_message(body)["result"]
+
+        self.assertFalse(decoded.flags.owndata)
+        decoded[0] = 2  # Writable, since the message is a bytearray
+        self.assertEqual(decoded[0], 2)
+
+    def test_received_arrays_are_aligned(self):
+        result = [b"\x01", np.ones(3, dtype=np.float32), np.arange(5, dtype=np.float64)]
+        chunks, length = binaryrpc.encode_message({"result": result})
+        body = bytearray(b"".join(chunks))
+        self.assertEqual(len(body), length)
+        decoded = binaryrpc.decode_message(body)["result"]
+
+        for array in decoded[1:]:
+            self.assertTrue(array.flags.aligned)
+            offset = array.ctypes.data - np.frombuffer(body, np.uint8).ctypes.data
+            self.assertEqual(offset % binaryrpc.ALIGNMENT, 0)
+        np.testing.assert_array_equal(decoded[2], result[2])
+
+    def test_arrays_and_bytes_nested(self):
+        result = {"frame": np.ones((2, 2), dtype=np.uint8), "raw": b"\x00\x01", "n": [np.float32(1.5)]}
+        decoded = round_trip({"result": result})["result"]
+
+        np.testing.assert_array_equal(decoded["frame"], result["frame"])
+        self.assertEqual(decoded["raw"], b"\x00\x01")
+        self.assertEqual(decoded["n"], [1.5])
+
+    def test_empty_array(self):
+        decoded = round_trip({"result": np.zeros((0, 3))})["result"]
+        self.assertEqual(decoded.shape, (0, 3))
+
+    def test_unsupported_values(self):
+        for value in (object(), np.array([object()]), {1: "a"}):
+            with self.assertRaises(TypeError):
+                binaryrpc.encode_message({"result": value})
+
+    def test_invalid_message(self):
+        with self.assertRaises(ValueError):
+            binaryrpc.decode_message(bytearray(b"<?xml version='1.0'?>"))
+
+        chunks, _ = binaryrpc.encode_message({"result": np.ones(10)})
+        with self.assertRaises(ValueError):
+            binaryrpc.decode_message(bytearray(b"".join(chunks))[:-1])
+
+    def test_fault_response(self):
+        chunks, _ = binaryrpc.encode_response(fault=xmlrpc.client.Fault(1, "failed"))
+        with self.assertRaises(xmlrpc.client.Fault) as context:
+            binaryrpc.decode_response(bytearray(b"".join(chunks)))
+        self.assertEqual(context.exception.faultString, "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
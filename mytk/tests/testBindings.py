@@ -1,7 +1,10 @@
 import contextlib
+import gc
 import io
 import re
+import threading
 import unittest
+from unittest import mock
 
 import envtest
 
@@ -243,6 +246,270 @@ class TestBindings(envtest.MyTkTestCase):
         self.assertEqual(c.foo, 2)
         self.assertEqual(c.py_c, 2)
 
+    def test_worker_thread_changes_are_delivered_on_main_thread(self):
+        model = Model()
+        model.notify_on_main_thread = True
+        obs = CountingObserver()
+        model.add_observer(obs, "x")
+
+        def produce():
+            for i in range(1000):
+                model.x = i
+
+        worker = threading.Thread(target=produce)
+        worker.start()
+        worker.join()
+        self.assertEqual(obs.calls, 0)  # nothing delivered on the worker
+
+        self.app.run_main_queue()
+        self.assertEqual(obs.values, [("x", 999)])
+        self.assertTrue(obs.on_main_thread)
+
+    def test_main_thread_changes_are_delivered_immediately(self):
+        model = Model()
+        model.notify_on_main_thread = True
+        obs = CountingObserver()
+        model.add_observer(obs, "x")
+
+        model.x = 1
+        self.assertEqual(obs.values, [("x", 1)])
+
+
+class Model(Bindable):
+    """A Bindable with plain Python properties only (no Tk root needed)."""
+
+    def __init__(self):
+        super().__init__()
+        self.x = 0
+        self.y = 0
+
+
+class CountingObserver:
+    def __init__(self):
+        self.calls = 0
+        self.values = []
+
+    def observed_property_changed(
+        self, observed_object, observed_property_name, new_value, context
+    ):
+        self.calls += 1
+        self.values.append((observed_property_name, new_value))
+        self.on_main_thread = threading.current_thread() is threading.main_thread()
+
+
+class CountingModel(Model):
+    """A Model that counts the notifications it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.received = 0
+
+    def observed_property_changed(
+        self, observed_object, observed_property_name, new_value, context
+    ):
+        self.__dict__["received"] += 1  # not an observable change
+        super().observed_property_changed(
+            observed_object, observed_property_name, new_value, context
+        )
+
+
+class TestObserverLifetime(unittest.TestCase):
+    """Weakly referenced observers and explicit unregistration."""
+
+    def test_observer_is_not_kept_alive(self):
+        model = Model()
+        obs = Observer()
+        model.add_observer(obs, "x")
+        self.assertEqual(len(model.observing_me), 1)
+
+        del obs
+        gc.collect()
+        self.assertEqual(len(model.observing_me), 0)
+        model.x = 1  # nobody left to notify
+
+    def test_strong_observer_is_kept_alive(self):
+        model = Model()
+        model.add_observer(CountingObserver(), "x", weak=False)
+        gc.collect()
+
+        model.x = 1
+        self.assertEqual(model.observing_me[0].observer.calls, 1)
+
+    def test_remove_observer(self):
+        model = Model()
+        obs = Observer()
+        model.add_observer(obs, "x")
+        model.add_observer(obs, "y")
+
+        model.remove_observer(obs, "x")
+        model.x = 1
+        self.assertFalse(obs.was_called)
+        model.y = 1
+        self.assertTrue(obs.was_called)
+
+        model.remove_observer(obs)
+        self.assertEqual(model.observing_me, [])
+
+    def test_remove_unknown_observer_is_not_an_error(self):
+        Model().remove_observer(Observer(), "x")
+
+    def test_unbind_properties(self):
+        a = Model()
+        b = Model()
+        obs = Observer()
+        a.add_observer(obs, "x")
+        a.bind_properties("x", b, "y")
+
+        a.unbind_properties("x", b, "y")
+        a.x = 5
+        self.assertEqual(b.y, 0)
+        b.y = 3
+        self.assertEqual(a.x, 5)
+        self.assertTrue(obs.was_called)  # unrelated observer untouched
+
+    def test_disconnect_observers(self):
+        model = Model()
+        view = Model()
+        model.bind_properties("x", view, "y")
+
+        view.disconnect_observers()
+        self.assertEqual(model.observing_me, [])
+        self.assertEqual(view.observing_me, [])
+        model.x = 2
+        self.assertEqual(view.y, 0)
+
+    def test_soak_observers_do_not_accumulate(self):
+        model = Model()
+        survivor = CountingObserver()
+        model.add_observer(survivor, "x")
+
+        for i in range(1000):
+            view = Model()
+            view.bind_properties("y", model, "x")
+            model.x = i
+            del view
+
+        gc.collect()
+        self.assertEqual(len(model.observing_me), 1)
+
+        survivor.calls = 0
+        model.x = -1
+        self.assertEqual(survivor.calls, 1)
+
+
+class TestBatchChanges(unittest.TestCase):
+    """Coalesced notifications with batch_changes()."""
+
+    def test_batch_notifies_once_with_last_value(self):
+        model = Model()
+        obs = CountingObserver()
+        model.add_observer(obs, "x")
+        model.add_observer(obs, "y")
+
+        with model.batch_changes():
+            for i in range(20):
+                model.x = i
+            model.y = "done"
+            self.assertEqual(obs.calls, 0)
+
+        self.assertEqual(obs.values, [("x", 19), ("y", "done")])
+
+    def test_nested_batches_deliver_at_outermost_exit(self):
+        model = Model()
+        obs = CountingObserver()
+        model.add_observer(obs, "x")
+
+        with model.batch_changes():
+            with model.batch_changes():
+                model.x = 1
+            self.assertEqual(obs.calls, 0)
+            model.x = 2
+
+        self.assertEqual(obs.values, [("x", 2)])
+
+    def test_batch_delivers_on_exception(self):
+        model = Model()
+        obs = CountingObserver()
+        model.add_observer(obs, "x")
+
+        with self.assertRaises(RuntimeError), model.batch_changes():
+            model.x = 3
+            raise RuntimeError
+
+        self.assertEqual(obs.values, [("x", 3)])
+
+    def test_bindings_follow_batch(self):
+        a = Model()
+        b = Model()
+        a.bind_properties("x", b, "y")
+
+        with a.batch_changes():
+            a.x = 1
+            a.x = 2
+            self.assertEqual(b.y, 0)
+        self.assertEqual(b.y, 2)
+
+    def test_binding_does_not_echo_back(self):
+        a = CountingModel()
+        b = CountingModel()
+        a.bind_properties("x", b, "y")
+        a.received = b.received = 0
+
+        a.x = 7
+        self.assertEqual(b.y, 7)
+        self.assertEqual(b.received, 1)
+        self.assertEqual(a.received, 0)  # no round-trip back to a
+
+    def test_binding_sends_back_a_different_value(self):
+        class Clamped(Model):
+            def __setattr__(self, name, value):
+                if name == "y" and isinstance(value, int):
+                    value = min(value, 10)
+                super().__setattr__(name, value)
+
+        a = Model()
+        b = Clamped()
+        a.bind_properties("x", b, "y")
+
+        a.x = 99
+        self.assertEqual(b.y, 10)
+        self.assertEqual(a.x, 10)
+
+
+class TestMainThreadNotifications(unittest.TestCase):
+    """notify_on_main_thread without a running App."""
+
+    def test_without_app_changes_are_delivered_synchronously(self):
+        model = Model()
+        model.notify_on_main_thread = True
+        obs = CountingObserver()
+        model.add_observer(obs, "x")
+
+        with mock.patch.object(App, "app", None):
+            worker = threading.Thread(target=lambda: setattr(model, "x", 4))
+            worker.start()
+            worker.join()
+
+        self.assertEqual(obs.values, [("x", 4)])
+        self.assertFalse(obs.on_main_thread)
+
+    def test_constructed_on_worker_thread(self):
+        class MainThreadModel(Model):
+            notify_on_main_thread = True
+
+        scheduled = []
+        app = mock.Mock(is_running=True, schedule_on_main_thread=scheduled.append)
+        models = []
+        with mock.patch.object(App, "app", app):
+            worker = threading.Thread(target=lambda: models.append(MainThreadModel()))
+            worker.start()
+            worker.join()
+
+        model = models[0]
+        self.assertEqual(model.x, 0)
+        self.assertEqual(list(model._main_thread_changes), ["x", "y"])  # Not bookkeeping
+        self.assertEqual(scheduled, [model._deliver_main_thread_changes])
+
 
 if __name__ == "__main__":
     unittest.main()
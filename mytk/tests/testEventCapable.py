@@ -0,0 +1,120 @@
+import unittest
+
+from mytk.eventcapable import EventCapable
+
+
+class FakeWidget:
+    """Stands in for a Tk widget: timers are fired by hand."""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+        self.bindings = []
+
+    def after(self, delay, function):
+        self.next_id += 1
+        task_id = f"after#{self.next_id}"
+        self.pending[task_id] = function
+        return task_id
+
+    def after_idle(self, function):
+        return self.after(0, function)
+
+    def after_cancel(self, task_id):
+        self.pending.pop(task_id, None)
+
+    def bind(self, event, callback, add=None):
+        self.bindings.append((event, callback, add))
+
+    def fire_all(self):
+        pending, self.pending = self.pending, {}
+        for function in pending.values():
+            function()
+
+
+class Scheduler(EventCapable):
+    def __init__(self):
+        super().__init__()
+        self.widget = FakeWidget()
+
+
+class TestScheduledTasks(unittest.TestCase):
+    """The task registry of EventCapable, without Tk."""
+
+    def setUp(self):
+        self.scheduler = Scheduler()
+        self.calls = []
+
+    def test_fired_tasks_are_removed(self):
+        for i in range(1000):
+            self.scheduler.after(10, lambda i=i: self.calls.append(i))
+        self.assertEqual(len(self.scheduler.scheduled_tasks), 1000)
+
+        self.scheduler.widget.fire_all()
+        self.assertEqual(len(self.calls), 1000)
+        self.assertEqual(len(self.scheduler.scheduled_tasks), 0)
+
+    def test_after_cancel(self):
+        task_id = self.scheduler.after(10, lambda: self.calls.append(1))
+        self.scheduler.after_cancel(task_id)
+        self.scheduler.after_cancel(task_id)  # Already cancelled: no error
+        self.scheduler.widget.fire_all()
+
+        self.assertEqual(self.calls, [])
+        self.assertNotIn(task_id, self.scheduler.scheduled_tasks)
+
+    def test_after_cancel_all(self):
+        for _ in range(3):
+            self.scheduler.after(10, lambda: self.calls.append(1))
+        self.scheduler.after_idle(lambda: self.calls.append(2))
+        self.scheduler.after_cancel_all()
+        self.scheduler.widget.fire_all()
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.scheduler.scheduled_tasks), 0)
+
+    def test_after_idle(self):
+        task_id = self.scheduler.after_idle(lambda: self.calls.append(1))
+        self.assertIn(task_id, self.scheduler.scheduled_tasks)
+        self.scheduler.widget.fire_all()
+
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(len(self.scheduler.scheduled_tasks), 0)
+
+    def test_after_coalesced_replaces_pending_function(self):
+        first = self.scheduler.after_coalesced("redraw", 10, lambda: self.calls.append(1))
+        second = self.scheduler.after_coalesced("redraw", 10, lambda: self.calls.append(2))
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.scheduler.scheduled_tasks), 1)
+
+        self.scheduler.widget.fire_all()
+        self.assertEqual(self.calls, [2])
+
+        self.scheduler.after_coalesced("redraw", 10, lambda: self.calls.append(3))
+        self.scheduler.widget.fire_all()
+        self.assertEqual(self.calls, [2, 3])
+
+    def test_after_coalesced_keys_are_independent(self):
+        self.scheduler.after_coalesced("a", 10, lambda: self.calls.append("a"))
+        self.scheduler.after_coalesced("b", 10, lambda: self.calls.append("b"))
+        self.scheduler.widget.fire_all()
+        self.assertEqual(sorted(self.calls), ["a", "b"])
+
+    def test_cancel_coalesced_task(self):
+        task_id = self.scheduler.after_coalesced("a", 10, lambda: self.calls.append(1))
+        self.scheduler.after_cancel(task_id)
+        self.scheduler.after_coalesced("a", 10, lambda: self.calls.append(2))
+        self.scheduler.widget.fire_all()
+        self.assertEqual(self.calls, [2])
+
+    def test_destroy_binding_added_once(self):
+        self.scheduler._bind_destroy_cancel()
+        self.scheduler._bind_destroy_cancel()
+        bindings = self.scheduler.widget.bindings
+        self.assertEqual(len(bindings), 1)
+        self.assertEqual(bindings[0][0], "<Destroy>")
+        self.assertEqual(bindings[0][2], "+")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+import time
+import unittest
+from tkinter import TclError
+
+from mytk.app import App
+from mytk.eventcapable import EventCapable
+from mytk.frameclock import FrameClock
+
+
+class FakeRoot:
+    """Records the clock's timer instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.next_id = 0
+        self.bindings = []
+
+    def bind(self, sequence, function, add=None):
+        self.bindings.append((sequence, function))
+
+    def map(self):
+        """Send a <Map> event to the bindings."""
+        for _, function in self.bindings:
+            function(None)
+
+    def after(self, delay, function):
+        self.next_id += 1
+        self.scheduled[self.next_id] = (delay, function)
+        return self.next_id
+
+    def after_cancel(self, task_id):
+        self.scheduled.pop(task_id, None)
+
+    def fire(self):
+        """Run the pending timers now, whatever their delay."""
+        scheduled, self.scheduled = self.scheduled, {}
+        for _, function in scheduled.values():
+            function()
+
+
+class FakeWidget:
+    def __init__(self, toplevel=None):
+        self.exists = True
+        self.mapped = True
+        self.toplevel = toplevel
+
+    def winfo_toplevel(self):
+        return self.toplevel
+
+    def winfo_exists(self):
+        return self.exists
+
+    def winfo_ismapped(self):
+        if not self.exists:
+            raise TclError("bad window path name")
+        return self.mapped
+
+
+class TestFrameClock(unittest.TestCase):
+    """FrameClock scheduling, driven by hand with a fake root."""
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.clock = FrameClock(self.root, max_rate=100)
+        self.calls = []
+
+    def test_runs_only_with_callbacks(self):
+        self.assertEqual(self.root.scheduled, {})
+        frame_callback = self.clock.add(lambda: None, rate=10)
+        self.assertEqual(len(self.root.scheduled), 1)
+
+        self.clock.remove(frame_callback)
+        self.assertEqual(self.root.scheduled, {})
+        self.assertFalse(frame_callback.is_active)
+
+    def test_single_timer_for_many_callbacks(self):
+        for _ in range(5):
+            self.clock.add(lambda: None, rate=10)
+        self.assertEqual(len(self.root.scheduled), 1)
+
+    def test_due_callbacks_run_in_same_tick(self):
+        self.clock.add(lambda: self.calls.append("a"), rate=10)
+        self.clock.add(lambda: self.calls.append("b"), rate=20)
+        self.root.fire()
+        self.assertEqual(self.calls, ["a", "b"])
+
+        self.root.fire()  # Not due yet
+        self.assertEqual(self.calls, ["a", "b"])
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            self.clock.add(lambda: None, rate=0)
+
+    def test_late_frames_are_dropped(self):
+        frame_callback = self.clock.add(lambda: self.calls.append(1), rate=100)
+        frame_callback.next_due -= 0.1  # Main thread busy for 100 ms
+        self.root.fire()
+
+        self.assertEqual(self.calls, [1])
+        self.assertGreaterEqual(frame_callback.dropped_frames, 9)
+        self.assertGreater(frame_callback.next_due, time.perf_counter())
+
+    def test_hidden_widget_is_not_called(self):
+        widget = FakeWidget()
+        widget.mapped = False
+        frame_callback = self.clock.add(lambda: self.calls.append(1), widget=widget)
+        self.root.fire()
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(frame_callback.hidden_frames, 1)
+
+        widget.mapped = True
+        self.root.map()
+        self.root.fire()
+        self.assertEqual(self.calls, [1])
+
+    def test_clock_stops_while_every_widget_is_hidden(self):
+        toplevel = FakeRoot()
+        widget = FakeWidget(toplevel)
+        widget.mapped = False
+        frame_callback = self.clock.add(lambda: self.calls.append(1), widget=widget)
+        self.root.fire()
+
+        self.assertEqual(self.root.scheduled, {})  # No work while hidden
+        self.assertEqual(frame_callback.hidden_frames, 1)
+        toplevel.map()  # Another widget mapped: still hidden, one tick
+        self.root.fire()
+        self.assertEqual(self.root.scheduled, {})
+
+        widget.mapped = True
+        toplevel.map()
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.root.fire()
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(frame_callback.dropped_frames, 0)
+        self.assertEqual(len(self.root.scheduled), 1)
+
+    def test_clock_runs_while_one_widget_is_shown(self):
+        hidden = FakeWidget()
+        hidden.mapped = False
+        self.clock.add(lambda: None, widget=hidden)
+        self.clock.add(lambda: self.calls.append(1), widget=FakeWidget())
+        self.root.fire()
+
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(len(self.root.scheduled), 1)
+
+    def test_destroyed_widget_is_removed(self):
+        widget = FakeWidget()
+        frame_callback = self.clock.add(lambda: self.calls.append(1), widget=widget)
+        widget.exists = False
+        self.root.fire()
+
+        self.assertEqual(self.calls, [])
+        self.assertNotIn(frame_callback, self.clock.frame_callbacks)
+        self.assertEqual(self.root.scheduled, {})
+
+    def test_failing_callback_does_not_stop_clock(self):
+        self.clock.add(lambda: 1 / 0)
+        self.clock.add(lambda: self.calls.append(1))
+        self.root.fire()
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(len(self.root.scheduled), 1)
+
+    def test_stop(self):
+        self.clock.add(lambda: None)
+        self.clock.add(lambda: None)
+        self.clock.stop()
+        self.assertEqual(self.clock.frame_callbacks, [])
+        self.assertEqual(self.root.scheduled, {})
+
+
+class ViewWithoutApp(EventCapable):
+    def __init__(self):
+        super().__init__()
+        self.widget = FakeRoot()
+
+
+class TestFrameCallbackWithoutApp(unittest.TestCase):
+    """Without an App, frame callbacks run from the widget's own `after` loop."""
+
+    def setUp(self):
+        self.saved_app, App.app = App.app, None
+        self.addCleanup(setattr, App, "app", self.saved_app)
+
+    def test_after_loop(self):
+        view = ViewWithoutApp()
+        calls = []
+        frame_callback = view.add_frame_callback(lambda: calls.append(1), rate=50)
+        self.assertEqual([delay for delay, _ in view.widget.scheduled.values()], [20])
+
+        view.widget.fire()
+        view.widget.fire()
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(frame_callback.frame_count, 2)
+
+        view.remove_frame_callback(frame_callback)
+        self.assertEqual(view.widget.scheduled, {})
+        view.widget.fire()
+        self.assertEqual(calls, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
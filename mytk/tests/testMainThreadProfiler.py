@@ -0,0 +1,108 @@
+import time
+import unittest
+from functools import partial
+
+from mytk.eventcapable import EventCapable
+from mytk.mainthreadprofiler import MainThreadProfiler
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestMainThreadProfiler(unittest.TestCase):
+    """Measurements without Tk: callbacks are run directly on this thread."""
+
+    def setUp(self):
+        self.profiler = MainThreadProfiler(stall_threshold=50)
+        self.profiler.start()
+
+    def tearDown(self):
+        self.profiler.stop()
+
+    def test_percentiles(self):
+        stats = MainThreadProfiler.percentiles(range(1, 101))
+        self.assertEqual(stats, {"p50": 50, "p95": 95, "p99": 99, "max": 100})
+
+    def test_percentiles_without_samples(self):
+        self.assertEqual(MainThreadProfiler.percentiles([])["p99"], 0.0)
+
+    def test_record_counts_and_waits(self):
+        self.profiler.record("main_queue", print, duration=0.002, wait=0.010)
+        self.profiler.record("event", print, duration=0.001)
+
+        stats = self.profiler.stats()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["main_queue"]["count"], 1)
+        self.assertAlmostEqual(stats["main_queue"]["wait_ms"]["max"], 10)
+        self.assertAlmostEqual(stats["main_queue"]["run_ms"]["p50"], 2)
+        self.assertEqual(stats["event"]["count"], 1)
+        self.assertEqual(stats["event"]["wait_ms"]["max"], 0.0)
+        self.assertEqual(stats["stall_count"], 0)
+
+    def test_wrap_keeps_return_value(self):
+        handler = self.profiler.wrap("event", lambda event: "break")
+        self.assertEqual(handler(None), "break")
+        self.assertEqual(self.profiler.stats()["event"]["count"], 1)
+
+    def test_handler_bound_before_profiling_is_measured(self):
+        class FakeWidget:
+            def bind(self, event, handler):
+                self.handler = handler
+
+        class View(EventCapable):
+            def __init__(self):
+                super().__init__()
+                self.widget = FakeWidget()
+
+        view = View()
+        view.bind_event("<Button-1>", lambda event: "break")
+        self.assertEqual(view.widget.handler(None), "break")  # Not profiling
+
+        EventCapable.main_thread_profiler = self.profiler
+        self.addCleanup(setattr, EventCapable, "main_thread_profiler", None)
+        self.assertEqual(view.widget.handler(None), "break")
+        self.assertEqual(self.profiler.stats()["event"]["count"], 1)
+
+    def test_wrap_after_measures_lateness(self):
+        callback = self.profiler.wrap_after(lambda: None, delay=0)
+        time.sleep(0.02)
+        callback()
+        self.assertGreaterEqual(self.profiler.stats()["after"]["wait_ms"]["max"], 15)
+
+    def test_stall_captures_stack(self):
+        self.profiler.wrap("event", busy_wait)(0.2)
+
+        stats = self.profiler.stats()
+        self.assertEqual(stats["stall_count"], 1)
+        stall = stats["stalls"][0]
+        self.assertEqual(stall["category"], "event")
+        self.assertEqual(stall["callback"], "busy_wait")
+        self.assertGreater(stall["duration_ms"], 50)
+        self.assertIn("busy_wait", stall["stack"])
+
+    def test_callback_name(self):
+        self.assertEqual(
+            MainThreadProfiler.callback_name(partial(busy_wait, 1)), "busy_wait"
+        )
+        self.assertEqual(
+            MainThreadProfiler.callback_name(self.setUp), "TestMainThreadProfiler.setUp"
+        )
+
+    def test_disabled_profiler_does_not_measure(self):
+        self.profiler.stop()
+        self.profiler.wrap("event", print)()
+        self.assertEqual(self.profiler.stats()["event"]["count"], 0)
+
+    def test_reset(self):
+        self.profiler.record("after", print, duration=1)
+        self.profiler.reset()
+        stats = self.profiler.stats()
+        self.assertEqual(stats["after"]["count"], 0)
+        self.assertEqual(stats["stalls"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
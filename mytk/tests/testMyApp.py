@@ -1,3 +1,4 @@
+import threading
 import unittest
 from functools import partial
 
@@ -88,6 +89,150 @@ class TestMyApp(envtest.MyTkTestCase):
         self.start_timed_mainloop(timeout=500)
         self.app.mainloop()
 
+    def test_fired_after_is_removed(self):
+        task_id = self.app.after(delay=50, function=self.do_nothing)
+        self.assertIn(task_id, self.app.scheduled_tasks)
+        self.start_timed_mainloop(timeout=300)
+        self.app.mainloop()
+        self.assertTrue(self.callback_function_called)
+        self.assertNotIn(task_id, self.app.scheduled_tasks)
+
+    def test_after_coalesced(self):
+        calls = []
+        for i in range(10):
+            self.app.after_coalesced("key", 50, partial(calls.append, i))
+        self.start_timed_mainloop(timeout=300)
+        self.app.mainloop()
+        self.assertEqual(calls, [9])
+
+    def test_widget_destroy_cancels_its_tasks(self):
+        label = Label(text="Temporary")
+        label.grid_into(self.app.window, row=0, column=0)
+        label.after(delay=1000, function=self.do_nothing)
+        label.widget.destroy()
+        self.assertEqual(len(label.scheduled_tasks), 0)
+
+    def test_main_queue_is_event_driven(self):
+        if self.app.root.tk.call("tk", "windowingsystem") == "win32":
+            self.skipTest("Tk file handlers are not available on Windows")
+        self.assertTrue(self.app.is_main_queue_event_driven)
+
+    def test_schedule_from_thread_wakes_main_queue(self):
+        if not self.app.is_main_queue_event_driven:
+            self.skipTest("Main queue is polled on this platform")
+
+        worker = threading.Thread(
+            target=lambda: self.app.schedule_on_main_thread(self.do_nothing)
+        )
+        self.app.after(delay=50, function=worker.start)
+        self.start_timed_mainloop(timeout=300)
+        self.app.mainloop()
+        worker.join()
+        self.assertTrue(self.callback_function_called)
+
+    def test_main_queue_priorities(self):
+        calls = []
+        self.app.schedule_on_main_thread(
+            calls.append, ["background"], priority=MainQueuePriority.background
+        )
+        self.app.schedule_on_main_thread(calls.append, ["normal"])
+        self.app.schedule_on_main_thread(
+            calls.append, ["ui"], priority=MainQueuePriority.ui
+        )
+        self.app.schedule_on_main_thread(calls.append, ["normal-2"])
+
+        self.app.run_main_queue()
+        self.assertEqual(calls, ["ui", "normal", "normal-2", "background"])
+
+    def test_main_queue_coalescing(self):
+        calls = []
+        for i in range(100):
+            self.app.schedule_on_main_thread(calls.append, [i], coalesce_key="plot")
+        self.app.schedule_on_main_thread(calls.append, ["other"])
+
+        self.app.run_main_queue()
+        self.assertEqual(calls, [99, "other"])
+
+        self.app.schedule_on_main_thread(calls.append, ["again"], coalesce_key="plot")
+        self.app.run_main_queue()
+        self.assertEqual(calls[-1], "again")
+
+    def test_coalesced_call_takes_higher_priority(self):
+        calls = []
+        self.app.schedule_on_main_thread(
+            calls.append, ["stale"], priority=MainQueuePriority.background,
+            coalesce_key="plot",
+        )
+        self.app.schedule_on_main_thread(calls.append, ["normal"])
+        self.app.schedule_on_main_thread(
+            calls.append, ["plot"], priority=MainQueuePriority.ui, coalesce_key="plot"
+        )
+        self.app.schedule_on_main_thread(
+            calls.append, ["plot-2"], priority=MainQueuePriority.background,
+            coalesce_key="plot",
+        )
+
+        self.app.run_main_queue()
+        self.assertEqual(calls, ["plot-2", "normal"])  # At ui priority, once
+        self.assertTrue(self.app.main_queue.empty())
+
+    def test_main_queue_time_budget(self):
+        calls = []
+        self.app.main_queue_time_budget = 0
+        for i in range(3):
+            self.app.schedule_on_main_thread(calls.append, [i])
+
+        self.app.run_main_queue()
+        self.assertEqual(calls, [0])  # always makes progress, then yields
+        self.assertEqual(self.app.main_queue.qsize(), 2)
+
+    def test_profiling_main_queue(self):
+        self.app.enable_profiling()
+        self.addCleanup(self.app.disable_profiling)
+        for i in range(3):
+            self.app.schedule_on_main_thread(self.do_nothing)
+        self.app.run_main_queue()
+
+        stats = self.app.main_thread_stats()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["main_queue"]["count"], 3)
+
+    def test_profiling_after_and_overlay(self):
+        self.app.enable_profiling(overlay=True)
+        self.addCleanup(self.app.disable_profiling)
+        self.app.after(delay=50, function=self.do_nothing)
+        self.start_timed_mainloop(timeout=300)
+        self.app.mainloop()
+
+        self.assertTrue(self.callback_function_called)
+        self.assertGreaterEqual(self.app.main_thread_stats()["after"]["count"], 1)
+
+    def test_main_thread_stats_without_profiling(self):
+        self.assertEqual(self.app.main_thread_stats(), {"enabled": False})
+
+    def test_frame_callback(self):
+        calls = []
+        frame_callback = self.app.add_frame_callback(lambda: calls.append(1), rate=50)
+        self.app.after(delay=200, function=partial(self.app.remove_frame_callback, frame_callback))
+        self.start_timed_mainloop(timeout=400)
+        self.app.mainloop()
+
+        self.assertTrue(3 <= len(calls) <= 12)
+        self.assertEqual(frame_callback.frame_count, len(calls))
+        self.assertFalse(frame_callback.is_active)
+
+    def test_frame_callback_paused_for_hidden_widget(self):
+        label = Label(text="Hidden")
+        calls = []
+        label.add_frame_callback(lambda: calls.append(1), rate=50)  # Not placed
+        self.start_timed_mainloop(timeout=200)
+        self.app.mainloop()
+        self.assertEqual(calls, [])
+
+    def test_quit_closes_main_queue_wakeup(self):
+        self.app.quit()
+        self.assertFalse(self.app.is_main_queue_event_driven)
+
 
 if __name__ == "__main__":
     unittest.main()
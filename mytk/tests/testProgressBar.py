@@ -62,6 +62,19 @@ class TestProgressBar(envtest.MyTkTestCase):
         self.start_timed_mainloop(function=start_then_stop, timeout=500)
         self.app.mainloop()
 
+    def test_start_animates_determinate_bar(self):
+        self.ui_object = ProgressBar()
+        self.ui_object.grid_into(self.app.window)
+        captured = []
+
+        self.ui_object.start(interval=20)
+        self.app.after(300, lambda: captured.append(self.ui_object.value))
+        self.app.after(310, self.ui_object.stop)
+        self.start_timed_mainloop(timeout=500)
+        self.app.mainloop()
+        self.assertGreater(captured[0], 0)
+        self.assertIsNone(self.ui_object._animation)
+
     def test_progress_window(self):
         self.ui_object = ProgressWindow(
             "Progress", "Working…", auto_click=(Dialog.Replies.Ok, 300)
@@ -1,9 +1,19 @@
+import asyncio
+import http.client
+import inspect
+import socket
 import threading
+import time
 import unittest
 import xmlrpc.client
+from unittest import mock
+
+import numpy as np
 
 import mytk
-from mytk import App, RemoteControllable, remote_command
+from mytk import App, Bindable, RemoteControllable, remote_command
+from mytk.remote import ConnectionPool, PooledTransport, RemoteAppProxy, clear_api_cache
+from mytk.remotecontrollable import RemoteCallStats, RemotePublisher, RemoteXMLRPCServer
 
 
 class RemoteApp(App, RemoteControllable):
@@ -150,6 +160,20 @@ class TestRemoteServer(unittest.TestCase):
         self._run_with_client(client_call)
         self.assertEqual(self.result, self.app.name)
 
+    def test_main_thread_stats_over_the_wire(self):
+        self.app.enable_profiling()
+        self.addCleanup(self.app.disable_profiling)
+        port = self.app.start_remote(port=0)
+
+        def client_call():
+            proxy = mytk.connect(port=port)
+            proxy.remote_app_name()
+            self.result = proxy.main_thread_stats()
+
+        self._run_with_client(client_call)
+        self.assertTrue(self.result["enabled"])
+        self.assertGreaterEqual(self.result["main_queue"]["count"], 1)
+
     def test_connect_matching_app_name_ok(self):
         @self.app.remote
         def add(a, b):
@@ -189,7 +213,7 @@ class TestRemoteServer(unittest.TestCase):
             proxy.configure(port=port)
             self.result = proxy.add(2, 3)  # known -> forwarded
             try:
-                proxy.nope()  # unknown -> caught before the network call
+                proxy.nope()  # unknown -> AttributeError, not a fault
             except AttributeError:
                 self.blocked = True
 
@@ -231,6 +255,685 @@ class TestRemoteServer(unittest.TestCase):
         self.assertIn("nope", self.fault_message)
 
 
+class TestRemoteXMLRPCServer(unittest.TestCase):
+    """The concurrent server on its own, with plain functions (no Tk)."""
+
+    def setUp(self):
+        self.server = RemoteXMLRPCServer(
+            ("127.0.0.1", 0), max_workers=2, allow_none=True, logRequests=False
+        )
+        self.release = threading.Event()
+        self.server.register_function(lambda value: value, "echo")
+        self.server.register_function(lambda: self.release.wait(5), "blocked")
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_slow_call_does_not_block_other_clients(self):
+        def slow_client():
+            with xmlrpc.client.ServerProxy(self.url) as proxy:
+                proxy.blocked()
+
+        slow = threading.Thread(target=slow_client)
+        slow.start()
+        with xmlrpc.client.ServerProxy(self.url) as proxy:
+            self.assertEqual(proxy.echo("fast"), "fast")
+        self.release.set()
+        slow.join(timeout=5)
+
+    def test_pipelined_requests_served(self):
+        requests = b""
+        for value in ("first", "second"):
+            body = xmlrpc.client.dumps((value,), "echo").encode()
+            requests += (
+                b"POST /RPC2 HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Type: text/xml\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+        with socket.create_connection(self.server.server_address, timeout=2) as client:
+            client.sendall(requests)  # Both in one packet: read together
+            responses = b""
+            while responses.count(b"</methodResponse>") < 2:
+                data = client.recv(65536)
+                self.assertTrue(data)
+                responses += data
+
+        self.assertLess(responses.index(b"first"), responses.index(b"second"))
+
+    def test_idle_connections_do_not_starve_clients(self):
+        # More kept-alive connections than workers, all idle
+        idle_proxies = [xmlrpc.client.ServerProxy(self.url) for _ in range(3)]
+        for proxy in idle_proxies:
+            proxy.echo(1)
+
+        start = time.perf_counter()
+        with xmlrpc.client.ServerProxy(self.url) as proxy:
+            for i in range(10):
+                self.assertEqual(proxy.echo(i), i)
+        self.assertLess(time.perf_counter() - start, 2)
+
+        for proxy in idle_proxies:  # Still served on the same connections
+            self.assertEqual(proxy.echo(2), 2)
+            proxy("close")()
+
+    def test_connection_kept_alive(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1])
+        body = xmlrpc.client.dumps((7,), "echo")
+        for _ in range(2):
+            connection.request("POST", "/RPC2", body, {"Content-Type": "text/xml"})
+            response = connection.getresponse()
+            self.assertEqual(xmlrpc.client.loads(response.read())[0], (7,))
+            self.assertFalse(response.will_close)
+        connection.close()
+
+    def test_pooled_connection_shared_by_proxies(self):
+        pool = ConnectionPool()
+        self.addCleanup(pool.clear)
+        for _ in range(2):
+            proxy = xmlrpc.client.ServerProxy(self.url, transport=PooledTransport(pool))
+            self.assertEqual(proxy.echo(1), 1)
+
+        host = f"127.0.0.1:{self.server.server_address[1]}"
+        connection = pool.acquire(host)
+        self.assertIsNotNone(connection.sock)  # Kept open after the calls
+        self.assertIsNone(pool.acquire(host).sock)  # Only one was needed
+        pool.release(host, connection)
+
+    def test_pooled_connection_kept_after_fault(self):
+        pool = ConnectionPool()
+        self.addCleanup(pool.clear)
+        proxy = xmlrpc.client.ServerProxy(self.url, transport=PooledTransport(pool))
+        self.assertEqual(proxy.echo(1), 1)
+        host = f"127.0.0.1:{self.server.server_address[1]}"
+        connection = pool.acquire(host)
+        pool.release(host, connection)
+
+        with self.assertRaises(xmlrpc.client.Fault):
+            proxy.nope()
+
+        self.assertIs(pool.acquire(host), connection)  # Not reconnected
+        self.assertIsNotNone(connection.sock)
+        pool.release(host, connection)
+        self.assertEqual(proxy.echo(2), 2)
+
+    def test_connections_closed_by_server_not_reused(self):
+        server = RemoteXMLRPCServer(
+            ("127.0.0.1", 0), keep_alive_timeout=0.2, allow_none=True, logRequests=False
+        )
+        server.register_function(lambda value: value, "echo")
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        pool = ConnectionPool()
+        self.addCleanup(pool.clear)
+        host = f"127.0.0.1:{server.server_address[1]}"
+        connections = [pool.acquire(host) for _ in range(4)]
+        for connection in connections:  # As left by concurrent calls
+            connection.request("POST", "/RPC2", xmlrpc.client.dumps((1,), "echo"))
+            connection.getresponse().read()
+            pool.release(host, connection)
+
+        time.sleep(0.5)  # Idle past the keep-alive timeout of the server
+        proxy = xmlrpc.client.ServerProxy(
+            f"http://{host}", transport=PooledTransport(pool)
+        )
+        self.assertEqual(proxy.echo(1), 1)
+        for connection in connections:
+            self.assertIsNone(connection.sock)  # Closed, not reused
+
+    def test_old_idle_connections_not_reused(self):
+        pool = ConnectionPool(max_idle_time=0)
+        self.addCleanup(pool.clear)
+        host = f"127.0.0.1:{self.server.server_address[1]}"
+        connection = pool.acquire(host)
+        connection.request("POST", "/RPC2", xmlrpc.client.dumps((1,), "echo"))
+        connection.getresponse().read()
+        pool.release(host, connection)
+        time.sleep(0.01)
+
+        self.assertIsNot(pool.acquire(host), connection)
+        self.assertIsNone(connection.sock)
+
+    def test_pooled_transport_used_by_several_threads(self):
+        pool = ConnectionPool()
+        self.addCleanup(pool.clear)
+        proxy = xmlrpc.client.ServerProxy(self.url, transport=PooledTransport(pool))
+        results = []
+
+        def client(value):
+            results.extend(proxy.echo(value) for _ in range(5))
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(sorted(results), [0] * 5 + [1] * 5)
+
+
+class ImmediateHost(RemoteControllable):
+    """Stands in for an App without Tk: "main thread" tasks run right away."""
+
+    def __init__(self):
+        super().__init__()
+        self.main_thread_tasks = 0
+
+    def schedule_on_main_thread(self, fct, args=None, kwargs=None, **options):
+        self.main_thread_tasks += 1
+        fct(*(args or []), **(kwargs or {}))
+
+
+class TestRemoteBatch(unittest.TestCase):
+    """Batched calls, from RemoteBatch to remote_multicall (no Tk)."""
+
+    def setUp(self):
+        self.host = ImmediateHost()
+        self.values = []
+        self.host.remote(self.values.append, name="append")
+        self.host.remote(lambda a, b: a + b, name="add")
+        self.host.remote(lambda: 1 / 0, name="fail")
+
+        self.server = RemoteXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+        for name, fct in self.host.remote_functions.items():
+            self.server.register_function(fct, name)
+        self.server.register_function(self.host.remote_multicall, "system.multicall")
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.proxy = mytk.connect(port=self.server.server_address[1])
+
+    def tearDown(self):
+        self.proxy("close")()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_batch_runs_in_one_main_thread_task(self):
+        with self.proxy.batch() as batch:
+            batch.append(1)
+            batch.append(2)
+            batch.add(2, 3)
+
+        self.assertEqual(batch.results, [None, None, 5])
+        self.assertEqual(self.values, [1, 2])
+        self.assertEqual(self.host.main_thread_tasks, 1)
+
+    def test_thread_safe_calls_run_on_server_thread(self):
+        self.host.remote(lambda: len(self.values), name="count", thread_safe=True)
+        self.server.register_function(self.host.remote_functions["count"], "count")
+
+        with self.proxy.batch() as batch:
+            batch.count()
+            batch.remote_app_name()
+        self.assertEqual(self.host.main_thread_tasks, 0)
+
+        with self.proxy.batch() as batch:
+            batch.append(1)
+            batch.append(2)
+            batch.count()
+            batch.append(3)
+        self.assertEqual(batch.results, [None, None, 2, None])
+        self.assertEqual(self.host.main_thread_tasks, 2)
+
+    def test_fault_does_not_stop_batch(self):
+        batch = self.proxy.batch(raise_on_fault=False)
+        batch.fail()
+        batch.add(1, 1)
+        results = batch.send()
+
+        self.assertIsInstance(results[0], xmlrpc.client.Fault)
+        self.assertIn("ZeroDivisionError", results[0].faultString)
+        self.assertEqual(results[1], 2)
+
+    def test_fault_raised_on_exit(self):
+        with self.assertRaises(xmlrpc.client.Fault), self.proxy.batch() as batch:
+            batch.append(1)
+            batch.fail()
+        self.assertEqual(self.values, [1])
+
+    def test_unknown_function_is_a_fault(self):
+        batch = self.proxy.batch(raise_on_fault=False)
+        batch.nope()
+        self.assertIsInstance(batch.send()[0], xmlrpc.client.Fault)
+
+    def test_empty_batch(self):
+        with self.proxy.batch() as batch:
+            pass
+        self.assertEqual(batch.results, [])
+        self.assertEqual(self.host.main_thread_tasks, 0)
+
+    def test_remote_app_proxy_validates_batch(self):
+        proxy = RemoteAppProxy()
+        proxy.configure(port=self.server.server_address[1])
+        self.addCleanup(lambda: proxy.proxy("close")())
+        self.server.register_function(self.host.remote_signatures, "remote_signatures")
+
+        with proxy.batch() as batch:
+            batch.add(1, 2)
+            with self.assertRaises(AttributeError):
+                batch.nope()
+        self.assertEqual(batch.results, [3])
+
+
+class TestRemoteAPI(unittest.TestCase):
+    """Versioned signatures, cached by the server and by RemoteAppProxy (no Tk)."""
+
+    def setUp(self):
+        clear_api_cache()
+        self.addCleanup(clear_api_cache)
+        self.host = ImmediateHost()
+        self.host.remote(lambda a, b: a + b, name="add")
+
+        self.server = RemoteXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+        self.server.register_function(self.host.remote_api, "remote_api")
+        self.server.register_function(self.host.remote_signatures, "remote_signatures")
+        self.server.register_function(self.host.remote_stats, "remote_stats")
+        self.server.call_stats = self.host.remote_call_stats
+        self.register_functions()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def register_functions(self):
+        for name, fct in self.host.remote_functions.items():
+            self.server.register_function(fct, name)
+
+    def api_requests(self):
+        functions = mytk.connect(port=self.port).remote_stats()["functions"]
+        return functions.get("remote_api", {"count": 0})["count"]
+
+    def test_signatures_computed_once(self):
+        with mock.patch("mytk.remotecontrollable.inspect.signature", wraps=inspect.signature) as signature:
+            self.host.remote_signatures()
+            self.host.remote_signatures()
+        self.assertEqual(signature.call_count, 1)
+
+    def test_version_changes_when_a_function_is_exposed(self):
+        version = self.host.remote_api()["version"]
+        self.assertEqual(self.host.remote_api()["version"], version)
+
+        self.host.remote(lambda: None, name="ping")
+        api = self.host.remote_api()
+        self.assertNotEqual(api["version"], version)
+        self.assertIn("ping", api["signatures"])
+
+    def test_version_depends_only_on_signatures(self):
+        other = ImmediateHost()
+        other.remote(lambda a, b: a - b, name="add")
+        self.assertEqual(other.remote_api()["version"], self.host.remote_api()["version"])
+
+    def test_signatures_not_sent_for_current_version(self):
+        version = self.host.remote_api()["version"]
+        self.assertEqual(
+            self.host.remote_api(version), {"version": version, "signatures": None}
+        )
+
+    def test_reconnect_reuses_signatures(self):
+        proxy = RemoteAppProxy()
+        proxy.configure(port=self.port)
+        self.assertEqual(proxy.add(1, 2), 3)
+
+        proxy.configure(port=self.port)  # Reconnects
+        self.assertEqual(proxy.add(2, 2), 4)
+        other = RemoteAppProxy()
+        other.configure(port=self.port)
+        self.assertEqual(other.add(3, 2), 5)
+
+        self.assertEqual(self.api_requests(), 1)
+
+    def test_unknown_name_revalidates(self):
+        proxy = RemoteAppProxy()
+        proxy.configure(port=self.port)
+        proxy.add(1, 2)
+
+        self.host.remote(lambda: "pong", name="ping")
+        self.register_functions()
+        self.assertEqual(proxy.ping(), "pong")
+        with self.assertRaises(AttributeError):
+            proxy.nope()
+
+    def test_server_without_remote_api(self):
+        del self.server.funcs["remote_api"]
+        proxy = RemoteAppProxy()
+        proxy.configure(port=self.port)
+        self.assertEqual(proxy.add(1, 2), 3)
+
+
+class TestBinaryTransport(unittest.TestCase):
+    """Calls sent with transport="binary" (no Tk)."""
+
+    def setUp(self):
+        self.host = ImmediateHost()
+        self.host.app_name = "Camera"
+        self.host.remote(lambda shape: np.ones(shape, dtype=np.uint16), name="frame")
+        self.host.remote(lambda array: float(array.sum()), name="total")
+        self.host.remote(lambda: 1 / 0, name="fail")
+
+        self.server = RemoteXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+        for name, fct in self.host.remote_functions.items():
+            self.server.register_function(fct, name)
+        self.server.register_function(self.host.remote_app_name, "remote_app_name")
+        self.server.register_function(self.host.remote_transports, "remote_transports")
+        self.server.register_function(self.host.remote_multicall, "system.multicall")
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_arrays_both_ways(self):
+        proxy = mytk.connect(port=self.port, app_name="Camera", transport="binary")
+
+        frame = proxy.frame([480, 640])
+        self.assertEqual(frame.shape, (480, 640))
+        self.assertEqual(frame.dtype, np.uint16)
+        self.assertEqual(proxy.total(frame), 480 * 640)
+
+    def test_fault(self):
+        proxy = mytk.connect(port=self.port, transport="binary")
+        with self.assertRaises(xmlrpc.client.Fault) as context:
+            proxy.fail()
+        self.assertIn("ZeroDivisionError", context.exception.faultString)
+
+    def test_batch(self):
+        proxy = mytk.connect(port=self.port, transport="binary")
+        with proxy.batch() as batch:
+            batch.frame([2, 2])
+            batch.total(np.arange(4))
+        self.assertEqual(batch.results[0].shape, (2, 2))
+        self.assertEqual(batch.results[1], 6)
+
+    def test_falls_back_to_xmlrpc(self):
+        # A server that does not answer remote_transports, like older versions
+        del self.server.funcs["remote_transports"]
+        with self.assertWarns(RuntimeWarning):
+            proxy = mytk.connect(port=self.port, transport="binary")
+        self.assertIsInstance(proxy, xmlrpc.client.ServerProxy)
+
+    def test_unknown_transport(self):
+        with self.assertRaises(ValueError):
+            mytk.connect(port=self.port, transport="json")
+
+
+class TestRemoteCallStats(unittest.TestCase):
+    """Per-function counts and latency breakdown of the calls served (no Tk)."""
+
+    def setUp(self):
+        self.host = ImmediateHost()
+        self.host.remote(lambda: time.sleep(0.05), name="slow")
+        self.host.remote(lambda a, b: a + b, name="add", thread_safe=True)
+        self.host.remote(lambda: 1 / 0, name="fail")
+
+        self.server = RemoteXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+        for name, fct in self.host.remote_functions.items():
+            if name not in self.host.remote_thread_safe_functions:
+                fct = self.host.remote_wrapper(fct)
+            self.server.register_function(fct, name)
+        self.server.register_function(self.host.remote_stats, "remote_stats")
+        self.server.register_function(self.host.remote_transports, "remote_transports")
+        self.server.register_function(self.host.remote_multicall, "system.multicall")
+        self.server.call_stats = self.host.remote_call_stats
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.proxy = mytk.connect(port=self.server.server_address[1])
+
+    def tearDown(self):
+        self.proxy("close")()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_calls_counted_per_function(self):
+        for _ in range(3):
+            self.proxy.add(1, 2)
+        self.proxy.slow()
+
+        functions = self.proxy.remote_stats()["functions"]
+        self.assertEqual(functions["add"]["count"], 3)
+        self.assertEqual(functions["slow"]["count"], 1)
+        self.assertEqual(functions["add"]["errors"], 0)
+
+    def test_latency_breakdown(self):
+        self.proxy.slow()
+
+        slow = self.proxy.remote_stats()["functions"]["slow"]
+        self.assertGreaterEqual(slow["run_ms"]["p50"], 50)
+        self.assertGreaterEqual(slow["total_ms"]["p50"], slow["run_ms"]["p50"])
+        for phase in RemoteCallStats.phases:
+            self.assertIn(f"{phase}_ms", slow)
+
+    def test_thread_safe_function_does_not_queue(self):
+        self.proxy.add(1, 2)
+        add = self.proxy.remote_stats()["functions"]["add"]
+        self.assertEqual(add["queue_ms"]["max"], 0)
+
+    def test_errors_counted(self):
+        with self.assertRaises(xmlrpc.client.Fault):
+            self.proxy.fail()
+        self.assertEqual(self.proxy.remote_stats()["functions"]["fail"]["errors"], 1)
+
+    def test_unknown_function_not_recorded(self):
+        with self.assertRaises(xmlrpc.client.Fault):
+            self.proxy.nope()
+        self.assertNotIn("nope", self.proxy.remote_stats()["functions"])
+
+    def test_batch_and_binary_calls(self):
+        with self.proxy.batch() as batch:
+            batch.add(1, 2)
+        binary = mytk.connect(port=self.server.server_address[1], transport="binary")
+        binary.add(1, 2)
+
+        functions = binary.remote_stats()["functions"]
+        self.assertEqual(functions["system.multicall"]["count"], 1)
+        self.assertEqual(functions["add"]["count"], 1)
+
+    def test_call_counted_before_response_sent(self):
+        stats = RemoteCallStats()
+        stats.start_call()
+        stats.set_method("f")
+        stats.end_dispatch()
+        stats.end_phase("encode")
+        stats.record_call()
+
+        f = stats.stats()["functions"]["f"]
+        self.assertEqual(f["count"], 1)
+        self.assertEqual(f["total_ms"]["max"], 0.0)  # Not sent yet
+
+        time.sleep(0.01)
+        stats.end_call()
+        f = stats.stats()["functions"]["f"]
+        self.assertEqual(f["count"], 1)
+        self.assertGreaterEqual(f["write_ms"]["max"], 10)
+
+    def test_queue_and_run_split(self):
+        stats = RemoteCallStats()
+        stats.start_call()
+        stats.set_method("f")
+        time.sleep(0.02)
+        stats.set_run_time(0.005)
+        stats.end_dispatch()
+        stats.end_call()
+
+        f = stats.stats()["functions"]["f"]
+        self.assertEqual(f["count"], 1)
+        self.assertAlmostEqual(f["run_ms"]["p50"], 5)
+        self.assertGreaterEqual(f["queue_ms"]["p50"], 14)
+
+
+class TestAsyncClient(unittest.TestCase):
+    """connect_async() and call_many() with two servers (no Tk)."""
+
+    def setUp(self):
+        self.servers = []
+        self.release = threading.Event()
+        for app_name in ("Laser", "Stage"):
+            server = RemoteXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+            server.register_function(lambda app_name=app_name: app_name, "remote_app_name")
+            server.register_function(lambda: self.release.wait(0.3), "slow")
+            server.register_function(lambda: 1 / 0, "fail")
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers.append(server)
+        self.ports = [server.server_address[1] for server in self.servers]
+
+    def tearDown(self):
+        self.release.set()
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_connect_async(self):
+        async def names():
+            proxies = [await mytk.connect_async(port=port) for port in self.ports]
+            return await asyncio.gather(*(proxy.remote_app_name() for proxy in proxies))
+
+        self.assertEqual(asyncio.run(names()), ["Laser", "Stage"])
+
+    def test_connect_async_checks_app_name(self):
+        with self.assertRaises(mytk.RemoteAppMismatch):
+            asyncio.run(mytk.connect_async(port=self.ports[0], app_name="Stage"))
+
+    def test_async_calls_run_concurrently(self):
+        async def slow_calls():
+            proxies = [await mytk.connect_async(port=port) for port in self.ports]
+            return await asyncio.gather(*(proxy.slow() for proxy in proxies))
+
+        start = time.perf_counter()
+        asyncio.run(slow_calls())
+        self.assertLess(time.perf_counter() - start, 0.55)
+
+    def test_call_many(self):
+        laser, stage = (mytk.connect(port=port) for port in self.ports)
+        results = mytk.call_many(
+            [(laser, "remote_app_name"), (stage, "remote_app_name"), (stage, "fail")]
+        )
+
+        self.assertEqual(results[:2], ["Laser", "Stage"])
+        self.assertIsInstance(results[2], xmlrpc.client.Fault)
+
+    def test_call_many_runs_calls_concurrently(self):
+        laser, stage = (mytk.connect(port=port) for port in self.ports)
+        start = time.perf_counter()
+        mytk.call_many([(laser, "slow"), (stage, "slow")])
+        self.assertLess(time.perf_counter() - start, 0.55)
+
+    def test_call_many_timeout(self):
+        laser = mytk.connect(port=self.ports[0])
+        results = mytk.call_many([(laser, "slow"), (laser, "remote_app_name")], timeout=0.1)
+
+        self.assertIsInstance(results[0], TimeoutError)
+        self.assertEqual(results[1], "Laser")
+
+
+class TestRemotePublisher(unittest.TestCase):
+    """Events pushed to a socket, without a server."""
+
+    def setUp(self):
+        self.publisher = RemotePublisher(max_rate=10)
+        self.server_end, self.client_end = socket.socketpair()
+        self.client_end.settimeout(2)
+        self.addCleanup(self.client_end.close)
+        self.addCleanup(self.publisher.close)
+
+    def read_events(self, count):
+        received = b""
+        while received.count(b"\n\n") < count:
+            received += self.client_end.recv(4096)
+        return received.decode().split("\n\n")[:count]
+
+    def test_current_value_sent_on_subscribe(self):
+        self.publisher.publish("power", 2.5)
+        self.publisher.subscribe(self.server_end)
+
+        self.assertEqual(self.read_events(1), ["event: power\ndata: 2.5"])
+
+    def test_only_subscribed_topics(self):
+        self.publisher.subscribe(self.server_end, topics=["position"])
+        self.publisher.publish("power", 1)
+        self.publisher.publish("position", [1, 2])
+
+        self.assertEqual(self.read_events(1), ["event: position\ndata: [1, 2]"])
+
+    def test_updates_coalesced_to_max_rate(self):
+        self.publisher.subscribe(self.server_end)
+        self.publisher.publish("power", 0)
+        self.read_events(1)
+
+        start = time.monotonic()
+        for value in range(1, 100):
+            self.publisher.publish("power", value)
+
+        self.assertEqual(self.read_events(1), ["event: power\ndata: 99"])
+        self.assertGreater(time.monotonic() - start, 0.05)  # 10 per second
+
+    def test_client_asks_for_a_lower_rate(self):
+        self.publisher.subscribe(self.server_end, max_rate=1000)
+        self.assertEqual(self.publisher._subscribers[0].period, 0.1)
+
+    def test_disconnected_client_removed(self):
+        self.publisher.subscribe(self.server_end)
+        self.client_end.close()
+        for value in range(3):
+            self.publisher.publish("power", value)
+            time.sleep(0.15)
+
+        self.assertEqual(self.publisher.subscriber_count, 0)
+
+
+class TestSubscriptions(unittest.TestCase):
+    """mytk.subscribe() with a server (no Tk)."""
+
+    def setUp(self):
+        self.host = ImmediateHost()
+        self.server = RemoteXMLRPCServer(("127.0.0.1", 0), max_workers=1, allow_none=True, logRequests=False)
+        self.server.register_function(self.host.remote_topics, "remote_topics")
+        self.server.publisher = self.host.remote_publisher
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_published_values_pushed(self):
+        self.host.publish("status", {"on": True})
+        with mytk.subscribe(["status"], port=self.port, timeout=2) as updates:
+            self.assertEqual(next(updates), ("status", {"on": True}))
+            self.host.publish("status", {"on": False})
+            self.assertEqual(next(updates), ("status", {"on": False}))
+
+    def test_subscription_does_not_hold_a_worker(self):
+        self.host.publish("status", 1)
+        with mytk.subscribe(port=self.port, timeout=2) as updates:
+            next(updates)
+            with xmlrpc.client.ServerProxy(f"http://127.0.0.1:{self.port}") as proxy:
+                self.assertEqual(proxy.remote_topics(), ["status"])
+
+    def test_bindable_property_published(self):
+        model = Bindable()
+        model.temperature = 20
+        self.host.publish_property("temperature", model=model, topic="temp")
+        with mytk.subscribe(["temp"], port=self.port, timeout=2) as updates:
+            self.assertEqual(next(updates), ("temp", 20))
+            model.temperature = 21
+            self.assertEqual(next(updates), ("temp", 21))
+
+    def test_server_closed_ends_iteration(self):
+        updates = mytk.subscribe(port=self.port, timeout=2)
+        self.addCleanup(updates.close)
+        self.server.server_close()
+        self.assertEqual(list(updates), [])
+
+    def test_invalid_rate(self):
+        with self.assertRaises(xmlrpc.client.ProtocolError):
+            mytk.subscribe(port=self.port, max_rate=0)
+
+
 class CommandApp(App, RemoteControllable):
     """An App exposing methods declared in its class body via @remote_command."""
 
@@ -282,6 +985,25 @@ class TestRemoteCommands(unittest.TestCase):
         self.app.mainloop()
         thread.join(timeout=3)
 
+    def test_thread_safe_command_tag(self):
+        @remote_command(thread_safe=True)
+        def poll():
+            pass
+
+        self.assertTrue(poll._remote_thread_safe)
+        self.assertFalse(CommandApp.flip._remote_thread_safe)
+
+    def test_thread_safe_command_runs_off_main_thread(self):
+        self.app.remote(lambda: threading.current_thread().name, name="thread_name", thread_safe=True)
+        self.assertIn("thread_name", self.app.remote_thread_safe_functions)
+        port = self.app.start_remote(port=0)
+
+        def client_call():
+            self.result = mytk.connect(port=port).thread_name()
+
+        self._run_with_client(client_call)
+        self.assertTrue(self.result.startswith("mytk-server-worker"))
+
     def test_register_scans_class_without_triggering_properties(self):
         # Sanity: the property really does raise when its getter runs...
         with self.assertRaises(RuntimeError):
@@ -1,10 +1,12 @@
 import contextlib
 import io
 import threading
+import time
 import unittest
 
 from mytk import App, RemoteControllable, remote_command
-from mytk.remotecli import parse_command, run
+from mytk.remotecli import benchmark, parse_command, run
+from mytk.remotecontrollable import RemoteXMLRPCServer
 
 
 class TestParseCommand(unittest.TestCase):
@@ -79,6 +81,12 @@ class TestRemoteCLI(unittest.TestCase):
         self.assertEqual(self.output.strip(), "True")
         self.assertTrue(self.app.flag)
 
+    def test_several_calls_in_one_request(self):
+        port = self.app.start_remote(port=0)
+        self._run_cli(["flip()", "remote_app_name()", "--port", str(port)])
+        self.assertEqual(self.rc, 0)
+        self.assertEqual(self.output.split(), ["True", self.id()])
+
     def test_list_shows_signatures(self):
         port = self.app.start_remote(port=0)
         self._run_cli(["--list", "--port", str(port)])
@@ -101,5 +109,59 @@ class TestRemoteCLIOffline(unittest.TestCase):
         self.assertEqual(rc, 1)
 
 
+class TestBenchmark(unittest.TestCase):
+    """`mytk --bench` against a server without Tk."""
+
+    def setUp(self):
+        self.server = RemoteXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+        self.server.register_function(lambda a, b: a + b, "add")
+        self.server.register_function(lambda: self.server.call_stats.stats(), "remote_stats")
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = str(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _run(self, argv):
+        out = io.StringIO()
+        err = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = run(argv)
+        return code, out.getvalue(), err.getvalue()
+
+    def test_benchmark_counts_requests(self):
+        calls = []
+        result = benchmark(lambda: calls.append(time.sleep(0.01)), concurrency=2, duration=0.2)
+
+        self.assertEqual(result["count"], len(calls))
+        self.assertEqual(result["errors"], 0)
+        self.assertGreater(result["rate"], 0)
+        self.assertGreaterEqual(result["latency_ms"]["p50"], 10)
+
+    def test_benchmark_counts_errors(self):
+        result = benchmark(lambda: 1 / 0, concurrency=1, duration=0.05)
+        self.assertEqual(result["errors"], result["count"])
+        self.assertIsInstance(result["first_error"], ZeroDivisionError)
+
+    def test_bench_reports_throughput_and_server_breakdown(self):
+        code, out, _ = self._run([
+            "--bench", "add(1, 2)", "--port", self.port,
+            "--concurrency", "2", "--duration", "0.3",
+        ])
+        self.assertEqual(code, 0)
+        self.assertIn("requests/s", out)
+        self.assertIn("latency (ms): p50", out)
+        self.assertIn("server p50 (ms): read", out)
+        self.assertGreater(self.server.call_stats.stats()["functions"]["add"]["count"], 1)
+
+    def test_bench_failing_call_exits_1(self):
+        code, _, err = self._run([
+            "--bench", "nope()", "--port", self.port, "--duration", "0.1",
+        ])
+        self.assertEqual(code, 1)
+        self.assertIn("requests failed", err)
+
+
 if __name__ == "__main__":
     unittest.main()
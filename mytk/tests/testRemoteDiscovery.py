@@ -5,9 +5,12 @@ multicast traffic, sockets, or Tk window are needed. End-to-end socket behavior
 of the remote server itself is covered by testRemote.py / testRemoteCLI.py.
 """
 
+import asyncio
 import contextlib
 import io
 import sys
+import threading
+import time
 import types
 import unittest
 from unittest import mock
@@ -57,36 +60,70 @@ def _make_fake_zeroconf(services):
         def close(self):
             pass
 
+    browsers = []
+
     class FakeServiceBrowser:
         def __init__(self, zc, type_, listener):
-            for info in infos:
+            self.zc = zc
+            self.type = type_
+            self.listener = listener
+            browsers.append(self)
+            for info in list(infos):
                 if info.type == type_:
                     listener.add_service(zc, type_, info.name)
 
+    def advertise(service_type, name, ip, port, properties):
+        # Advertise a service after browsing started, as a new app would.
+        infos.append(FakeServiceInfo(service_type, name, ip, port, properties))
+        for browser in browsers:
+            if browser.type == service_type:
+                browser.listener.add_service(browser.zc, service_type, name)
+
+    def withdraw(service_type, name):
+        infos[:] = [info for info in infos if info.name != name]
+        for browser in browsers:
+            if browser.type == service_type:
+                browser.listener.remove_service(browser.zc, service_type, name)
+
     module = types.ModuleType("zeroconf")
     module.ServiceInfo = FakeServiceInfo
     module.Zeroconf = FakeZeroconf
     module.ServiceBrowser = FakeServiceBrowser
+    module.advertise = advertise
+    module.withdraw = withdraw
     return module
 
 
+def _install_fake_zeroconf(test, services):
+    """Install a fake zeroconf for a test, with a new shared service browser."""
+    # The shared browser keeps the servers it saw: start each network afresh.
+    remote.close_service_browser()
+    test.addCleanup(remote.close_service_browser)
+    fake = _make_fake_zeroconf(services)
+    patcher = mock.patch.dict(sys.modules, {"zeroconf": fake})
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    return fake
+
+
 class TestDiscover(unittest.TestCase):
     """mytk.discover() browsing behavior, with real connect() stubbed out."""
 
     SERVICE_TYPE = "_mytk._tcp.local."
 
+    def setUp(self):
+        remote.clear_discovery_cache()
+        self.addCleanup(remote.clear_discovery_cache)
+
     def _install_zeroconf(self, services):
-        fake = _make_fake_zeroconf(services)
-        patcher = mock.patch.dict(sys.modules, {"zeroconf": fake})
-        patcher.start()
-        self.addCleanup(patcher.stop)
+        return _install_fake_zeroconf(self, services)
 
     def _capture_connect(self):
         # discover() ends by calling remote.connect(host, port, app_name); capture
         # its arguments and hand back a sentinel instead of opening a socket.
         calls = []
 
-        def fake_connect(host, port, app_name=None):
+        def fake_connect(host, port, app_name=None, transport="xmlrpc"):
             calls.append((host, port, app_name))
             return f"proxy://{host}:{port}"
 
@@ -121,6 +158,31 @@ class TestDiscover(unittest.TestCase):
         # Only B's endpoint is used, and its identity is passed to connect().
         self.assertEqual(calls, [("192.168.1.20", 2222, "B")])
 
+    def test_discover_returns_when_found(self):
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 1111, {"app": "A"})]
+        )
+        self._capture_connect()
+
+        start = time.monotonic()
+        remote.discover(app_name="A", timeout=10)
+        self.assertLess(time.monotonic() - start, 1)  # Not the whole timeout
+
+    def test_discover_finds_server_advertised_later(self):
+        fake = self._install_zeroconf([])
+        calls = self._capture_connect()
+        timer = threading.Timer(
+            0.1, fake.advertise,
+            (self.SERVICE_TYPE, "A." + self.SERVICE_TYPE, "192.168.1.10", 1111, {"app": "A"}),
+        )
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        remote.discover(app_name="A", timeout=10)
+
+        self.assertEqual(calls, [("192.168.1.10", 1111, "A")])
+
     def test_discover_times_out_when_no_service(self):
         self._install_zeroconf([])
         self._capture_connect()
@@ -147,6 +209,151 @@ class TestDiscover(unittest.TestCase):
         with self.assertRaises(ImportError):
             remote.discover(timeout=0.2)
 
+    def test_discover_reuses_cached_address(self):
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 1111, {"app": "A"})]
+        )
+        calls = self._capture_connect()
+        remote.discover(app_name="A", timeout=1.0)
+
+        # The app is no longer advertised, but its address is still cached.
+        self._install_zeroconf([])
+        proxy = remote.discover(app_name="A", timeout=0.2)
+
+        self.assertEqual(proxy, "proxy://192.168.1.10:1111")
+        self.assertEqual(len(calls), 2)
+
+    def test_discover_cache_expires(self):
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 1111, {"app": "A"})]
+        )
+        self._capture_connect()
+        remote.discover(app_name="A", timeout=1.0, cache_ttl=0.05)
+        time.sleep(0.1)
+
+        self._install_zeroconf([])
+        with self.assertRaises(TimeoutError):
+            remote.discover(app_name="A", timeout=0.2)
+
+    def test_discover_browses_again_when_cached_address_fails(self):
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 1111, {"app": "A"})]
+        )
+        self._capture_connect()
+        remote.discover(app_name="A", timeout=1.0)
+
+        # The app restarted on another port: the cached one refuses.
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 2222, {"app": "A"})]
+        )
+        calls = []
+
+        def fake_connect(host, port, app_name=None, transport="xmlrpc"):
+            calls.append((host, port, app_name))
+            if port == 1111:
+                raise ConnectionRefusedError
+            return f"proxy://{host}:{port}"
+
+        with mock.patch.object(remote, "connect", fake_connect):
+            proxy = remote.discover(app_name="A", timeout=1.0)
+
+        self.assertEqual(proxy, "proxy://192.168.1.10:2222")
+        self.assertEqual(
+            calls, [("192.168.1.10", 1111, "A"), ("192.168.1.10", 2222, "A")]
+        )
+
+
+    def test_cached_address_probed_without_app_name(self):
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 1111, {"app": "A"})]
+        )
+        self._capture_connect()
+        remote.discover(timeout=1.0)
+
+        # The app quit and restarted on another port. connect() without an
+        # app name does not reach the server, so the cached address is probed.
+        self._install_zeroconf(
+            [(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+              "192.168.1.10", 2222, {"app": "A"})]
+        )
+        stale = mock.Mock()
+        stale.remote_app_name.side_effect = ConnectionRefusedError
+        live = mock.Mock()
+
+        def fake_connect(host, port, app_name=None, transport="xmlrpc"):
+            return stale if port == 1111 else live
+
+        with mock.patch.object(remote, "connect", fake_connect):
+            proxy = remote.discover(timeout=1.0)
+
+        self.assertIs(proxy, live)
+        stale.remote_app_name.assert_called_once_with()
+
+
+class TestAsyncDiscovery(unittest.TestCase):
+    """browse_async() and discover_async(), with a fake zeroconf."""
+
+    SERVICE_TYPE = "_mytk._tcp.local."
+
+    def setUp(self):
+        remote.clear_discovery_cache()
+        self.addCleanup(remote.clear_discovery_cache)
+        self.zeroconf = _install_fake_zeroconf(self, [
+            (self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+             "192.168.1.10", 1111, {"app": "A"}),
+            (self.SERVICE_TYPE, "B." + self.SERVICE_TYPE,
+             "192.168.1.20", 2222, {"app": "B"}),
+        ])
+
+    def test_browse_async_yields_servers_as_they_appear(self):
+        async def first_server():
+            async for server in remote.browse_async(timeout=10):
+                return server
+
+        start = time.monotonic()
+        server = asyncio.run(first_server())
+        self.assertEqual((server["app"], server["port"]), ("A", 1111))
+        self.assertLess(time.monotonic() - start, 1)  # Not the whole timeout
+
+    def test_browse_async_stops_at_timeout(self):
+        async def all_servers():
+            return [server["app"] async for server in remote.browse_async(timeout=0.1)]
+
+        self.assertEqual(asyncio.run(all_servers()), ["A", "B"])
+
+    def test_browse_async_stops_at_expected_count(self):
+        async def servers():
+            return [
+                server["app"]
+                async for server in remote.browse_async(timeout=10, expected_count=2)
+            ]
+
+        start = time.monotonic()
+        self.assertEqual(asyncio.run(servers()), ["A", "B"])
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_discover_async(self):
+        calls = []
+
+        def fake_connect(host, port, app_name=None, transport="xmlrpc"):
+            calls.append((host, port, app_name))
+            return f"proxy://{host}:{port}"
+
+        with mock.patch.object(remote, "connect", fake_connect):
+            proxy = asyncio.run(remote.discover_async(app_name="B", timeout=10))
+
+        self.assertEqual(proxy.proxy, "proxy://192.168.1.20:2222")
+        self.assertEqual(calls, [("192.168.1.20", 2222, "B")])
+
+    def test_discover_async_times_out(self):
+        with self.assertRaises(TimeoutError):
+            asyncio.run(remote.discover_async(app_name="C", timeout=0.1))
+
 
 class TestBrowse(unittest.TestCase):
     """mytk.browse() collecting every advertised server without connecting."""
@@ -154,10 +361,7 @@ class TestBrowse(unittest.TestCase):
     SERVICE_TYPE = "_mytk._tcp.local."
 
     def _install_zeroconf(self, services):
-        fake = _make_fake_zeroconf(services)
-        patcher = mock.patch.dict(sys.modules, {"zeroconf": fake})
-        patcher.start()
-        self.addCleanup(patcher.stop)
+        return _install_fake_zeroconf(self, services)
 
     def test_browse_returns_all_advertised_servers_sorted(self):
         self._install_zeroconf([
@@ -175,6 +379,69 @@ class TestBrowse(unittest.TestCase):
             [("A", "192.168.1.10", 1111), ("B", "192.168.1.20", 2222)],
         )
 
+    def test_browse_returns_at_expected_count(self):
+        self._install_zeroconf([
+            (self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+             "192.168.1.10", 1111, {"app": "A"}),
+            (self.SERVICE_TYPE, "B." + self.SERVICE_TYPE,
+             "192.168.1.20", 2222, {"app": "B"}),
+        ])
+
+        start = time.monotonic()
+        servers = remote.browse(timeout=10, expected_count=2)
+
+        self.assertEqual([s["app"] for s in servers], ["A", "B"])
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_browse_returns_when_until_is_satisfied(self):
+        self._install_zeroconf([
+            (self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+             "192.168.1.10", 1111, {"app": "A"}),
+            (self.SERVICE_TYPE, "B." + self.SERVICE_TYPE,
+             "192.168.1.20", 2222, {"app": "B"}),
+        ])
+
+        servers = remote.browse(timeout=10, until=lambda server: server["app"] == "A")
+
+        self.assertEqual([s["app"] for s in servers], ["A"])
+
+    def test_iter_servers_yields_servers_as_advertised(self):
+        fake = self._install_zeroconf([
+            (self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+             "192.168.1.10", 1111, {"app": "A"}),
+        ])
+        servers = remote.iter_servers(timeout=10, expected_count=2)
+
+        self.assertEqual(next(servers)["app"], "A")  # Already advertised
+        fake.advertise(
+            self.SERVICE_TYPE, "B." + self.SERVICE_TYPE, "192.168.1.20", 2222, {"app": "B"}
+        )
+        self.assertEqual(next(servers)["app"], "B")
+        with self.assertRaises(StopIteration):
+            next(servers)
+
+    def test_browse_forgets_withdrawn_servers(self):
+        fake = self._install_zeroconf([
+            (self.SERVICE_TYPE, "A." + self.SERVICE_TYPE,
+             "192.168.1.10", 1111, {"app": "A"}),
+            (self.SERVICE_TYPE, "B." + self.SERVICE_TYPE,
+             "192.168.1.20", 2222, {"app": "B"}),
+        ])
+        remote.browse(timeout=0.1)
+
+        fake.withdraw(self.SERVICE_TYPE, "A." + self.SERVICE_TYPE)
+
+        self.assertEqual([s["app"] for s in remote.browse(timeout=0.1)], ["B"])
+
+    def test_browsing_is_shared(self):
+        self._install_zeroconf([])
+        remote.browse(timeout=0.05)
+        browser = remote.service_browser()
+        remote.browse(timeout=0.05)
+
+        self.assertIs(remote.service_browser(), browser)
+        self.assertEqual(list(browser._browsers), [self.SERVICE_TYPE])
+
     def test_browse_empty_when_no_service(self):
         self._install_zeroconf([])
 
@@ -235,6 +502,7 @@ class TestRemoteCLIDiscovery(unittest.TestCase):
             app_name="Microscope",
             service_type="_custom._tcp.local.",
             timeout=1.5,
+            transport="xmlrpc",
         )
 
     def test_discover_timeout_reports_error(self):
@@ -262,19 +530,28 @@ class TestRemoteCLIDiscovery(unittest.TestCase):
              "port": 44011, "service": "Laser._mytk._tcp.local."},
         ]
         with mock.patch(
-            "mytk.remotecli.browse", return_value=servers
-        ) as browse:
+            "mytk.remotecli.iter_servers", return_value=iter(servers)
+        ) as iter_servers:
             code, out, _ = self._run(["--browse"])
         self.assertEqual(code, 0)
         self.assertIn("Microscope\t192.168.1.42:55444", out)
         self.assertIn("Laser\t192.168.1.63:44011", out)
-        browse.assert_called_once_with(
-            service_type="_mytk._tcp.local.", timeout=3.0
+        iter_servers.assert_called_once_with(
+            service_type="_mytk._tcp.local.", timeout=3.0, expected_count=None
+        )
+
+    def test_browse_expect(self):
+        with mock.patch(
+            "mytk.remotecli.iter_servers", return_value=iter([])
+        ) as iter_servers:
+            self._run(["--browse", "--expect", "2"])
+        iter_servers.assert_called_once_with(
+            service_type="_mytk._tcp.local.", timeout=3.0, expected_count=2
         )
 
     def test_browse_needs_no_command(self):
         # --browse must not require a positional command, like --list.
-        with mock.patch("mytk.remotecli.browse", return_value=[]):
+        with mock.patch("mytk.remotecli.iter_servers", return_value=iter([])):
             code, out, err = self._run(["--browse"])
         self.assertEqual(code, 0)
         self.assertEqual(out, "")
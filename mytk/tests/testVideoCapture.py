@@ -0,0 +1,194 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from mytk.videocapture import (
+    CapturedFrame,
+    FrameRingBuffer,
+    VideoCaptureThread,
+    frame_histogram,
+)
+
+
+class FakeCapture:
+    """Stands in for cv2.VideoCapture: numbered frames, each a new array."""
+
+    def __init__(self, frame_count=None, delay=0.001):
+        self.frame_count = frame_count
+        self.delay = delay
+        self.read_count = 0
+        self.released = threading.Event()
+        self.images = []
+
+    def read(self):
+        time.sleep(self.delay)
+        if self.frame_count is not None and self.read_count >= self.frame_count:
+            return False, None
+        self.read_count += 1
+        image = np.full((4, 4, 3), self.read_count % 256, dtype=np.uint8)
+        self.images.append(image)
+        return True, image
+
+    def release(self):
+        self.released.set()
+
+
+class TestFrameRingBuffer(unittest.TestCase):
+    def test_frames_numbered_in_order(self):
+        buffer = FrameRingBuffer(capacity=3)
+        first = buffer.put("a", timestamp=1.0)
+        second = buffer.put("b")
+
+        self.assertEqual(first, CapturedFrame(1, 1.0, "a"))
+        self.assertEqual(second.frame_id, 2)
+        self.assertEqual(buffer.last_frame_id, 2)
+
+    def test_oldest_frames_dropped_when_full(self):
+        buffer = FrameRingBuffer(capacity=3)
+        for image in "abcde":
+            buffer.put(image)
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual([frame.image for frame in buffer.frames()], ["c", "d", "e"])
+
+    def test_latest_only_if_newer(self):
+        buffer = FrameRingBuffer()
+        self.assertIsNone(buffer.latest())
+
+        buffer.put("a")
+        frame = buffer.put("b")
+        self.assertEqual(buffer.latest(), frame)
+        self.assertIsNone(buffer.latest(after_id=frame.frame_id))
+
+    def test_clear_keeps_numbering(self):
+        buffer = FrameRingBuffer()
+        buffer.put("a")
+        buffer.clear()
+
+        self.assertIsNone(buffer.latest())
+        self.assertEqual(buffer.put("b").frame_id, 2)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            FrameRingBuffer(capacity=0)
+
+
+class TestFrameHistogram(unittest.TestCase):
+    def test_color_frame_in_rgb_order(self):
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        frame[..., 2] = 255  # Red, in BGR
+
+        counts = frame_histogram(frame, bins=4, step=1)
+        self.assertEqual(counts.shape, (3, 4))
+        self.assertEqual(counts[0].tolist(), [0, 0, 0, 64])
+        self.assertEqual(counts[2].tolist(), [64, 0, 0, 0])
+
+    def test_subsampled(self):
+        frame = np.zeros((8, 8), dtype=np.uint8)
+        counts = frame_histogram(frame, bins=4, step=4)
+        self.assertEqual(counts.tolist(), [[4, 0, 0, 0]])
+
+    def test_alpha_not_counted(self):
+        frame = np.zeros((2, 2, 4), dtype=np.uint8)
+        self.assertEqual(frame_histogram(frame, bins=2, step=1).shape, (3, 2))
+
+    def test_bins_span_range_of_type(self):
+        frame = np.array([[0, 16384, 32768, 65535]], dtype=np.uint16)
+        self.assertEqual(frame_histogram(frame, bins=4, step=1).tolist(), [[1, 1, 1, 1]])
+
+        frame = np.array([[0.0, 0.5, 1.0]])
+        self.assertEqual(frame_histogram(frame, bins=2, step=1).tolist(), [[1, 2]])
+
+
+class TestVideoCaptureThread(unittest.TestCase):
+    def test_frames_captured_in_background(self):
+        buffer = FrameRingBuffer(capacity=4)
+        thread = VideoCaptureThread(FakeCapture(frame_count=10), buffer)
+        thread.start()
+        deadline = time.monotonic() + 2
+        while thread.captured_count < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+
+        self.assertEqual(thread.captured_count, 10)
+        self.assertEqual(buffer.last_frame_id, 10)
+        self.assertEqual(len(buffer), 4)  # Bounded
+        self.assertGreater(thread.failed_count, 0)  # Reads after the last frame
+
+    def test_frames_stored_as_read(self):
+        buffer = FrameRingBuffer(capacity=4)
+        capture = FakeCapture(frame_count=3)
+        thread = VideoCaptureThread(capture, buffer)
+        thread.start()
+        deadline = time.monotonic() + 2
+        while thread.captured_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+
+        self.assertEqual([int(frame.image[0, 0, 0]) for frame in buffer.frames()], [1, 2, 3])
+        for frame, image in zip(buffer.frames(), capture.images, strict=True):
+            self.assertIs(frame.image, image)  # Not copied
+
+    def test_stop_releases_capture(self):
+        capture = FakeCapture()
+        thread = VideoCaptureThread(capture, FrameRingBuffer())
+        thread.start()
+        self.assertTrue(thread.is_running)
+
+        self.assertTrue(thread.stop())
+        self.assertTrue(capture.released.is_set())
+        self.assertFalse(thread.is_running)
+
+    def test_listeners_see_every_frame(self):
+        buffer = FrameRingBuffer(capacity=2)
+        thread = VideoCaptureThread(FakeCapture(frame_count=6), buffer)
+        seen = []
+        thread.add_frame_listener(seen.append)
+        thread.start()
+        deadline = time.monotonic() + 2
+        while thread.captured_count < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+
+        self.assertEqual([frame.frame_id for frame in seen], [1, 2, 3, 4, 5, 6])
+        thread.remove_frame_listener(seen.append)
+        self.assertEqual(thread._listeners, [])
+
+    def test_listener_error_does_not_stop_capture(self):
+        buffer = FrameRingBuffer(capacity=2)
+        thread = VideoCaptureThread(FakeCapture(frame_count=5), buffer)
+
+        def fails(frame):
+            raise ValueError("Bad listener")
+
+        thread.add_frame_listener(fails)
+        with contextlib.redirect_stdout(io.StringIO()):
+            thread.start()
+            deadline = time.monotonic() + 2
+            while thread.captured_count < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            thread.stop()
+
+        self.assertEqual(thread.captured_count, 5)
+        self.assertEqual(thread.listener_error_count, 5)
+        self.assertIsInstance(thread.last_listener_error, ValueError)
+
+    def test_timestamps_increase(self):
+        buffer = FrameRingBuffer(capacity=8)
+        thread = VideoCaptureThread(FakeCapture(frame_count=5), buffer)
+        thread.start()
+        deadline = time.monotonic() + 2
+        while thread.captured_count < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+
+        timestamps = [frame.timestamp for frame in buffer.frames()]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from mytk.videocapture import CapturedFrame
+from mytk.videoprocessing import FramePipeline, ProcessedFrame, run_stages
+
+
+def double(image):
+    return image * 2
+
+
+def mean_value(image):
+    return image, {"mean": float(image.mean())}
+
+
+def captured(frame_id, value=None):
+    if value is None:
+        value = frame_id
+    return CapturedFrame(frame_id, float(frame_id), np.full((2, 2), value))
+
+
+class TestFramePipeline(unittest.TestCase):
+    def wait_for(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertTrue(condition())
+
+    def test_run_stages_merges_metadata(self):
+        image, metadata, stage_times = run_stages([double, mean_value], np.ones((2, 2)))
+
+        self.assertEqual(image.tolist(), [[2, 2], [2, 2]])
+        self.assertEqual(metadata, {"mean": 2.0})
+        self.assertEqual(len(stage_times), 2)
+
+    def test_frames_delivered_with_metadata(self):
+        pipeline = FramePipeline([double, mean_value])
+        self.addCleanup(pipeline.close)
+        delivered = []
+        pipeline.add_subscriber(delivered.append)
+
+        self.assertTrue(pipeline.submit(captured(7, value=3)))
+        self.wait_for(lambda: len(delivered) == 1)
+
+        processed = delivered[0]
+        self.assertIsInstance(processed, ProcessedFrame)
+        self.assertEqual(processed.frame_id, 7)
+        self.assertEqual(processed.timestamp, 7.0)
+        self.assertEqual(processed.metadata["mean"], 6.0)
+        self.assertEqual(len(processed.metadata["stage_times_ms"]), 2)
+        self.assertIs(pipeline.latest(), processed)
+        self.assertIsNone(pipeline.latest(after_id=7))
+
+    def test_delivered_in_order(self):
+        def slow_for_early_frames(image):
+            time.sleep(0.05 if image[0, 0] < 3 else 0)
+            return image
+
+        pipeline = FramePipeline([slow_for_early_frames], max_in_flight=6)
+        self.addCleanup(pipeline.close)
+        delivered = []
+        pipeline.add_subscriber(lambda processed: delivered.append(processed.frame_id))
+        for frame_id in range(1, 7):
+            pipeline.submit(captured(frame_id))
+        self.wait_for(lambda: len(delivered) == 6)
+
+        self.assertEqual(delivered, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(pipeline.in_flight, 0)
+
+    def test_frames_beyond_max_in_flight_dropped(self):
+        release = threading.Event()
+
+        def blocked(image):
+            release.wait(5)
+            return image
+
+        pipeline = FramePipeline([blocked], max_in_flight=2)
+        self.addCleanup(pipeline.close)
+        results = [pipeline.submit(captured(frame_id)) for frame_id in range(1, 5)]
+        release.set()
+        self.wait_for(lambda: pipeline.processed_count == 2)
+
+        self.assertEqual(results, [True, True, False, False])
+        self.assertEqual(pipeline.stats()["dropped"], 2)
+        self.assertTrue(pipeline.submit(captured(5)))
+
+    def test_stage_error_skips_frame_only(self):
+        def fails_on_two(image):
+            if image[0, 0] == 2:
+                raise ValueError("Bad frame")
+            return image
+
+        pipeline = FramePipeline([fails_on_two])
+        self.addCleanup(pipeline.close)
+        delivered = []
+        pipeline.add_subscriber(lambda processed: delivered.append(processed.frame_id))
+        for frame_id in (1, 2, 3):
+            pipeline.submit(captured(frame_id))
+        self.wait_for(lambda: len(delivered) == 2)
+
+        self.assertEqual(delivered, [1, 3])
+        self.assertEqual(pipeline.error_count, 1)
+        self.assertIsInstance(pipeline.last_error, ValueError)
+
+    def test_stage_times_in_stats(self):
+        pipeline = FramePipeline([double, mean_value])
+        self.addCleanup(pipeline.close)
+        for frame_id in range(1, 4):
+            pipeline.submit(captured(frame_id))
+        self.wait_for(lambda: pipeline.processed_count == 3)
+
+        stats = pipeline.stats()
+        self.assertEqual(stats["submitted"], 3)
+        self.assertEqual([stage["name"] for stage in stats["stages"]], ["double", "mean_value"])
+        self.assertEqual(set(stats["stages"][0]["time_ms"]), {"p50", "p95", "p99", "max"})
+
+    def test_process_pool(self):
+        pipeline = FramePipeline([double], use_process=True, max_workers=1)
+        self.addCleanup(pipeline.close)
+        delivered = []
+        pipeline.add_subscriber(delivered.append)
+        pipeline.submit(captured(1, value=4))
+        self.wait_for(lambda: len(delivered) == 1, timeout=30)
+
+        self.assertEqual(delivered[0].image.tolist(), [[8, 8], [8, 8]])
+
+    def test_slow_subscriber_does_not_block_submit(self):
+        entered = threading.Event()
+        release = threading.Event()
+        delivered = []
+
+        def slow_subscriber(processed):
+            entered.set()
+            release.wait(2)
+            delivered.append(processed.frame_id)
+
+        pipeline = FramePipeline([double], max_in_flight=4)
+        self.addCleanup(pipeline.close)
+        pipeline.add_subscriber(slow_subscriber)
+        pipeline.submit(captured(1))
+        self.assertTrue(entered.wait(2))
+
+        start = time.monotonic()
+        self.assertTrue(pipeline.submit(captured(2)))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(pipeline.stats()["submitted"], 2)
+        release.set()
+        self.wait_for(lambda: len(delivered) == 2)
+
+        self.assertEqual(delivered, [1, 2])
+        self.wait_for(lambda: pipeline.in_flight == 0)
+
+    def test_frame_refused_by_executor_rolled_back(self):
+        pipeline = FramePipeline([double])
+        self.addCleanup(pipeline.close)
+        delivered = []
+        pipeline.add_subscriber(lambda processed: delivered.append(processed.frame_id))
+        pipeline._executor.shutdown()  # Refuses new work, as if closed during submit
+
+        self.assertFalse(pipeline.submit(captured(1)))
+        self.assertEqual(pipeline.in_flight, 0)
+        self.assertEqual(pipeline.stats()["submitted"], 0)
+        self.assertEqual(pipeline.stats()["dropped"], 1)
+        self.assertEqual(pipeline._next_sequence, 0)
+
+    def test_closed_pipeline_drops_frames(self):
+        pipeline = FramePipeline([double])
+        pipeline.close()
+
+        self.assertFalse(pipeline.submit(captured(1)))
+
+    def test_invalid_max_in_flight(self):
+        with self.assertRaises(ValueError):
+            FramePipeline([double], max_in_flight=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from mytk.videorecorder import MemmapVideoSink, VideoRecorder, measure_fps
+
+
+class SlowSink:
+    """Keeps the frames written, after waiting for `release` to be set."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.frames = []
+        self.closed = False
+
+    def write(self, frame, timestamp):
+        self.release.wait(2)
+        self.frames.append(int(frame[0, 0]))
+
+    def close(self):
+        self.closed = True
+
+
+class FailingSink(SlowSink):
+    def write(self, frame, timestamp):
+        raise OSError("Disk full")
+
+
+class RecorderWithSink(VideoRecorder):
+    def __init__(self, sink, **kwargs):
+        super().__init__("movie.avi", fps=10, **kwargs)
+        self.sink = sink
+
+    def create_sink(self):
+        return self.sink
+
+
+def frame(value, shape=(2, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class TestVideoRecorder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_measure_fps(self):
+        self.assertAlmostEqual(measure_fps([0.0, 0.1, 0.2, 0.3]), 10.0)
+        self.assertEqual(measure_fps([1.0], default=20.0), 20.0)
+        self.assertEqual(measure_fps([1.0, 1.0], default=20.0), 20.0)
+
+    def test_codec_from_extension(self):
+        self.assertEqual(VideoRecorder("movie.mp4").codec, "mp4v")
+        self.assertEqual(VideoRecorder("movie.avi").codec, "MJPG")
+        self.assertEqual(VideoRecorder("movie.avi", codec="XVID").codec, "XVID")
+        self.assertTrue(VideoRecorder("frames.npy").is_raw)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            VideoRecorder("movie.avi", full_policy="wait")
+
+    def test_raw_recording_to_memmap(self):
+        filepath = os.path.join(self.directory.name, "frames.npy")
+        recorder = VideoRecorder(filepath)
+        recorder.start()
+        count = MemmapVideoSink.chunk_frames + 10  # The file grows once
+        for i in range(count):
+            self.assertTrue(recorder.write(frame(i % 256, (4, 5, 3)), timestamp=i / 50))
+        self.assertTrue(recorder.stop(timeout=5))
+
+        frames = np.load(filepath, mmap_mode="r")
+        self.assertEqual(frames.shape, (count, 4, 5, 3))
+        self.assertEqual([int(f[0, 0, 0]) for f in frames], [i % 256 for i in range(count)])
+        timestamps = np.load(os.path.join(self.directory.name, "frames.timestamps.npy"))
+        self.assertEqual(len(timestamps), count)
+        self.assertAlmostEqual(recorder.stats()["fps"], 50.0)
+        self.assertEqual(recorder.stats()["written"], count)
+
+    def test_raw_recording_rejects_other_shapes(self):
+        filepath = os.path.join(self.directory.name, "frames.npy")
+        recorder = VideoRecorder(filepath, fps=10)
+        recorder.start()
+        recorder.write(frame(1))
+        recorder.write(frame(2, (3, 3)))
+        recorder.stop(timeout=5)
+
+        self.assertIsInstance(recorder.error, ValueError)
+        self.assertEqual(np.load(filepath).shape, (1, 2, 3))
+
+    def test_fps_measured_when_stopped_early(self):
+        filepath = os.path.join(self.directory.name, "frames.npy")
+        recorder = VideoRecorder(filepath)
+        recorder.start()
+        for i in range(5):
+            recorder.write(frame(i), timestamp=i / 25)
+        recorder.stop(timeout=5)
+
+        self.assertAlmostEqual(recorder.fps, 25.0)
+        self.assertEqual(np.load(filepath).shape[0], 5)
+
+    def test_block_policy_writes_every_frame(self):
+        sink = SlowSink()
+        sink.release.set()
+        recorder = RecorderWithSink(sink, queue_size=2, full_policy="block")
+        recorder.start()
+        for i in range(20):
+            recorder.write(frame(i))
+        recorder.stop(timeout=5)
+
+        self.assertEqual(sink.frames, list(range(20)))
+        self.assertTrue(sink.closed)
+
+    def test_drop_policy_drops_when_full(self):
+        sink = SlowSink()
+        recorder = RecorderWithSink(sink, queue_size=2, full_policy="drop")
+        recorder.start()
+        results = [recorder.write(frame(i)) for i in range(10)]
+        sink.release.set()
+        recorder.stop(timeout=5)
+
+        self.assertIn(False, results)
+        stats = recorder.stats()
+        self.assertEqual(stats["dropped"], results.count(False))
+        self.assertEqual(stats["written"], stats["queued"])
+        self.assertEqual(sink.frames, sorted(sink.frames))
+
+    def test_spill_policy_keeps_every_frame_in_order(self):
+        sink = SlowSink()
+        recorder = RecorderWithSink(
+            sink, queue_size=2, full_policy="spill", spill_directory=self.directory.name
+        )
+        recorder.start()
+        for i in range(10):
+            self.assertTrue(recorder.write(frame(i)))
+        self.assertGreater(recorder.stats()["spilled"], 0)
+        sink.release.set()
+        recorder.stop(timeout=5)
+
+        self.assertEqual(sink.frames, list(range(10)))
+        self.assertEqual(recorder.stats()["pending"], 0)
+
+    def test_spilled_frames_written_at_full_speed(self):
+        sink = SlowSink()
+        recorder = RecorderWithSink(
+            sink, queue_size=2, full_policy="spill", spill_directory=self.directory.name
+        )
+        recorder.start()
+        for i in range(200):
+            recorder.write(frame(i % 256))
+        self.assertGreater(recorder.stats()["spilled"], 150)
+        sink.release.set()
+
+        # Without waiting for the empty queue, 200 frames take a few ms, not
+        # 200 poll intervals
+        self.assertTrue(recorder.stop(timeout=2))
+        self.assertEqual(recorder.stats()["written"], 200)
+
+    def test_sink_error_drops_later_frames(self):
+        recorder = RecorderWithSink(FailingSink())
+        recorder.start()
+        recorder.write(frame(1))
+        recorder.stop(timeout=5)
+
+        self.assertEqual(recorder.stats()["error"], "Disk full")
+        self.assertFalse(recorder.write(frame(2)))
+
+    def test_frames_accepted_while_stopping_are_written(self):
+        sink = SlowSink()
+        sink.release.set()
+        recorder = RecorderWithSink(sink, queue_size=4, full_policy="drop")
+        recorder.start()
+        writing = threading.Event()
+
+        def producer():
+            i = 0
+            while recorder.write(frame(i % 256)) or recorder.is_recording:
+                writing.set()
+                i += 1
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        self.assertTrue(writing.wait(2))
+        self.assertTrue(recorder.stop(timeout=5))
+        thread.join(timeout=5)
+
+        stats = recorder.stats()
+        self.assertEqual(stats["written"], stats["queued"])
+        self.assertEqual(len(sink.frames), stats["written"])
+
+    def test_write_after_stop_is_dropped(self):
+        recorder = RecorderWithSink(SlowSink())
+        recorder.start()
+        recorder.stop(timeout=5)
+
+        self.assertFalse(recorder.is_recording)
+        self.assertFalse(recorder.write(frame(1)))
+        self.assertEqual(recorder.stats()["dropped"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+"""videocapture.py — Frames read from a camera on a background thread.
+
+`VideoCaptureThread` reads the frames of an OpenCV ``VideoCapture`` as fast as
+the camera delivers them, and stores them in a `FrameRingBuffer`: the Tk
+thread never waits for the camera, and the rate of the display does not limit
+the rate of the capture. The display takes the newest frame from the buffer
+when it refreshes, and the frames captured in between are dropped::
+
+    buffer = FrameRingBuffer(capacity=4)
+    thread = VideoCaptureThread(cv2.VideoCapture(0), buffer)
+    thread.start()
+    ...
+    frame = buffer.latest()     # CapturedFrame(frame_id, timestamp, image)
+
+Used by `VideoView`, which also counts the frames captured, displayed and
+dropped (see `VideoView.frame_stats`).
+"""
+
+import collections
+import threading
+import time
+
+CapturedFrame = collections.namedtuple(
+    "CapturedFrame", ["frame_id", "timestamp", "image"]
+)
+CapturedFrame.__doc__ = """A frame of a `FrameRingBuffer`.
+
+Attributes:
+    frame_id (int): Number of the frame, from 1, in the order of capture.
+    timestamp (float): Time of capture, from `time.monotonic`.
+    image (numpy.ndarray): The frame, as read from the camera.
+"""
+
+
+def frame_histogram(frame, bins=32, step=4):
+    """Return the histogram of each channel of a frame, from a subsample.
+
+    Only one pixel in `step` is counted, in each direction. The values of an
+    8- or 16-bit channel are counted with ``numpy.bincount`` and then summed
+    into `bins`: for a live display, the histogram of a 1080p frame costs
+    about a millisecond.
+
+    Args:
+        frame (numpy.ndarray): An OpenCV frame: grayscale, BGR or BGRA, of
+            integers, or of floats between 0 and 1.
+        bins (int): Number of bins, spanning the range of the type of the
+            frame (at most 256 for an 8-bit frame).
+        step (int): Subsampling step, in pixels.
+
+    Returns:
+        numpy.ndarray: Counts of shape (channels, bins), in RGB order for a
+        color frame (the alpha channel is not counted).
+    """
+    import numpy
+
+    sample = frame[::step, ::step]
+    if sample.ndim == 2:
+        sample = sample[..., numpy.newaxis]
+    elif sample.shape[2] >= 3:
+        sample = sample[..., 2::-1]  # BGR(A) to RGB
+    channels = sample.shape[2]
+
+    if numpy.issubdtype(sample.dtype, numpy.integer) and sample.itemsize <= 2:
+        info = numpy.iinfo(sample.dtype)
+        value_count = int(info.max) - int(info.min) + 1
+        bin_starts = (numpy.arange(bins) * value_count + bins - 1) // bins
+        rows = []
+        for channel in range(channels):
+            values = sample[..., channel].ravel()
+            if info.min < 0:
+                values = values.astype(numpy.int32) - int(info.min)
+            counts = numpy.bincount(values, minlength=value_count)
+            rows.append(numpy.add.reduceat(counts, bin_starts))
+        return numpy.stack(rows)
+
+    if numpy.issubdtype(sample.dtype, numpy.integer):
+        sample = sample / numpy.iinfo(sample.dtype).max
+    indices = numpy.clip((sample * bins).astype(numpy.int64), 0, bins - 1)
+    indices += numpy.arange(channels) * bins  # One range of bins per channel
+    counts = numpy.bincount(indices.ravel(), minlength=channels * bins)
+    return counts.reshape(channels, bins)
+
+
+class FrameRingBuffer:
+    """The most recent frames captured, in a buffer of fixed size.
+
+    When the buffer is full, adding a frame drops the oldest one, so the
+    memory used is bounded however far behind the consumers are. Safe to
+    use from several threads.
+
+    Attributes:
+        capacity (int): Maximum number of frames kept.
+    """
+
+    def __init__(self, capacity=4):
+        if capacity < 1:
+            raise ValueError("A FrameRingBuffer holds at least one frame")
+        self.capacity = capacity
+        self._frames = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._last_frame_id = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._frames)
+
+    @property
+    def last_frame_id(self):
+        """Id of the last frame added, 0 if none was."""
+        return self._last_frame_id
+
+    def put(self, image, timestamp=None):
+        """Add a frame, dropping the oldest if the buffer is full.
+
+        Args:
+            image (numpy.ndarray): The frame. It is kept as is, not copied.
+            timestamp (float, optional): Its time of capture. Defaults to now
+                (`time.monotonic`).
+
+        Returns:
+            CapturedFrame: The frame added, with its id.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._lock:
+            self._last_frame_id += 1
+            frame = CapturedFrame(self._last_frame_id, timestamp, image)
+            self._frames.append(frame)
+        return frame
+
+    def latest(self, after_id=0):
+        """Return the newest frame, or None if it is not newer than `after_id`.
+
+        Args:
+            after_id (int): Id of the last frame the caller already has.
+
+        Returns:
+            CapturedFrame | None: The newest frame, if its id is greater than
+            `after_id`.
+        """
+        with self._lock:
+            if self._frames and self._frames[-1].frame_id > after_id:
+                return self._frames[-1]
+        return None
+
+    def frames(self):
+        """Return the frames in the buffer, oldest first."""
+        with self._lock:
+            return list(self._frames)
+
+    def clear(self):
+        """Remove every frame. Frame ids keep increasing."""
+        with self._lock:
+            self._frames.clear()
+
+
+class VideoCaptureThread:
+    """Reads the frames of a video capture on a thread, into a `FrameRingBuffer`.
+
+    The thread owns the capture while it runs: it reads the frames, stores
+    each in the buffer as returned, without a copy (``VideoCapture.read()``
+    allocates a new array for every frame), and releases the capture when it
+    stops.
+
+    Attributes:
+        capture: An opened ``cv2.VideoCapture``, or any object with ``read()``
+            and ``release()``; ``read()`` must return a new array each time.
+        buffer (FrameRingBuffer): Where the frames are stored.
+        captured_count (int): Number of frames read.
+        failed_count (int): Number of reads that returned no frame.
+        listener_error_count (int): Number of errors raised by the frame
+            listeners. They are printed, and the capture goes on.
+        last_listener_error (Exception | None): The last of these errors.
+    """
+
+    retry_delay = 0.01  # Time (s) to wait after a read that returned no frame
+
+    def __init__(self, capture, buffer, name="mytk-video-capture"):
+        self.capture = capture
+        self.buffer = buffer
+        self.name = name
+        self.captured_count = 0
+        self.failed_count = 0
+        self.listener_error_count = 0
+        self.last_listener_error = None
+        self._listeners = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_frame_listener(self, callback):
+        """Call `callback(frame)` on the capture thread for every frame.
+
+        The listeners see every frame captured, including those the display
+        drops, e.g. to record them. They must return quickly: the next frame
+        is read after they return.
+
+        Args:
+            callback (callable): Called with the `CapturedFrame` added to the
+                buffer. Its image must not be modified.
+        """
+        self._listeners = [*self._listeners, callback]
+
+    def remove_frame_listener(self, callback):
+        """Stop calling a callback added with `add_frame_listener`."""
+        self._listeners = [
+            listener for listener in self._listeners if listener != callback
+        ]
+
+    @property
+    def is_running(self):
+        """Whether the thread is reading frames."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start reading frames."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._read_frames, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stop reading frames, and wait for the capture to be released.
+
+        Args:
+            timeout (float): Maximum time (s) to wait for the current read to
+                finish. The capture is released by the thread in any case.
+
+        Returns:
+            bool: True if the thread has stopped.
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _read_frames(self):
+        """Capture thread: read frames until stopped, then release the capture."""
+        try:
+            while not self._stop.is_set():
+                ret, frame = self.capture.read()
+                timestamp = time.monotonic()
+                if not ret or frame is None:
+                    self.failed_count += 1
+                    self._stop.wait(self.retry_delay)
+                    continue
+                captured = self.buffer.put(frame, timestamp)
+                self.captured_count += 1
+                for listener in self._listeners:
+                    try:
+                        listener(captured)
+                    except Exception as e:
+                        self.listener_error_count += 1
+                        self.last_listener_error = e
+                        print(f"Unable to deliver frame {captured.frame_id} to {listener}:", e)
+        finally:
+            self.capture.release()
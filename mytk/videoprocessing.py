@@ -0,0 +1,279 @@
+"""videoprocessing.py — Frames processed by a chain of stages, in a worker pool.
+
+A `FramePipeline` runs every frame submitted through its stages (background
+subtraction, flat-field correction, statistics...) in a pool of threads or
+processes, several frames at a time, and delivers the results in the order
+the frames were submitted::
+
+    def flat_field(image):
+        return image / flat
+
+    def roi_mean(image):
+        return image, {"roi_mean": float(image[100:200, 100:200].mean())}
+
+    pipeline = FramePipeline([flat_field, roi_mean])
+    pipeline.add_subscriber(lambda processed: print(processed.metadata))
+    pipeline.submit(captured)       # A CapturedFrame
+    ...
+    pipeline.close()
+
+A stage is a callable taking the image (a ``numpy.ndarray``) and returning
+the processed image, or a tuple (image, dict) to add to the metadata of the
+frame. A stage must not modify the image it is given: captured frames are
+shared with the display and the recording.
+
+At most `max_in_flight` frames are processed or waiting for delivery at a
+time; frames submitted beyond that are dropped, so a pipeline slower than the
+camera never holds up the capture nor accumulates frames. The time of each
+stage is recorded, per frame in the metadata, and in aggregate in `stats`.
+
+Used by `VideoView.start_processing`.
+"""
+
+import collections
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .mainthreadprofiler import MainThreadProfiler
+
+ProcessedFrame = collections.namedtuple(
+    "ProcessedFrame", ["frame_id", "timestamp", "image", "metadata"]
+)
+ProcessedFrame.__doc__ = """A frame delivered by a `FramePipeline`.
+
+Attributes:
+    frame_id (int): Id of the frame submitted (see `CapturedFrame`).
+    timestamp (float): Its time of capture.
+    image (numpy.ndarray): The image returned by the last stage.
+    metadata (dict): The dicts returned by the stages, merged, with
+        "stage_times_ms": the time of each stage, in order.
+"""
+
+
+def run_stages(stages, image):
+    """Run an image through stages, in a worker of a `FramePipeline`.
+
+    Module-level, so that it can run in a process pool.
+
+    Returns:
+        tuple: (image, metadata, stage times in ms).
+    """
+    metadata = {}
+    stage_times = []
+    for stage in stages:
+        start = time.perf_counter()
+        result = stage(image)
+        stage_times.append((time.perf_counter() - start) * 1000)
+        if isinstance(result, tuple):
+            image, stage_metadata = result
+            metadata.update(stage_metadata)
+        else:
+            image = result
+    return image, metadata, stage_times
+
+
+class FramePipeline:
+    """Processes frames through a chain of stages in a worker pool.
+
+    Attributes:
+        stages (list[callable]): The stages, in order (see the module
+            documentation).
+        max_in_flight (int): Maximum number of frames submitted and not
+            delivered yet.
+        use_process (bool): Run the stages in processes instead of threads,
+            for pure-Python stages that hold the GIL. The stages must then be
+            picklable (module-level functions), and every frame is copied to
+            the process and back.
+        window (int): Number of frames over which the stage times are kept.
+        submitted_count (int): Frames accepted.
+        processed_count (int): Frames delivered.
+        dropped_count (int): Frames refused because `max_in_flight` frames
+            were in flight.
+        error_count (int): Frames not delivered because a stage raised.
+        last_error (Exception | None): The last error raised by a stage.
+    """
+
+    def __init__(self, stages, max_in_flight=4, use_process=False, max_workers=None, window=1000):
+        if max_in_flight < 1:
+            raise ValueError("A FramePipeline processes at least one frame at a time")
+        self.stages = list(stages)
+        self.max_in_flight = max_in_flight
+        self.use_process = use_process
+        self.window = window
+
+        self.submitted_count = 0
+        self.processed_count = 0
+        self.dropped_count = 0
+        self.error_count = 0
+        self.last_error = None
+
+        if max_workers is None:
+            max_workers = max_in_flight
+        if use_process:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="mytk-frame-pipeline"
+            )
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._delivery_lock = threading.Lock()
+        self._next_sequence = 0  # Given to the next frame submitted
+        self._next_delivery = 0  # Sequence of the next frame to deliver
+        self._done = {}  # Results waiting for the frames before them
+        self._in_flight = 0
+        self._latest = None
+        self._stage_times = [
+            collections.deque(maxlen=window) for _ in self.stages
+        ]
+        self._start_time = time.monotonic()
+
+    @property
+    def in_flight(self):
+        """Number of frames submitted and not delivered yet."""
+        return self._in_flight
+
+    def add_subscriber(self, callback):
+        """Call `callback(processed)` with every `ProcessedFrame`, in order.
+
+        Called on a worker thread, one frame at a time: it must return
+        quickly, and use `App.schedule_on_main_thread` to update widgets.
+        """
+        self._subscribers = [*self._subscribers, callback]
+
+    def remove_subscriber(self, callback):
+        """Stop calling a callback added with `add_subscriber`."""
+        self._subscribers = [
+            subscriber for subscriber in self._subscribers if subscriber != callback
+        ]
+
+    def submit(self, frame):
+        """Process a frame, unless `max_in_flight` frames already are.
+
+        Safe to call from any thread, e.g. as a listener of a
+        `VideoCaptureThread`.
+
+        Args:
+            frame (CapturedFrame): The frame. Its image is not copied.
+
+        Returns:
+            bool: False if the frame was dropped.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_in_flight or self._executor is None:
+                self.dropped_count += 1
+                return False
+            self._in_flight += 1
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            self.submitted_count += 1
+            executor = self._executor
+
+        try:
+            future = executor.submit(run_stages, self.stages, frame.image)
+        except RuntimeError:  # Closed meanwhile
+            with self._lock:
+                self.submitted_count -= 1
+                self.dropped_count += 1
+                if self._next_sequence == sequence + 1:
+                    self._next_sequence = sequence
+                    self._in_flight -= 1
+                    return False
+            # Later frames have their sequence: skip this one, in order
+            self._frame_done(sequence, frame, None)
+            return False
+        future.add_done_callback(
+            lambda future: self._frame_done(sequence, frame, future)
+        )
+        return True
+
+    def latest(self, after_id=0):
+        """Return the last frame delivered, if its id is greater than `after_id`.
+
+        Returns None otherwise.
+        """
+        latest = self._latest
+        if latest is not None and latest.frame_id > after_id:
+            return latest
+        return None
+
+    def stats(self):
+        """Return the counts of frames and the time of each stage.
+
+        Returns:
+            dict: With keys "elapsed_s", "submitted", "processed", "dropped",
+            "errors", "in_flight" and "stages": a list with, for each stage,
+            its "name" and the p50, p95, p99 and max of its time ("time_ms"),
+            over the last `window` frames.
+        """
+        stages = []
+        with self._lock:
+            for stage, samples in zip(self.stages, self._stage_times, strict=True):
+                stages.append({
+                    "name": MainThreadProfiler.callback_name(stage),
+                    "time_ms": MainThreadProfiler.percentiles(samples),
+                })
+        return {
+            "elapsed_s": time.monotonic() - self._start_time,
+            "submitted": self.submitted_count,
+            "processed": self.processed_count,
+            "dropped": self.dropped_count,
+            "errors": self.error_count,
+            "in_flight": self._in_flight,
+            "stages": stages,
+        }
+
+    def close(self, wait=True):
+        """Stop accepting frames.
+
+        The frames in flight are still delivered if `wait` is True, and
+        discarded otherwise.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _frame_done(self, sequence, frame, future):
+        """Worker: keep the result, and deliver those now in order.
+
+        `future` is None for a frame that could not be submitted.
+        """
+        with self._delivery_lock:  # Batches of frames are delivered in order
+            with self._lock:
+                self._done[sequence] = (frame, future)
+                ready = []
+                while self._next_delivery in self._done:
+                    ready.append(self._done.pop(self._next_delivery))
+                    self._next_delivery += 1
+
+                delivered = []
+                for frame, future in ready:
+                    if future is None or future.cancelled():
+                        continue
+                    error = future.exception()
+                    if error is not None:
+                        self.error_count += 1
+                        self.last_error = error
+                        continue
+                    image, metadata, stage_times = future.result()
+                    for samples, stage_time in zip(self._stage_times, stage_times, strict=True):
+                        samples.append(stage_time)
+                    metadata["stage_times_ms"] = stage_times
+                    delivered.append(
+                        ProcessedFrame(frame.frame_id, frame.timestamp, image, metadata)
+                    )
+
+            # Outside the lock, so that a slow subscriber does not hold up submit
+            for processed in delivered:
+                self._latest = processed
+                self.processed_count += 1
+                for subscriber in self._subscribers:
+                    try:
+                        subscriber(processed)
+                    except Exception as e:
+                        print(f"Unable to deliver frame {processed.frame_id} to {subscriber}:", e)
+
+            with self._lock:
+                self._in_flight -= len(ready)
@@ -0,0 +1,484 @@
+"""videorecorder.py — Video recording on a writer thread.
+
+`VideoRecorder` receives frames from the capture (or from any thread) in a
+bounded queue, and writes them on its own thread, so encoding and disk
+stalls never hold up the capture or the display::
+
+    recorder = VideoRecorder("movie.mp4", codec="mp4v")
+    recorder.start()
+    recorder.write(frame, timestamp)    # For each frame
+    recorder.stop()
+
+Frames are written with OpenCV's ``VideoWriter``, with any codec and container
+it supports, at the frame rate measured from the timestamps of the first
+frames (unless `fps` is given). A file ending in ``.npy`` is recorded raw
+instead: the frames are copied, without compression, into a memory-mapped
+NumPy array, for lossless acquisition at the speed of the disk, and their
+timestamps are saved next to it (see `MemmapVideoSink`).
+
+When the queue is full, because the disk or the encoder cannot keep up, the
+`full_policy` decides: "block" waits for room (the capture slows down, but
+no frame is lost), "drop" discards the frame, and "spill" writes it to a
+temporary file, from which it is written later, in order.
+
+Used by `VideoView.start_streaming`.
+"""
+
+import os
+import queue
+import struct
+import tempfile
+import threading
+import time
+
+FULL_POLICIES = ("block", "drop", "spill")
+
+
+def measure_fps(timestamps, default=20.0):
+    """Return the frame rate of frames captured at the given times.
+
+    Args:
+        timestamps (list[float]): Times of capture (s), in order.
+        default (float): Rate returned if it cannot be measured (fewer than
+            two frames, or all at the same time).
+
+    Returns:
+        float: Frames per second.
+    """
+    if len(timestamps) < 2 or timestamps[-1] <= timestamps[0]:
+        return default
+    return (len(timestamps) - 1) / (timestamps[-1] - timestamps[0])
+
+
+class OpenCVVideoSink:
+    """Writes frames to a video file with ``cv2.VideoWriter``.
+
+    The file is opened with the size of the first frame. The container is
+    chosen by OpenCV from the extension of the file.
+
+    Attributes:
+        filepath (str): The video file.
+        codec (str): FourCC of the codec, e.g. "MJPG", "mp4v", "XVID" or "I420".
+        fps (float): Frame rate written in the file.
+    """
+
+    def __init__(self, filepath, codec, fps):
+        if len(codec) != 4:
+            raise ValueError(f"A codec is a four-character code, not {codec!r}")
+        self.filepath = filepath
+        self.codec = codec
+        self.fps = fps
+        self._writer = None
+
+    def write(self, frame, timestamp):
+        """Write a frame, opening the file with the size of the first frame."""
+        if self._writer is None:
+            import cv2
+
+            height, width = frame.shape[:2]
+            is_color = frame.ndim == 3 and frame.shape[2] > 1
+            self._writer = cv2.VideoWriter(
+                self.filepath, cv2.VideoWriter_fourcc(*self.codec), self.fps,
+                (width, height), is_color,
+            )
+            if not self._writer.isOpened():
+                self._writer = None
+                raise OSError(
+                    f"OpenCV cannot write {self.filepath} with codec {self.codec}"
+                )
+        self._writer.write(frame)
+
+    def close(self):
+        """Complete the file."""
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+
+class MemmapVideoSink:
+    """Writes raw frames into a memory-mapped ``.npy`` file.
+
+    The file holds a single array of shape (frames, height, width[, channels]),
+    readable with ``numpy.load(filepath, mmap_mode="r")``. It grows by
+    `chunk_frames` frames at a time, and is truncated to the frames written
+    when closed. The timestamps of the frames are saved in
+    ``<name>.timestamps.npy``.
+
+    Attributes:
+        filepath (str): The ``.npy`` file.
+        frame_count (int): Number of frames written.
+    """
+
+    chunk_frames = 256
+    header_size = 128  # Bytes reserved for the .npy header, rewritten on close
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.frame_count = 0
+        self.timestamps = []
+        self._frames = None
+        self._file = None
+        self._frame_shape = None
+        self._dtype = None
+
+    @property
+    def timestamps_filepath(self):
+        """File where the timestamps of the frames are saved."""
+        root, _ = os.path.splitext(self.filepath)
+        return root + ".timestamps.npy"
+
+    def write(self, frame, timestamp):
+        """Write a frame, which must have the shape and type of the first one.
+
+        Raises:
+            ValueError: If it does not.
+        """
+        if self._file is None:
+            self._frame_shape = frame.shape
+            self._dtype = frame.dtype
+            self._file = open(self.filepath, "w+b")  # noqa: SIM115
+            self._file.write(self._header(0))
+        elif frame.shape != self._frame_shape or frame.dtype != self._dtype:
+            raise ValueError(
+                f"Frame of shape {frame.shape} and type {frame.dtype} in a "
+                f"recording of {self._frame_shape} {self._dtype} frames"
+            )
+
+        if self._frames is None or self.frame_count == len(self._frames):
+            self._grow()
+        self._frames[self.frame_count] = frame
+        self.frame_count += 1
+        self.timestamps.append(timestamp)
+
+    def close(self):
+        """Truncate the file to the frames written, and save their timestamps."""
+        if self._file is None:
+            return
+        import numpy
+
+        self._unmap()
+        frame_bytes = int(numpy.prod(self._frame_shape)) * self._dtype.itemsize
+        self._file.truncate(self.header_size + self.frame_count * frame_bytes)
+        self._file.seek(0)
+        self._file.write(self._header(self.frame_count))
+        self._file.close()
+        self._file = None
+        numpy.save(self.timestamps_filepath, numpy.array(self.timestamps))
+
+    def _grow(self):
+        """Map `chunk_frames` more frames at the end of the file."""
+        import numpy
+
+        capacity = self.chunk_frames
+        if self._frames is not None:
+            capacity += len(self._frames)
+            self._unmap()  # Windows does not resize a file that is mapped
+        frame_bytes = int(numpy.prod(self._frame_shape)) * self._dtype.itemsize
+        self._file.truncate(self.header_size + capacity * frame_bytes)
+        self._frames = numpy.memmap(
+            self._file, dtype=self._dtype, mode="r+", offset=self.header_size,
+            shape=(capacity, *self._frame_shape),
+        )
+
+    def _unmap(self):
+        """Flush the frames mapped, and release the mapping of the file."""
+        frames, self._frames = self._frames, None
+        if frames is not None:
+            frames.flush()
+            frames._mmap.close()
+
+    def _header(self, frame_count):
+        """The .npy header (version 1.0) for `frame_count` frames.
+
+        It is padded to `header_size` bytes, so it can be rewritten in place.
+        """
+        import numpy
+
+        description = repr({
+            "descr": numpy.lib.format.dtype_to_descr(self._dtype),
+            "fortran_order": False,
+            "shape": (frame_count, *self._frame_shape),
+        })
+        prefix = b"\x93NUMPY\x01\x00"
+        length = self.header_size - len(prefix) - 2
+        text = description.encode("latin1").ljust(length - 1) + b"\n"
+        if len(text) > length:
+            raise ValueError(f"Frames of shape {self._frame_shape} are not supported")
+        return prefix + struct.pack("<H", length) + text
+
+
+class _FrameSpill:
+    """Frames written to a temporary file, to be read back in order."""
+
+    _timestamp = struct.Struct("<d")
+
+    def __init__(self, directory=None):
+        self._file = tempfile.TemporaryFile(dir=directory)  # noqa: SIM115
+        self._read_offset = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def push(self, frame, timestamp):
+        import numpy
+
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(self._timestamp.pack(timestamp))
+        numpy.lib.format.write_array(self._file, frame, allow_pickle=False)
+        self._count += 1
+
+    def pop(self):
+        import numpy
+
+        self._file.seek(self._read_offset)
+        (timestamp,) = self._timestamp.unpack(self._file.read(self._timestamp.size))
+        frame = numpy.lib.format.read_array(self._file, allow_pickle=False)
+        self._count -= 1
+        if self._count == 0:
+            self._file.truncate(0)
+            self._read_offset = 0
+        else:
+            self._read_offset = self._file.tell()
+        return frame, timestamp
+
+    def close(self):
+        self._file.close()
+
+
+class VideoRecorder:
+    """Records frames to a file on a writer thread, through a bounded queue.
+
+    Attributes:
+        filepath (str): The file recorded. A ``.npy`` file is recorded raw
+            (see `MemmapVideoSink`), any other with OpenCV.
+        codec (str): FourCC of the OpenCV codec. Defaults to "mp4v" for
+            ``.mp4``, ``.m4v`` and ``.mov`` files, and "MJPG" otherwise.
+        fps (float | None): Frame rate written in the file. If None, it is
+            measured from the timestamps of the first `fps_sample` frames.
+        queue_size (int): Maximum number of frames waiting to be written.
+        full_policy (str): What `write` does when the queue is full: "block",
+            "drop" or "spill" (see the module documentation).
+        spill_directory (str | None): Where the "spill" policy writes its
+            temporary file. Defaults to the system's temporary directory.
+        error (Exception | None): The error that stopped the writing, if any.
+            Frames written after it are dropped.
+    """
+
+    fps_sample = 30  # Frames used to measure the frame rate
+    poll_interval = 0.05  # Time (s) the writer thread waits for a frame before checking for the end
+
+    def __init__(
+        self, filepath, codec=None, fps=None, queue_size=64, full_policy="block",
+        spill_directory=None,
+    ):
+        if full_policy not in FULL_POLICIES:
+            raise ValueError(
+                f"Unknown full_policy {full_policy!r}, use one of {FULL_POLICIES}"
+            )
+        if codec is None:
+            extension = os.path.splitext(filepath)[1].lower()
+            codec = "mp4v" if extension in (".mp4", ".m4v", ".mov") else "MJPG"
+        self.filepath = filepath
+        self.codec = codec
+        self.fps = fps
+        self.queue_size = queue_size
+        self.full_policy = full_policy
+        self.spill_directory = spill_directory
+        self.error = None
+
+        self.queued_count = 0
+        self.written_count = 0
+        self.dropped_count = 0
+        self.spilled_count = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._spill = None
+        self._spill_lock = threading.Lock()
+        self._stop_lock = threading.Lock()  # No frame is queued once stopping
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def is_raw(self):
+        """Whether the frames are recorded raw, in a ``.npy`` file."""
+        return self.filepath.lower().endswith(".npy")
+
+    @property
+    def is_recording(self):
+        """Whether frames are accepted (between `start` and `stop`)."""
+        return self._thread is not None and not self._stopping.is_set()
+
+    def start(self):
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        if self.full_policy == "spill":
+            self._spill = _FrameSpill(self.spill_directory)
+        # Not a daemon: the file is completed even if the app quits meanwhile
+        self._thread = threading.Thread(target=self._write_frames, name="mytk-video-writer")
+        self._thread.start()
+
+    def write(self, frame, timestamp=None):
+        """Queue a frame to be written.
+
+        The frame is not copied: it must not be modified afterwards. Safe to
+        call from any thread, but from one thread at a time, to keep the
+        frames in order.
+
+        Args:
+            frame (numpy.ndarray): The frame (BGR or grayscale for OpenCV).
+            timestamp (float, optional): Its time of capture
+                (`time.monotonic`). Defaults to now.
+
+        Returns:
+            bool: False if the frame was dropped.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._stop_lock:
+            # Under the lock: the writer thread must not end in between
+            if not self.is_recording or self.error is not None:
+                self.dropped_count += 1
+                return False
+            return self._enqueue((frame, timestamp))
+
+    def _enqueue(self, item):
+        """Queue a frame and its timestamp, according to `full_policy`."""
+        if self.full_policy == "block":
+            self._queue.put(item)
+        elif self.full_policy == "drop":
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped_count += 1
+                return False
+        else:
+            with self._spill_lock:
+                # Once frames are spilled, the next ones are too, until the
+                # writer has read them back: the order is kept.
+                if len(self._spill) > 0:
+                    self._spill.push(*item)
+                    self.spilled_count += 1
+                else:
+                    try:
+                        self._queue.put_nowait(item)
+                    except queue.Full:
+                        self._spill.push(*item)
+                        self.spilled_count += 1
+        self.queued_count += 1
+        return True
+
+    def stop(self, wait=True, timeout=None):
+        """Stop accepting frames; the frames queued are still written.
+
+        Args:
+            wait (bool): Wait for the file to be complete.
+            timeout (float, optional): Maximum time (s) to wait.
+
+        Returns:
+            bool: True if the writer thread has finished.
+        """
+        with self._stop_lock:
+            self._stopping.set()
+        if self._thread is None:
+            return True
+        if wait:
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def stats(self):
+        """Return the counts of frames, and the state of the recording.
+
+        Returns:
+            dict: With keys "queued" (frames accepted), "written", "pending"
+            (accepted, not written yet), "dropped", "spilled" (frames that
+            went through the spill file), "fps" (the rate of the file, None
+            until known) and "error" (str, or None).
+        """
+        return {
+            "queued": self.queued_count,
+            "written": self.written_count,
+            "pending": self.queued_count - self.written_count,
+            "dropped": self.dropped_count,
+            "spilled": self.spilled_count,
+            "fps": self.fps,
+            "error": None if self.error is None else str(self.error),
+        }
+
+    def create_sink(self):
+        """Return the object writing the frames.
+
+        It has ``write(frame, timestamp)`` and ``close()``. `fps` is known
+        when this is called.
+        """
+        if self.is_raw:
+            return MemmapVideoSink(self.filepath)
+        return OpenCVVideoSink(self.filepath, self.codec, self.fps)
+
+    def _next_frame(self):
+        """Writer thread: the next frame, from the queue or the spill file.
+
+        Returns None when stopped and everything is written.
+        """
+        while True:
+            try:
+                if self._spill is not None and len(self._spill) > 0:
+                    # Frames are waiting in the spill file: do not wait for
+                    # the queue, which stays empty while they are
+                    return self._queue.get_nowait()
+                return self._queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                pass
+            if self._spill is not None:
+                with self._spill_lock:
+                    if len(self._spill) > 0:
+                        return self._spill.pop()
+            if self._stopping.is_set() and self._queue.empty():
+                return None
+
+    def _write_frames(self):
+        """Writer thread: write the frames until stopped."""
+        sink = None
+        first_frames = []  # Held until the frame rate is measured
+        try:
+            while (item := self._next_frame()) is not None:
+                if self.error is not None:
+                    self.dropped_count += 1
+                    continue
+                try:
+                    if sink is None and self.fps is None:
+                        first_frames.append(item)
+                        if len(first_frames) < self.fps_sample:
+                            continue
+                        self.fps = measure_fps([timestamp for _, timestamp in first_frames])
+                    if sink is None:
+                        sink = self.create_sink()
+                        for frame, timestamp in first_frames or [item]:
+                            sink.write(frame, timestamp)
+                            self.written_count += 1
+                        first_frames = []
+                    else:
+                        sink.write(*item)
+                        self.written_count += 1
+                except Exception as err:
+                    self.error = err
+                    self.dropped_count += len(first_frames) or 1
+                    first_frames = []
+
+            if first_frames and self.error is None:  # Stopped before fps_sample frames
+                self.fps = measure_fps([timestamp for _, timestamp in first_frames])
+                sink = self.create_sink()
+                for frame, timestamp in first_frames:
+                    sink.write(frame, timestamp)
+                    self.written_count += 1
+        except Exception as err:
+            self.error = err
+        finally:
+            if sink is not None:
+                try:
+                    sink.close()
+                except Exception as err:
+                    self.error = self.error or err
+            if self._spill is not None:
+                self._spill.close()
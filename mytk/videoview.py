@@ -3,24 +3,56 @@ import signal
 import tkinter.ttk as ttk
 from tkinter import filedialog
 
-from .app import App
 from .base import Base
 from .button import Button
 from .modulesmanager import ModulesManager
 from .popupmenu import PopupMenu
+from .videocapture import FrameRingBuffer, VideoCaptureThread, frame_histogram
+from .videoprocessing import FramePipeline
+from .videorecorder import VideoRecorder
 
 
 class VideoView(Base):
-    """Live video capture and display widget backed by OpenCV."""
+    """Live video capture and display widget backed by OpenCV.
 
-    def __init__(self, device=0, zoom_level=3, auto_start=True):
+    Frames are read on a background thread (see `VideoCaptureThread`) into a
+    ring buffer of `buffer_size` frames; the display shows the newest one
+    `display_rate` times per second, and drops the frames captured in
+    between. `frame_stats` counts the frames captured, displayed and dropped.
+
+    Displaying an 8-bit frame allocates no full-size image: it is first
+    downscaled by `zoom_level` with OpenCV, then converted to RGB into a
+    buffer allocated once, and the image shown is updated in place (see
+    `show_frame`).
+
+    Recording (`start_streaming`) happens on a writer thread fed by the
+    capture thread, with every frame captured, not only those displayed (see
+    `VideoRecorder`).
+
+    The histogram shown in `histogram_xyplot` (a `Histogram`) is computed on
+    the capture thread, from a subsample of the raw frame (see
+    `frame_histogram`), and the plot only updates its curves.
+
+    Frames can be processed before they are displayed by a chain of stages
+    running in a worker pool (`start_processing`, see `FramePipeline`). The
+    display then shows the processed frames; the recording and the histogram
+    still use the raw frames.
+    """
+
+    def __init__(self, device=0, zoom_level=3, auto_start=True, buffer_size=4):
         super().__init__()
 
         self.device = device
         self.zoom_level = zoom_level
-        self.image = None
         self.capture = None
-        self.videowriter = None
+        self.capture_thread = None
+        self.frames = FrameRingBuffer(capacity=buffer_size)
+        self.recorder = None
+        self.pipeline = None
+
+        self.displayed_count = 0
+        self.dropped_count = 0
+        self._displayed_frame_id = 0
 
         self.abort = False
         self.auto_start = auto_start
@@ -32,11 +64,21 @@ class VideoView(Base):
         self.histogram_xyplot = None
 
         self._displayed_tkimage = None
+        self._display_image = None  # PIL image shown, a view on _display_buffers
+        self._display_buffers = None  # (scaled frame, RGB frame), reused
+        self._display_layout = None  # (size, channels) the buffers are for
         self.previous_handler = signal.signal(
             signal.SIGINT, self.signal_handler
         )
-        self.next_scheduled_update = None
-        self.next_scheduled_update_histogram = None
+        self.display_rate = 50
+        self.histogram_rate = 20
+        self.histogram_bins = 32
+        self.histogram_step = 4  # Subsampling of the frame for the histogram
+        self.display_frame_callback = None
+        self.histogram_frame_callback = None
+        self._histogram = None  # Newest counts, computed off the Tk thread
+        self._displayed_histogram = None
+        self._next_histogram_time = 0
 
     def is_environment_valid(self):
         """Check that OpenCV and Pillow are available, installing them if needed."""
@@ -97,6 +139,18 @@ class VideoView(Base):
         """Return True if video capture is currently active."""
         return self.capture is not None
 
+    @property
+    def image(self):
+        """The frame displayed, as a new PIL image, or None if there is none yet.
+
+        The image is RGB, or L for a grayscale camera.
+        """
+        if self._display_image is None:
+            return None
+        if self._display_image.mode == "RGBX":
+            return self._display_image.convert("RGB")
+        return self._display_image.copy()
+
     @property
     def startstop_button_label(self):
         """Return the appropriate label for the start/stop button."""
@@ -105,110 +159,269 @@ class VideoView(Base):
         return "Start"
 
     def start_capturing(self):
-        """Open the video device and begin reading frames."""
+        """Open the video device and begin reading frames on a background thread."""
         if not self.is_running:
             try:
                 self.capture = self.cv2.VideoCapture(self.device)
                 if self.capture.isOpened():
-                    self.update_display()
+                    self.frames.clear()
+                    self._displayed_frame_id = self.frames.last_frame_id
+                    self.displayed_count = 0
+                    self.dropped_count = 0
+                    self.capture_thread = VideoCaptureThread(self.capture, self.frames)
+                    self.capture_thread.add_frame_listener(self._frame_captured)
+                    self.capture_thread.start()
+                    self.display_frame_callback = self.add_frame_callback(
+                        self.update_display, rate=self.display_rate
+                    )
             except Exception as err:
                 print(err)
                 self.capture = None
 
     def stop_capturing(self):
-        """Release the video device and cancel scheduled display updates."""
+        """Stop the capture thread, and cancel scheduled display updates.
+
+        The capture thread releases the video device.
+        """
         if self.is_running:
-            if self.next_scheduled_update is not None:
-                App.app.root.after_cancel(self.next_scheduled_update)
-            self.capture.release()
+            if self.display_frame_callback is not None:
+                self.remove_frame_callback(self.display_frame_callback)
+            if self.histogram_frame_callback is not None:
+                # Registered on the plot, which is the widget it belongs to
+                self.histogram_xyplot.remove_frame_callback(self.histogram_frame_callback)
+            self.display_frame_callback = None
+            self.histogram_frame_callback = None
+            if self.capture_thread is not None:
+                self.capture_thread.stop()
+                self.capture_thread = None
+            else:
+                self.capture.release()
             self.capture = None
 
-    def start_streaming(self, filepath):
-        """Begin writing captured frames to a video file at the given path."""
-        width = self.get_prop_id(self.cv2.CAP_PROP_FRAME_WIDTH)
-        height = self.get_prop_id(self.cv2.CAP_PROP_FRAME_HEIGHT)
-        fourcc = self.cv2.VideoWriter_fourcc("I", "4", "2", "0")
-        self.videowriter = self.cv2.VideoWriter(
-            filepath, fourcc, 20.0, (int(width), int(height)), True
+    def frame_stats(self):
+        """Return the counts of frames since the capture started.
+
+        Returns:
+            dict: With keys "captured" (frames read from the camera),
+            "displayed", "dropped" (frames captured but replaced by a newer
+            one before they could be displayed, or refused by the processing
+            pipeline when it was busy), "failed" (reads that returned no
+            frame) and "listener_errors" (errors raised while recording,
+            processing or computing the histogram of a frame). When
+            "dropped" grows faster than "displayed", the display is falling
+            behind the camera.
+        """
+        thread = self.capture_thread
+        return {
+            "captured": thread.captured_count if thread is not None else 0,
+            "displayed": self.displayed_count,
+            "dropped": self.dropped_count,
+            "failed": thread.failed_count if thread is not None else 0,
+            "listener_errors": thread.listener_error_count if thread is not None else 0,
+        }
+
+    def start_streaming(
+        self, filepath, codec=None, fps=None, queue_size=64, full_policy="spill"
+    ):
+        """Begin recording the frames captured to a file, on a writer thread.
+
+        Args:
+            filepath (str): The video file; its extension chooses the
+                container. A ``.npy`` file is recorded raw, in a memory-mapped
+                NumPy array.
+            codec (str, optional): FourCC of the codec, e.g. "MJPG" or "mp4v".
+            fps (float, optional): Frame rate of the file. Defaults to the
+                rate measured from the capture.
+            queue_size (int): Maximum number of frames waiting to be written.
+            full_policy (str): "spill", "drop" or "block", when the queue is
+                full (see `VideoRecorder`). The frames are queued by the
+                capture thread: with "block", a stall of the disk or of the
+                encoder also stalls the capture, and the preview freezes.
+        """
+        self.stop_streaming()
+        recorder = VideoRecorder(
+            filepath, codec=codec, fps=fps, queue_size=queue_size,
+            full_policy=full_policy,
         )
+        recorder.start()
+        self.recorder = recorder
 
     def stop_streaming(self):
-        """Stop writing frames and release the video writer."""
-        if self.videowriter is not None:
-            self.videowriter.release()
-            self.videowriter = None
+        """Stop recording. The frames queued are written in the background."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.stop(wait=False)
+
+    def start_processing(self, stages, max_in_flight=4, use_process=False):
+        """Process the frames captured through a chain of stages, and display them.
+
+        The stages run in a worker pool.
+
+        Args:
+            stages (list[callable]): Callables taking a frame and returning
+                the processed frame, or (frame, dict) to add metadata (see
+                `FramePipeline`). They must not modify the frame given.
+            max_in_flight (int): Maximum number of frames processed at a time;
+                the others are dropped.
+            use_process (bool): Use a process pool instead of a thread pool.
+
+        Returns:
+            FramePipeline: The pipeline, to add subscribers to the processed
+            frames (with their metadata) and to read its `stats`.
+        """
+        self.stop_processing()
+        self.pipeline = FramePipeline(
+            stages, max_in_flight=max_in_flight, use_process=use_process
+        )
+        return self.pipeline
 
-    def update_display(self, readonly_frame=None):
-        """Read the next frame, update the display widget, and schedule the next refresh."""
-        ret = True
-        if readonly_frame is None and self.is_running:
-            ret, readonly_frame = self.capture.read()
-
-        if ret:
-            # The OpenCV documentation is clear: the returned frame from read() is read-only
-            # and must be copied to be used (I assume it can be overwritten internally)
-            # https://docs.opencv.org/3.4/d8/dfe/classcv_1_1VideoCapture.html#a473055e77dd7faa4d26d686226b292c1
-            # Without this copy, the program crashes in a few seconds
-            frame = readonly_frame.copy()
-            if self.videowriter is not None:
-                self.videowriter.write(frame)
-
-            if len(frame.shape) == 3 and frame.shape[2] == 3:
-                frame = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
-            # frame = cv.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-            # convert to PIL image
-            img = self.PILImage.fromarray(frame)
-            resized_image = img.resize(
-                (
-                    img.width // int(self.zoom_level),
-                    img.height // int(self.zoom_level),
-                ),
-                self.PILImage.NEAREST,
-            )
-            self.image = resized_image
+    def stop_processing(self):
+        """Stop processing frames; the display shows the raw frames again."""
+        pipeline, self.pipeline = self.pipeline, None
+        if pipeline is not None:
+            pipeline.close(wait=False)
 
-            # convert to Tkinter image
-            photo = self.PILImageTk.PhotoImage(image=self.image)
+    def _frame_captured(self, captured):
+        """Capture thread: record, process and compute the histogram of a frame.
 
-            # solution for bug in `PhotoImage`
-            self._displayed_tkimage = photo
+        The frame is recorded if recording, submitted to the processing
+        pipeline if there is one, and its histogram is computed if one is
+        shown and due.
+        """
+        recorder = self.recorder
+        if recorder is not None:
+            # Frames of the ring buffer are never modified: no copy needed
+            recorder.write(captured.image, captured.timestamp)
+
+        pipeline = self.pipeline
+        if pipeline is not None:
+            pipeline.submit(captured)
+
+        if self.histogram_xyplot is not None and captured.timestamp >= self._next_histogram_time:
+            self._next_histogram_time = captured.timestamp + 1 / self.histogram_rate
+            self._histogram = frame_histogram(
+                captured.image, bins=self.histogram_bins, step=self.histogram_step
+            )
 
-            # replace image in label
-            self.widget.configure(image=photo)
+    def update_display(self, readonly_frame=None):
+        """Show the newest frame captured in the display widget.
 
-            if self.next_scheduled_update_histogram is None:
-                self.update_histogram()
+        Called `display_rate` times per second by the App frame clock while
+        capturing. Does nothing if no frame was captured since the last call.
 
-            self.next_scheduled_update = App.app.root.after(
-                20, self.update_display
-            )
+        Args:
+            readonly_frame (numpy.ndarray, optional): A frame to show instead
+                of the newest frame captured. It is only read during the call.
+        """
+        frame = readonly_frame
+        if frame is None and self.is_running:
+            source = self.frames if self.pipeline is None else self.pipeline
+            captured = source.latest(after_id=self._displayed_frame_id)
+            if captured is not None:
+                frame = captured.image
+                self.dropped_count += captured.frame_id - self._displayed_frame_id - 1
+                self._displayed_frame_id = captured.frame_id
+                self.displayed_count += 1
+
+        if frame is not None:
+            # Captured frames are recorded by the capture thread; a frame
+            # given here is only ours during the call.
+            if readonly_frame is not None:
+                if self.recorder is not None:
+                    self.recorder.write(readonly_frame.copy())
+                if self.histogram_xyplot is not None:
+                    self._histogram = frame_histogram(
+                        readonly_frame, bins=self.histogram_bins, step=self.histogram_step
+                    )
+
+            self.show_frame(frame)
+
+            if self.histogram_xyplot is not None and self.histogram_frame_callback is None:
+                self.update_histogram()
+                self.histogram_frame_callback = self.histogram_xyplot.add_frame_callback(
+                    self.update_histogram, rate=self.histogram_rate
+                )
 
         if self.abort:
             self.stop_capturing()
             self.previous_handler(signal.SIGINT, 0)
 
-    def update_histogram(self):
-        """Recompute and redraw the per-channel histogram from the current image."""
-        if self.histogram_xyplot is not None:
-            self.histogram_xyplot.clear_plot()
-            values = self.image.histogram()
-            bins_per_channel = len(values) // 3
-            decimate = 8
-            self.histogram_xyplot.x = list(range(bins_per_channel // decimate))
-            self.histogram_xyplot.y.append(values[0:bins_per_channel:decimate])
-            self.histogram_xyplot.y.append(
-                values[bins_per_channel : 2 * bins_per_channel : decimate]
-            )
-            self.histogram_xyplot.y.append(
-                values[2 * bins_per_channel :: decimate]
-            )
+    def show_frame(self, frame):
+        """Show a frame in the widget, downscaled by `zoom_level`.
 
-            self.histogram_xyplot.update_plot()
+        An 8-bit frame (BGR, BGRA or grayscale, as read by OpenCV) is
+        downscaled first, with OpenCV, then converted to RGB; both steps write
+        into buffers allocated once, and the PhotoImage shown is updated in
+        place with `paste`. New buffers are only allocated when the size of
+        the frame, its number of channels or the zoom level change. Other
+        frames (e.g. 16-bit) are converted through PIL.
 
-            self.next_scheduled_update_histogram = App.app.root.after(
-                300, self.update_histogram
+        Args:
+            frame (numpy.ndarray): The frame, which is not modified.
+        """
+        zoom = max(int(self.zoom_level), 1)
+        height, width = frame.shape[:2]
+        size = (max(width // zoom, 1), max(height // zoom, 1))
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        if frame.dtype.name != "uint8" or channels not in (1, 3, 4):
+            self._show_frame_through_pil(frame, size)
+            return
+
+        if self._display_layout != (size, channels):
+            self._display_layout = (size, channels)
+            self._display_buffers = (None, None)
+
+        previous_scaled, previous_rgb = self._display_buffers
+        scaled = self.cv2.resize(
+            frame, size, dst=previous_scaled, interpolation=self.cv2.INTER_NEAREST
+        )
+        if channels == 1:
+            rgb = scaled
+        else:
+            # RGBX: the only 8-bit color layout PIL can use without a copy
+            code = self.cv2.COLOR_BGR2RGBA if channels == 3 else self.cv2.COLOR_BGRA2RGBA
+            rgb = self.cv2.cvtColor(scaled, code, dst=previous_rgb)
+
+        if scaled is not previous_scaled or rgb is not previous_rgb:
+            self._display_buffers = (scaled, rgb)
+            mode = "L" if channels == 1 else "RGBX"
+            self._display_image = self.PILImage.frombuffer(
+                mode, size, rgb, "raw", mode, 0, 1
             )
+            self._set_tkimage(self.PILImageTk.PhotoImage(image=self._display_image))
+        else:
+            self._displayed_tkimage.paste(self._display_image)
+
+    def _show_frame_through_pil(self, frame, size):
+        """Show a frame the buffers of `show_frame` cannot hold, with PIL."""
+        if len(frame.shape) == 3 and frame.shape[2] == 3:
+            frame = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
+        self._display_image = self.PILImage.fromarray(frame).resize(
+            size, self.PILImage.NEAREST
+        )
+        self._display_layout = None
+        self._display_buffers = None
+        self._set_tkimage(self.PILImageTk.PhotoImage(image=self._display_image))
+
+    def _set_tkimage(self, photo):
+        # Keep a reference: Tk does not, and the image would be deleted
+        self._displayed_tkimage = photo
+        self.widget.configure(image=photo)
+
+    def update_histogram(self):
+        """Show the newest histogram computed in the histogram plot.
+
+        Called `histogram_rate` times per second by the App frame clock while
+        capturing, only when the plot is on screen. The counts are computed
+        off the Tk thread (see `_frame_captured`); only the curves of the plot
+        are redrawn (see `Histogram.show_counts`).
+        """
+        histogram = self._histogram
+        if self.histogram_xyplot is None or histogram is None:
+            return
+        if histogram is not self._displayed_histogram:
+            self._displayed_histogram = histogram
+            self.histogram_xyplot.show_counts(histogram)
 
     def create_behaviour_popups(self):
         """Create a popup menu listing available camera devices."""
@@ -273,11 +486,14 @@ class VideoView(Base):
             self.image.save(filepath)
 
     def click_stream_button(self, event, button):
-        """Prompt for a filename and begin streaming frames to an AVI file."""
+        """Prompt for a filename and begin recording frames.
+
+        The frames are recorded to a movie, or to a raw NumPy file.
+        """
         filepath = filedialog.asksaveasfilename(
             parent=button.widget,
             title="Choose a filename for movie:",
-            filetypes=[("AVI", ".avi")],
+            filetypes=[("AVI", ".avi"), ("MP4", ".mp4"), ("Raw NumPy frames", ".npy")],
         )
         if filepath:
             self.start_streaming(filepath)